@@ -101,6 +101,1128 @@ class TestProgressTrackerPerformance:
             sys.stdout = old_stdout
 
 
+class TestPageStatePerformance:
+    """Benchmark page-scoped state access during a page run."""
+
+    @pytest.fixture
+    def instant_questionary(self, fake_questionary):
+        """Install a questionary stand-in whose prompts answer immediately."""
+
+        class _Answer:
+            def __init__(self, **kwargs):
+                self.kwargs = kwargs
+
+            def ask(self):
+                return "answer"
+
+        return fake_questionary(text=_Answer, select=_Answer)
+
+    @staticmethod
+    def _page_runner(field_count):
+        from questionary_extended import PageState
+        from questionary_extended.core.component import text
+        from questionary_extended.integration import QuestionaryBridge
+
+        components = [
+            text(f"asm{i % 20}.field{i}", when="True") for i in range(field_count)
+        ]
+
+        def run_page():
+            state = PageState()
+            QuestionaryBridge(state).run(components)
+            return state
+
+        return run_page
+
+    @pytest.mark.parametrize("field_count", [500, 1000, 2000])
+    def test_page_run(self, benchmark, instant_questionary, field_count):
+        """Benchmark a full bridge run at several page sizes."""
+        state = benchmark(self._page_runner(field_count))
+        assert len(state.view()) == field_count
+
+    def test_page_run_scales_linearly(self, instant_questionary):
+        """Time per field stays flat from 500 to 4000 fields."""
+        import time
+
+        def per_field(field_count):
+            run_page = self._page_runner(field_count)
+            run_page()  # warm up (condition compilation, imports)
+            best = float("inf")
+            for _ in range(5):
+                start = time.perf_counter()
+                run_page()
+                best = min(best, time.perf_counter() - start)
+            return best / field_count
+
+        small, large = per_field(500), per_field(4000)
+        # Quadratic work would make a large-page field ~8x as expensive.
+        assert large < small * 2, (small, large)
+
+
+class TestPageStateHistoryPerformance:
+    """Benchmark versioned PageState history at 10k keys x 1k versions."""
+
+    KEYS = 10_000
+    VERSIONS = 1_000
+
+    def _state(self):
+        from questionary_extended import PageState
+
+        state = PageState()
+        for i in range(self.KEYS):
+            state.set(f"asm{i % 100}.field{i}", i)
+        return state
+
+    def _step(self, state, version):
+        field = version * 7 % self.KEYS
+        state.set(f"asm{field % 100}.field{field}", -version)
+
+    def test_record_1k_versions(self, benchmark):
+        """1k changes, each recorded as a snapshot-able version."""
+
+        def record():
+            state = self._state()
+            state.snapshot()
+            for version in range(self.VERSIONS):
+                self._step(state, version)
+                state.snapshot()
+            return state
+
+        state = benchmark.pedantic(record, rounds=3, iterations=1)
+        assert len(state.snapshot()) == self.KEYS
+
+    def test_undo_redo_1k_versions(self, benchmark):
+        """Walk back through 1k versions and forward again."""
+        state = self._state()
+        state.snapshot()
+        for version in range(self.VERSIONS):
+            self._step(state, version)
+
+        def walk():
+            while state.undo():
+                pass
+            while state.redo():
+                pass
+
+        benchmark(walk)
+        assert state.get("asm0.field0") == 0
+
+    def test_history_memory_vs_dict_copies(self, benchmark):
+        """Memory for 1k versions: persistent history vs per-step dict copies."""
+        import tracemalloc
+
+        def measure(keep_versions):
+            state = self._state()
+            tracemalloc.start()
+            try:
+                kept = keep_versions(state)
+                current, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            return current, kept
+
+        def persistent(state):
+            snapshots = [state.snapshot()]
+            for version in range(self.VERSIONS):
+                self._step(state, version)
+                snapshots.append(state.snapshot())
+            return snapshots
+
+        def copies(state):
+            snapshots = [state.get_all_state()]
+            for version in range(self.VERSIONS):
+                self._step(state, version)
+                snapshots.append(state.get_all_state())
+            return snapshots
+
+        history_bytes, _ = benchmark.pedantic(
+            measure, args=(persistent,), rounds=1, iterations=1
+        )
+        copy_bytes, _ = measure(copies)
+        benchmark.extra_info["history_mib"] = history_bytes / 2**20
+        benchmark.extra_info["dict_copies_mib"] = copy_bytes / 2**20
+        # Includes the one-off O(n) map built by the first snapshot.
+        assert history_bytes * 20 < copy_bytes
+
+
+class TestStateJournalPerformance:
+    """Benchmark PageState.set with a write-ahead journal attached."""
+
+    WRITES = 10_000
+
+    @pytest.mark.parametrize("fsync_interval", [None, 0.5, 0])
+    def test_journaled_sets(self, benchmark, tmp_path, fsync_interval):
+        """10k sets: no journal, group commit every 0.5s, fsync per set."""
+        from questionary_extended import PageState
+        from questionary_extended.core.journal import StateJournal
+
+        writes = self.WRITES if fsync_interval != 0 else self.WRITES // 10
+        journals = []
+
+        def setup():
+            state = PageState()
+            if fsync_interval is not None:
+                journal = StateJournal(
+                    tmp_path / f"run{len(journals)}.journal",
+                    fsync_interval=fsync_interval,
+                )
+                journal.attach(state)
+                journals.append(journal)
+            return (state,), {}
+
+        def write(state):
+            for i in range(writes):
+                state.set(f"asm{i % 20}.field{i}", i)
+
+        try:
+            benchmark.pedantic(write, setup=setup, rounds=3, iterations=1)
+        finally:
+            # Commits happen off the timed path; close to flush the tails.
+            for journal in journals:
+                journal.close()
+
+
+SQLITE_SESSIONS = 100_000
+SQLITE_ASSEMBLIES = 5
+SQLITE_FIELDS = 4
+
+
+@pytest.fixture(scope="module")
+def sqlite_store(tmp_path_factory):
+    """A session store holding 100k saved sessions of 20 keys each."""
+    import json
+
+    from questionary_extended.core.sqlite_state import SQLiteStateStore
+
+    store = SQLiteStateStore(tmp_path_factory.mktemp("sqlite") / "sessions.db")
+    rows = (
+        (f"user{s}", f"asm{a}", f"asm{a}.field{f}", json.dumps(f"value{s}"))
+        for s in range(SQLITE_SESSIONS)
+        for a in range(SQLITE_ASSEMBLIES)
+        for f in range(SQLITE_FIELDS)
+    )
+    conn = store._conn
+    conn.execute("BEGIN")
+    conn.executemany(
+        "INSERT INTO page_state (session, namespace, key, value) VALUES (?, ?, ?, ?)",
+        rows,
+    )
+    conn.execute("COMMIT")
+    try:
+        yield store
+    finally:
+        store.close()
+
+
+class TestSQLiteStatePerformance:
+    """Benchmark resuming one saved session among 100k in SQLite."""
+
+    def test_resume_one_session(self, benchmark, sqlite_store):
+        """Full state of one session (one indexed range scan)."""
+
+        def resume():
+            return sqlite_store.session("user54321").get_all_state()
+
+        state = benchmark(resume)
+        assert len(state) == SQLITE_ASSEMBLIES * SQLITE_FIELDS
+
+    def test_lazy_assembly_access(self, benchmark, sqlite_store):
+        """First access to one assembly of one session."""
+
+        def first_access():
+            return sqlite_store.session("user54321").get_assembly_state("asm3")
+
+        assert benchmark(first_access) == {f"field{f}": "value54321" for f in range(4)}
+
+    def test_answer_burst_commit(self, benchmark, sqlite_store):
+        """One answer plus three handler writes committed as one transaction."""
+        state = sqlite_store.session("user12345")
+        counter = iter(range(10**9))
+
+        def burst():
+            i = next(counter)
+            state.set("asm0.field0", i)
+            for f in range(1, 4):
+                state.set(f"asm1.field{f}", i)
+            state.commit()
+
+        benchmark(burst)
+
+
+class TestPageStateSubscriptionPerformance:
+    """Benchmark change dispatch with many unrelated subscribers."""
+
+    WRITES = 10_000
+
+    @pytest.mark.parametrize("subscribers", [10, 10_000])
+    def test_set_cost_vs_subscriber_count(self, benchmark, subscribers):
+        """set() on one key; other keys carry `subscribers` subscriptions."""
+        from questionary_extended import PageState
+
+        state = PageState()
+        for i in range(subscribers):
+            state.subscribe(lambda keys: None, key=f"asm{i % 100}.other{i}")
+        hits = []
+        state.subscribe(hits.append, key="asm0.field")
+
+        def write_all():
+            for i in range(self.WRITES):
+                state.set("asm0.field", i)
+
+        benchmark(write_all)
+        assert hits
+
+    def test_batched_import_500_fields(self, benchmark):
+        """500 writes in one batch(): each namespace subscriber fires once."""
+        from questionary_extended import PageState
+
+        state = PageState()
+        calls = []
+        for ns in range(10):
+            state.subscribe(lambda keys: calls.append(keys), namespace=f"asm{ns}")
+
+        def import_fields():
+            with state.batch():
+                for i in range(500):
+                    state.set(f"asm{i % 10}.field{i}", i)
+
+        benchmark(import_fields)
+        assert all(len(keys) == 50 for keys in calls)
+
+
+class TestPageStateComputedPerformance:
+    """Benchmark derived per-assembly totals while a page is being filled."""
+
+    ASSEMBLIES = 200
+    FIELDS = 10
+
+    def _fill(self, state):
+        for i in range(self.FIELDS):
+            for a in range(self.ASSEMBLIES):
+                state.set(f"asm{a}.field{i}", i)
+        return [state.get(f"asm{a}.total") for a in range(self.ASSEMBLIES)]
+
+    def test_totals_recomputed_on_change(self, benchmark):
+        """Before: a watcher recomputes the assembly total on every write."""
+        from questionary_extended import PageState
+
+        fields = [f"field{i}" for i in range(self.FIELDS)]
+
+        def run():
+            state = PageState()
+
+            def recompute(key):
+                assembly, _, field = key.partition(".")
+                if field != "total":
+                    values = state.get_assembly_state(assembly)
+                    state.set(f"{assembly}.total", sum(values.get(f, 0) for f in fields))
+
+            state.watch(recompute)
+            return self._fill(state)
+
+        totals = benchmark(run)
+        assert totals[0] == sum(range(self.FIELDS))
+
+    def test_totals_as_computed_entries(self, benchmark):
+        """After: lazy computed entries, evaluated once when read."""
+        from questionary_extended import PageState
+
+        def total(*values):
+            return sum(value or 0 for value in values)
+
+        def run():
+            state = PageState()
+            for a in range(self.ASSEMBLIES):
+                state.add_computed(
+                    f"asm{a}.total",
+                    total,
+                    [f"asm{a}.field{i}" for i in range(self.FIELDS)],
+                )
+            return self._fill(state)
+
+        totals = benchmark(run)
+        assert totals[0] == sum(range(self.FIELDS))
+
+
+class TestChoicePrefetchPerformance:
+    """Benchmark a page of selects whose choices take 20 ms to load."""
+
+    SELECTS = 5
+    LOAD = 0.02
+    THINK = 0.02
+
+    @pytest.fixture
+    def slow_questionary(self, fake_questionary):
+        """Prompts that take THINK seconds to answer, like a quick user."""
+        import time
+
+        class _Prompt:
+            def __init__(self, **kwargs):
+                self.choices = kwargs.get("choices")
+
+            def ask(self):
+                time.sleep(self.THINK)
+                return self.choices[0] if self.choices else "answer"
+
+        _Prompt.THINK = self.THINK
+        fake_questionary(text=_Prompt, select=_Prompt)
+
+    def _run(self, benchmark, prefetch):
+        import time
+
+        from questionary_extended import PageState
+        from questionary_extended.core.choices import ChoiceCache
+        from questionary_extended.core.component import select, text
+        from questionary_extended.integration import QuestionaryBridge
+
+        def rows():
+            time.sleep(self.LOAD)
+            return ["row"]
+
+        def run_page():
+            cache = ChoiceCache()
+            components = [text("name")] + [
+                select(f"pick{i}", choices=lambda: rows(), choice_cache=cache)
+                for i in range(self.SELECTS)
+            ]
+            state = PageState()
+            # No prompt prebuilding, so only choice loading is compared.
+            QuestionaryBridge(state, prefetch=prefetch, prebuild=0).run(components)
+            return state
+
+        state = benchmark.pedantic(run_page, rounds=5, iterations=1)
+        assert state.get("pick0") == "row"
+
+    def test_load_on_demand(self, benchmark, slow_questionary):
+        """Before: each provider is called when its question comes up."""
+        self._run(benchmark, prefetch=0)
+
+    def test_prefetch_while_answering(self, benchmark, slow_questionary):
+        """After: upcoming providers load while the user answers."""
+        self._run(benchmark, prefetch=3)
+
+
+class TestPromptPrebuildPerformance:
+    """Benchmark the gap between questions when building a prompt takes 3 ms."""
+
+    FIELDS = 20
+    BUILD = 0.003
+    THINK = 0.005
+
+    @pytest.fixture
+    def slow_questionary(self, fake_questionary):
+        """Prompts that take BUILD seconds to construct and THINK to answer."""
+        import time
+
+        build, think = self.BUILD, self.THINK
+
+        class _Prompt:
+            def __init__(self, **kwargs):
+                time.sleep(build)
+
+            def ask(self):
+                time.sleep(think)
+                return "answer"
+
+        fake_questionary(text=_Prompt)
+
+    def _run(self, benchmark, prebuild):
+        import statistics
+
+        from questionary_extended import PageState
+        from questionary_extended.core.component import text
+        from questionary_extended.integration import QuestionaryBridge
+
+        components = [text(f"form.field{i}") for i in range(self.FIELDS)]
+        gaps = []
+
+        def run_page():
+            bridge = QuestionaryBridge(PageState(), prebuild=prebuild)
+            bridge.run(components)
+            gaps.extend(bridge.question_gaps)
+
+        benchmark.pedantic(run_page, rounds=5, iterations=1)
+        benchmark.extra_info["gap_median_ms"] = round(statistics.median(gaps) * 1000, 3)
+        benchmark.extra_info["gap_max_ms"] = round(max(gaps) * 1000, 3)
+        return statistics.median(gaps)
+
+    def test_build_on_demand(self, benchmark, slow_questionary):
+        """Before: each prompt is built after the previous answer."""
+        assert self._run(benchmark, prebuild=0) >= self.BUILD
+
+    def test_build_ahead(self, benchmark, slow_questionary):
+        """After: the next prompts are built while the user answers."""
+        assert self._run(benchmark, prebuild=2) < self.BUILD
+
+
+FUZZY_CHOICES = 1_000_000
+
+
+@pytest.fixture(scope="module")
+def hostnames():
+    """A 1M-entry hostname inventory."""
+    roles = ["web", "db", "cache", "api", "worker", "lb", "mq", "search", "auth", "batch"]
+    envs = ["prod", "stage", "dev", "qa"]
+    sites = ["dc1", "dc2", "fra1", "iad3", "sfo2", "lon1"]
+    return [
+        f"{roles[i % 10]}-{envs[i // 10 % 4]}-{i:07d}.{sites[i * 7 % 6]}.Example.com"
+        for i in range(FUZZY_CHOICES)
+    ]
+
+
+class TestFuzzySelectPerformance:
+    """Benchmark per-keystroke latency of fuzzy_select over 1M choices."""
+
+    WORDS = ["web-prod-0042", "iad3", "worker-qa-0999", "0812345", "cache-dev-00123.fra1"]
+
+    def _type(self, benchmark, search, words, setup=None, rounds=5):
+        import statistics
+        import time
+
+        latencies = []
+
+        def type_words():
+            for word in words:
+                for length in range(1, len(word) + 1):
+                    start = time.perf_counter()
+                    search(word[:length])
+                    latencies.append(time.perf_counter() - start)
+
+        benchmark.pedantic(type_words, setup=setup, rounds=rounds, iterations=1)
+        latencies.sort()
+        p50 = statistics.median(latencies)
+        benchmark.extra_info["keystroke_p50_ms"] = round(p50 * 1000, 3)
+        benchmark.extra_info["keystroke_p95_ms"] = round(
+            latencies[int(len(latencies) * 0.95)] * 1000, 3
+        )
+        return p50
+
+    def test_rescan_per_keystroke(self, benchmark, hostnames):
+        """Before: every keystroke rescans all choices (autocomplete)."""
+
+        def search(query):
+            query = query.lower()
+            return [c for c in hostnames if query in c.lower()][:50]
+
+        assert self._type(benchmark, search, self.WORDS[:1], rounds=2) > 0.005
+
+    def test_indexed_incremental(self, benchmark, hostnames):
+        """After: prefix index plus scans narrowed from the previous keystroke."""
+        from questionary_extended.fuzzy import FuzzyMatcher
+
+        matcher = FuzzyMatcher(hostnames)
+        # Each round starts with a cold query cache.
+        p50 = self._type(
+            benchmark, lambda q: matcher.search(q, 50), self.WORDS, setup=matcher._scans.clear
+        )
+        assert p50 < 0.005
+
+
+CATALOGUE_NAMES = 100_000
+CATALOGUE_QUERIES = 200
+
+
+@pytest.fixture(scope="module")
+def catalogue():
+    """100k random catalogue names, and queries that are names with a typo."""
+    import random
+
+    rng = random.Random(5)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+
+    def word():
+        return "".join(rng.choice(letters) for _ in range(rng.randint(3, 8)))
+
+    names = [" ".join(word() for _ in range(rng.randint(1, 3))) for _ in range(CATALOGUE_NAMES)]
+    queries = [name[:2] + "x" + name[3:] for name in rng.sample(names, CATALOGUE_QUERIES)]
+    return names, queries
+
+
+class TestFuzzyIndexPerformance:
+    """Benchmark matching queries against a 100k-name catalogue."""
+
+    def test_pairwise_fuzzy_match(self, benchmark, catalogue):
+        """Before: every (query, choice) pair scored in Python."""
+        from questionary_extended.utils import fuzzy_match
+
+        names, queries = catalogue
+        results = benchmark.pedantic(
+            lambda: [fuzzy_match(q, names)[:5] for q in queries[:2]], rounds=2, iterations=1
+        )
+        benchmark.extra_info["per_query_ms"] = round(benchmark.stats.stats.mean / 2 * 1000, 3)
+        assert len(results) == 2
+
+    def test_batched_index(self, benchmark, catalogue):
+        """After: bigram postings scored for a batch of queries at once."""
+        pytest.importorskip("numpy")
+        from questionary_extended.utils import FuzzyIndex
+
+        names, queries = catalogue
+        index = FuzzyIndex(names)
+        results = benchmark.pedantic(
+            lambda: list(index.match_many(queries, limit=5)), rounds=5, iterations=1
+        )
+        benchmark.extra_info["per_query_ms"] = round(
+            benchmark.stats.stats.mean / CATALOGUE_QUERIES * 1000, 3
+        )
+        assert all(results)
+
+
+@pytest.fixture(scope="module")
+def hierarchy():
+    """1000 directories of 10 subdirectories of 100 files (1M leaves)."""
+    return {
+        f"dir{d}": {f"sub{s}": [f"file{f}" for f in range(100)] for s in range(10)}
+        for d in range(1000)
+    }
+
+
+class TestTreeSelectPerformance:
+    """Benchmark opening tree_select on a 1M-leaf hierarchy."""
+
+    def test_flatten_everything(self, benchmark, hierarchy):
+        """Before: every path was flattened into select choices up front."""
+
+        def flatten():
+            items = []
+            pending = [("", hierarchy)]
+            while pending:
+                prefix, data = pending.pop()
+                for key, value in data.items():
+                    items.append(f"{prefix}{key}/")
+                    if isinstance(value, dict):
+                        pending.append((f"{prefix}{key}/", value))
+                    else:
+                        items.extend(f"{prefix}{key}/{item}" for item in value)
+            return items
+
+        assert len(benchmark.pedantic(flatten, rounds=3, iterations=1)) > 1_000_000
+
+    def test_open_lazily(self, benchmark, hierarchy):
+        """After: only the top level is wrapped and one screen rendered."""
+        from questionary_extended.tree import TreeView, tree_from_dict
+
+        def open_tree():
+            view = TreeView(tree_from_dict(hierarchy), height=20)
+            view.expand(0)
+            return view.render()
+
+        assert benchmark.pedantic(open_tree, rounds=5, iterations=1)
+
+
+class TestVirtualizedListPerformance:
+    """Benchmark one keypress redraw of a select prompt by list length."""
+
+    @pytest.mark.parametrize("size", [1_000, 50_000])
+    def test_questionary_redraw(self, benchmark, size):
+        """Before: questionary formats every choice on each redraw."""
+        from questionary.prompts.common import InquirerControl
+
+        control = InquirerControl([f"item {i}" for i in range(size)])
+
+        def keypress():
+            control.select_next()
+            return control._get_choice_tokens()
+
+        assert benchmark.pedantic(keypress, rounds=20, iterations=1)
+        benchmark.extra_info["choices"] = size
+
+    @pytest.mark.parametrize("size", [1_000, 50_000, 1_000_000])
+    def test_virtualized_redraw(self, benchmark, size):
+        """After: only the viewport plus overscan is formatted."""
+        from questionary_extended.listview import ListView
+
+        view = ListView([f"item {i}" for i in range(size)], height=10, multi=True)
+
+        def keypress():
+            view.move(1)
+            return view.render()
+
+        assert benchmark.pedantic(keypress, rounds=200, iterations=1)
+        benchmark.extra_info["choices"] = size
+
+
+class TestChoiceListMemoryPerformance:
+    """Memory per choice: Choice dataclasses vs a columnar ChoiceList."""
+
+    CHOICES = 200_000
+
+    def test_memory_per_choice(self, benchmark):
+        """Choice objects with per-instance metadata dicts vs packed columns."""
+        import tracemalloc
+
+        from questionary_extended.components import Choice, ChoiceList
+
+        # Titles and values exist before either container is built, as they
+        # would when loaded from elsewhere; only the containers are measured.
+        titles = [f"host-{i:06d}.example.com" for i in range(self.CHOICES)]
+        values = list(range(self.CHOICES))
+
+        def measure(build):
+            tracemalloc.start()
+            try:
+                kept = build()
+                current, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            return current, kept
+
+        def columns():
+            choices = ChoiceList.from_titles(titles, values)
+            choices.set_checked(0)
+            return choices
+
+        def dataclasses():
+            choices = [Choice(title, value) for title, value in zip(titles, values)]
+            choices[0].checked = True
+            return choices
+
+        column_bytes, kept = benchmark.pedantic(measure, args=(columns,), rounds=1, iterations=1)
+        object_bytes, _ = measure(dataclasses)
+        assert len(kept) == self.CHOICES
+        benchmark.extra_info["choice_list_bytes_per_choice"] = column_bytes / self.CHOICES
+        benchmark.extra_info["dataclass_bytes_per_choice"] = object_bytes / self.CHOICES
+        assert column_bytes * 10 < object_bytes
+
+
+class TestPageStateDeltaPerformance:
+    """Benchmark mirroring one answer of a 50k-key state to a dashboard."""
+
+    KEYS = 50_000
+
+    def _state(self):
+        from questionary_extended import PageState
+
+        state = PageState()
+        state.set_many({f"asm{i % 200}.field{i}": i for i in range(self.KEYS)})
+        return state
+
+    def test_ship_full_state(self, benchmark):
+        """Before: the full get_all_state() dict after every answer."""
+        import pickle
+
+        state = self._state()
+
+        def answer_and_ship():
+            state.set("asm0.field0", "answer")
+            return len(pickle.dumps(state.get_all_state()))
+
+        benchmark(answer_and_ship)
+
+    def test_ship_delta(self, benchmark):
+        """After: diff(since_version), O(changes)."""
+        import pickle
+
+        state = self._state()
+        synced = [state.version]
+
+        def answer_and_ship():
+            state.set("asm0.field0", "answer")
+            delta = state.diff(synced[0])
+            synced[0] = delta.version
+            return len(pickle.dumps(delta))
+
+        assert benchmark(answer_and_ship) < 200
+
+
+class TestSharedStatePerformance:
+    """Benchmark a worker reading live state with one large artifact."""
+
+    FIELDS = 1_000
+    ARTIFACT = 8 * 1024 * 1024
+
+    def _answers(self):
+        answers = {f"asm{i % 20}.field{i}": f"value{i}" for i in range(self.FIELDS)}
+        answers["build.assets"] = bytes(self.ARTIFACT)
+        return answers
+
+    def test_read_via_pickled_state(self, benchmark):
+        """Before: the worker unpickles the whole state for every read."""
+        import pickle
+
+        from questionary_extended import PageState
+
+        state = PageState()
+        state.set_many(self._answers())
+        payload = pickle.dumps(state.get_all_state())
+
+        def read():
+            values = pickle.loads(payload)
+            return values["asm0.field0"], len(values["build.assets"])
+
+        assert benchmark(read) == ("value0", self.ARTIFACT)
+
+    def test_read_via_shared_memory(self, benchmark):
+        """After: seqlock-checked snapshot (index decoded once per publish), zero-copy artifact."""
+        from questionary_extended.core import SharedPageState, SharedStateReader
+
+        with SharedPageState(capacity=2 * self.ARTIFACT) as state:
+            state.set_many(self._answers())
+            state.commit()
+            reader = SharedStateReader(state.name)
+
+            def read():
+                snapshot = reader.snapshot()
+                assets = snapshot["build.assets"]
+                result = snapshot["asm0.field0"], len(assets)
+                assets.release()
+                return result
+
+            assert benchmark(read) == ("value0", self.ARTIFACT)
+            reader.close()
+
+
+class TestPageStateBulkPerformance:
+    """Benchmark loading and moving a 50k-key answer file."""
+
+    KEYS = 50_000
+
+    def _answers(self):
+        return {f"asm{i % 200}.field{i}": f"value{i}" for i in range(self.KEYS)}
+
+    def test_load_with_set_loop(self, benchmark):
+        """Before: one set() call per key."""
+        from questionary_extended import PageState
+
+        answers = self._answers()
+
+        def load():
+            state = PageState()
+            for key, value in answers.items():
+                state.set(key, value)
+            return state
+
+        assert len(benchmark(load).view()) == self.KEYS
+
+    def test_load_with_set_many(self, benchmark):
+        """After: one set_many() call, namespaces parsed once."""
+        from questionary_extended import PageState
+
+        answers = self._answers()
+
+        def load():
+            state = PageState()
+            state.set_many(answers)
+            return state
+
+        assert len(benchmark(load).view()) == self.KEYS
+
+    @pytest.mark.parametrize("form", ["dict", "columns"])
+    def test_transfer_between_processes(self, benchmark, form):
+        """Pickle, unpickle and load state as a dict versus export()/import_()."""
+        import pickle
+
+        from questionary_extended import PageState
+
+        source = PageState()
+        source.set_many(self._answers())
+
+        def transfer():
+            target = PageState()
+            if form == "dict":
+                target.set_many(pickle.loads(pickle.dumps(source.get_all_state())))
+            else:
+                target.import_(pickle.loads(pickle.dumps(source.export())))
+            return target
+
+        assert len(benchmark(transfer).view()) == self.KEYS
+
+
+class TestComponentFactoryPerformance:
+    """Benchmark 100k prompt builds with and without the factory cache."""
+
+    BUILDS = 100_000
+
+    @pytest.fixture
+    def text_component(self, fake_questionary):
+        from questionary_extended.core.component import text
+
+        fake_questionary(text=lambda **kw: kw)
+        return text("name", message="Name:")
+
+    def test_builds_cached_factory(self, benchmark, text_component):
+        """After: one validated dict hit per build."""
+
+        def build_all():
+            for _ in range(self.BUILDS):
+                text_component.create_questionary_component()
+
+        benchmark.pedantic(build_all, rounds=3, iterations=1)
+
+    def test_builds_probed_factory(self, benchmark, text_component):
+        """Before: the full candidate probe on every build."""
+        from questionary_extended.core.component import _probe_factory
+
+        config = text_component.questionary_config
+
+        def build_all():
+            for _ in range(self.BUILDS):
+                _probe_factory("text")[1](**config)
+
+        benchmark.pedantic(build_all, rounds=3, iterations=1)
+
+    def test_builds_scoped_backend(self, benchmark, text_component):
+        """Builds under `use_backend`: one ContextVar read, no cache."""
+        from types import SimpleNamespace
+
+        from questionary_extended import _runtime
+
+        def build_all():
+            with _runtime.use_backend(SimpleNamespace(text=lambda **kw: kw)):
+                for _ in range(self.BUILDS):
+                    text_component.create_questionary_component()
+
+        benchmark.pedantic(build_all, rounds=3, iterations=1)
+
+    def test_proxy_attribute_lookups(self, benchmark, text_component):
+        """100k `questionary_proxy.text` lookups through the runtime."""
+        from questionary_extended._questionary_proxy import questionary_proxy
+
+        def lookup_all():
+            for _ in range(self.BUILDS):
+                questionary_proxy.text
+
+        benchmark.pedantic(lookup_all, rounds=3, iterations=1)
+
+
+class TestPagePlanPerformance:
+    """Benchmark compiled page plans against re-walking the tree."""
+
+    def _page(self):
+        from questionary_extended.core.page import Page
+
+        page = Page()
+        for a in range(20):
+            asm = page.assembly(f"asm{a}")
+            for f in range(50):
+                asm.text(f"field{f}", when=f"field{f - 1} != 'skip'" if f else None)
+        return page
+
+    def test_compile_plan(self, benchmark):
+        """Benchmark compiling a 1,000-component plan from scratch."""
+        from questionary_extended.core.plan import compile_plan
+
+        page = self._page()
+        plan = benchmark(compile_plan, page.components)
+        assert len(plan) == 1000
+
+    def test_cached_plan(self, benchmark):
+        """Benchmark fetching the cached plan of an unchanged page."""
+        page = self._page()
+        page.plan()
+        plan = benchmark(page.plan)
+        assert len(plan) == 1000
+
+
+class TestHeadlessReplayPerformance:
+    """Benchmark complete headless page runs from recorded answers."""
+
+    RUNS = 1000
+
+    def _page(self):
+        from questionary_extended.page import Page
+
+        page = Page()
+        asm = page.assembly("svc").select("kind", ["web", "worker"])
+        for f in range(20):
+            asm.text(f"web{f}", when="kind == 'web'", validate=lambda v: bool(v))
+            asm.text(f"worker{f}", when="kind == 'worker'")
+        return page
+
+    def test_replay_page_runs(self, benchmark):
+        """1,000 complete runs of a 41-component page per round."""
+        from questionary_extended.integration import replay_answer_sets
+
+        page = self._page()
+        answer_sets = [
+            {"svc.kind": "web", **{f"svc.web{f}": f"v{i}" for f in range(20)}}
+            for i in range(self.RUNS)
+        ]
+
+        def replay_all():
+            return sum(1 for r in replay_answer_sets(page, answer_sets) if r.valid)
+
+        valid = benchmark.pedantic(replay_all, rounds=5, iterations=1)
+        assert valid == self.RUNS
+
+
+class TestBulkValidationPerformance:
+    """Benchmark process-pool validation of recorded answer sets."""
+
+    RECORDS = 20_000
+
+    def _page(self):
+        from questionary_extended.page import Page
+        from questionary_extended.validators import NumberValidator
+
+        page = Page()
+        asm = page.assembly("svc").select("kind", ["web", "worker"])
+        for f in range(10):
+            asm.text(f"port{f}", when="kind == 'web'", validate=NumberValidator(1, 65535))
+        return page
+
+    def _records(self):
+        for i in range(self.RECORDS):
+            yield {"svc.kind": "web", **{f"svc.port{f}": str(i % 70000) for f in range(10)}}
+
+    @pytest.mark.parametrize("processes", [1, 4])
+    def test_validate_answer_sets(self, benchmark, processes):
+        """20k records through one process versus a 4-worker pool."""
+        from questionary_extended.integration import validate_answer_sets
+
+        page = self._page()
+
+        def validate_all():
+            return sum(
+                1
+                for errors in validate_answer_sets(page, self._records(), processes=processes)
+                if errors
+            )
+
+        invalid = benchmark.pedantic(validate_all, rounds=2, iterations=1)
+        assert invalid > 0
+
+
+class TestConditionPerformance:
+    """Benchmark compiled `when` conditions at page scale."""
+
+    CONDITION_COUNT = 10_000
+
+    def _conditions(self):
+        return [
+            f"asm{i % 50}.choice == 'opt{i % 7}' and count{i % 13} > {i % 100}"
+            for i in range(self.CONDITION_COUNT)
+        ]
+
+    def test_evaluate_10k_conditions(self, benchmark):
+        """Benchmark evaluating 10k distinct compiled conditions once each."""
+        from questionary_extended.core.conditions import compile_condition
+
+        conditions = [compile_condition(expr) for expr in self._conditions()]
+        state = {f"asm{i}.choice": f"opt{i % 7}" for i in range(50)}
+        state.update({f"count{i}": i * 10 for i in range(13)})
+
+        def evaluate_all():
+            return sum(1 for condition in conditions if condition.evaluate(state))
+
+        benchmark(evaluate_all)
+
+    def test_component_visibility_10k_cached(self, benchmark, monkeypatch):
+        """Benchmark is_visible for 10k components (compiled once, no parsing)."""
+        import ast
+
+        from questionary_extended import PageState
+        from questionary_extended.core.component import Component
+
+        components = [
+            Component(f"asm{i % 50}.field{i}", "text", when=expr)
+            for i, expr in enumerate(self._conditions())
+        ]
+        state = PageState()
+        for i in range(50):
+            state.set(f"asm{i}.choice", f"opt{i % 7}")
+        view = state.view()
+
+        def check_all():
+            return sum(1 for comp in components if comp.is_visible(view))
+
+        # The first sweep compiles every condition; later sweeps parse nothing,
+        # even with more distinct expressions than the module cache holds.
+        check_all()
+        parses = []
+        parse = ast.parse
+
+        def counting_parse(*args, **kwargs):
+            parses.append(args[0])
+            return parse(*args, **kwargs)
+
+        monkeypatch.setattr(ast, "parse", counting_parse)
+        benchmark(check_all)
+        assert parses == []
+
+
+class TestPageServerLoad:
+    """Load test: simulated telnet clients typing into one served page."""
+
+    KEYSTROKES = 20
+    # Characters that never occur in the escape sequences of a redraw, so
+    # seeing one in the output means its keystroke has been rendered.
+    KEYS = "zx"
+
+    async def _client(self, port, latencies):
+        import asyncio
+        import time
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        # IAC SB TTYPE IS "vt100" IAC SE
+        writer.write(b"\xff\xfa\x18\x00vt100\xff\xf0")
+        data = b""
+        while b"Name?" not in data:
+            data += await reader.read(4096)
+
+        for i in range(self.KEYSTROKES):
+            key = self.KEYS[i % 2].encode()
+            start = time.perf_counter()
+            writer.write(key)
+            data = b""
+            while key not in data:
+                data += await reader.read(4096)
+            latencies.append(time.perf_counter() - start)
+
+        writer.write(b"\r")
+        await reader.read()
+        writer.close()
+
+    def _run_load(self, clients):
+        import asyncio
+        import socket
+
+        from questionary_extended.core.component import text
+        from questionary_extended.integration import PageServer
+        from questionary_extended.page import Page
+
+        page = Page()
+        page.components.append(text("name", message="Name?"))
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        latencies = []
+
+        async def main():
+            server = PageServer(page, port=port, enable_cpr=False)
+            ready = asyncio.Event()
+            task = asyncio.ensure_future(server.serve(ready_cb=ready.set))
+            await ready.wait()
+            try:
+                await asyncio.gather(
+                    *(self._client(port, latencies) for _ in range(clients))
+                )
+            finally:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+        asyncio.run(main())
+        return latencies
+
+    @pytest.mark.parametrize("clients", [1, 25])
+    def test_keystroke_latency(self, benchmark, clients):
+        """Per-keystroke round trip with N concurrent clients on one loop."""
+        pytest.importorskip("prompt_toolkit.contrib.telnet.server")
+
+        latencies = benchmark.pedantic(
+            self._run_load, args=(clients,), rounds=1, iterations=1
+        )
+        assert len(latencies) == clients * self.KEYSTROKES
+
+        latencies.sort()
+        for pct in (50, 95, 99):
+            index = min(len(latencies) - 1, len(latencies) * pct // 100)
+            benchmark.extra_info[f"keystroke_p{pct}_ms"] = latencies[index] * 1000
+
+
 class TestMemoryUsage:
     """Test memory efficiency."""
     
@@ -0,0 +1,27 @@
+"""Fixtures shared by the test suite and the benchmarks."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from questionary_extended import _runtime
+
+
+@pytest.fixture
+def fake_questionary():
+    """Install a questionary stand-in for one test.
+
+    Yields ``install(**factories)``, which installs a namespace holding the
+    given prompt factories (``text=...``, ``select=...``) and returns it.
+    The real questionary lookup is restored when the test ends.
+    """
+
+    def install(**factories):
+        backend = SimpleNamespace(**factories)
+        _runtime.set_questionary_for_tests(backend)
+        return backend
+
+    try:
+        yield install
+    finally:
+        _runtime.clear_questionary_for_tests()
@@ -24,9 +24,12 @@ except Exception:
     # Keep the default version in that case.
     pass
 
+from ._runtime import use_backend
+
 # Import core functionality - start with basics that work
 from .components import (
     Choice,
+    ChoiceList,
     ProgressStep,
     Separator,
     ValidationResult,
@@ -96,6 +99,8 @@ __all__ = [
     "rating",
     "form",
     "ProgressTracker",
+    # Runtime
+    "use_backend",
     # Core types
     "Assembly",
     "Card",
@@ -104,6 +109,7 @@ __all__ = [
     "PageState",
     # Components
     "Choice",
+    "ChoiceList",
     "Separator",
     "ProgressStep",
     "ValidationResult",
@@ -0,0 +1,60 @@
+"""Chunked process-pool fan-out shared by bulk validation and fuzzy matching.
+
+Work is streamed to a :class:`concurrent.futures.ProcessPoolExecutor` in
+chunks, with a bounded number of chunks in flight so arbitrarily large
+inputs are never loaded at once, and results come back in input order.
+Shared, read-only state (a page, an index) is sent once per worker through
+the pool's initializer rather than with every chunk.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def chunks(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Yield successive lists of up to `size` items."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def map_chunks(
+    func: Callable[..., R],
+    chunked: Iterable[List[T]],
+    workers: int,
+    initializer: Callable[..., Any],
+    initargs: Sequence[Any] = (),
+    args: Sequence[Any] = (),
+) -> Iterator[R]:
+    """Yield ``func(chunk, *args)`` for each chunk, computed in `workers` processes.
+
+    `func` and `initializer` must be module-level functions. At most
+    ``2 * workers`` chunks are submitted ahead of the consumer; if it stops
+    early (or a worker fails), the queued chunks are cancelled.
+    """
+    iterator = iter(chunked)
+    # Keep every worker busy while bounding memory held by pending chunks.
+    max_in_flight = workers * 2
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=tuple(initargs)
+    ) as executor:
+        pending: Deque["Future[R]"] = deque()
+        try:
+            for chunk in islice(iterator, max_in_flight):
+                pending.append(executor.submit(func, chunk, *args))
+            while pending:
+                result = pending.popleft().result()
+                for chunk in islice(iterator, 1):
+                    pending.append(executor.submit(func, chunk, *args))
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
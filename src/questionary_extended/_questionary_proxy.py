@@ -16,11 +16,37 @@ from types import SimpleNamespace
 from typing import Any, Callable, Dict
 import importlib
 
+# The runtime module, imported on first use and then reused so attribute
+# lookups do not go through the import machinery each time.
+_RUNTIME: Any | None = None
+
 
 def _default_placeholder(*a: object, **kw: object) -> object:
     raise NotImplementedError("questionary is not configured in this environment")
 
 
+def _runtime() -> Any:
+    global _RUNTIME
+    if _RUNTIME is None:
+        _RUNTIME = importlib.import_module("questionary_extended._runtime")
+    return _RUNTIME
+
+
+def _get_questionary() -> Any:
+    try:
+        return _runtime().get_questionary()
+    except Exception:
+        return None
+
+
+def _bump_generation() -> None:
+    """Tell the runtime that resolved factories may have changed."""
+    try:
+        _runtime().bump_generation()
+    except Exception:
+        pass
+
+
 class QuestionaryProxy:
     """Proxy object that is safe to import and monkeypatch.
 
@@ -41,13 +67,8 @@ class QuestionaryProxy:
         if name in overrides:
             return overrides[name]
 
-        # Try the runtime accessor
-        try:
-            rt = importlib.import_module("questionary_extended._runtime")
-            q = rt.get_questionary()
-        except Exception:
-            q = None
-
+        # Try the runtime accessor (honours context-scoped backends)
+        q = _get_questionary()
         if q is not None and hasattr(q, name):
             return getattr(q, name)
 
@@ -58,6 +79,7 @@ class QuestionaryProxy:
         # Put everything into overrides (tests will replace functions).
         overrides: Dict[str, Any] = object.__getattribute__(self, "_overrides")
         overrides[name] = value
+        _bump_generation()
 
     def __delattr__(self, name: str) -> None:
         """Support delattr so test monkeypatch teardown can remove overrides.
@@ -68,6 +90,7 @@ class QuestionaryProxy:
         overrides: Dict[str, Any] = object.__getattribute__(self, "_overrides")
         if name in overrides:
             del overrides[name]
+            _bump_generation()
             return
         raise AttributeError(name)
 
@@ -76,13 +99,9 @@ class QuestionaryProxy:
         overrides: Dict[str, Any] = object.__getattribute__(self, "_overrides")
         names = set(overrides.keys())
         # Try to include real questionary attributes when available
-        try:
-            rt = importlib.import_module("questionary_extended._runtime")
-            q = rt.get_questionary()
-            if q is not None:
-                names.update(dir(q))
-        except Exception:
-            pass
+        q = _get_questionary()
+        if q is not None:
+            names.update(dir(q))
         return sorted(names)
 
 
@@ -5,16 +5,44 @@ production code and tests share a single contract. Tests should set the
 runtime mock via `set_questionary_for_tests` (or by inserting into
 `sys.modules['questionary']`) and production code should call `get_questionary()`
 to obtain the implementation.
+
+Code that needs a different backend for a while (a headless or recording
+stand-in for one session) should use :func:`use_backend`. The override is
+held in a :class:`contextvars.ContextVar`, so it is visible only to the
+current thread or asyncio task (and tasks it creates), never to concurrent
+neighbours.
 """
 
 from __future__ import annotations
 
 import importlib
 import sys
-from typing import Any, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
 
 # Cached runtime object (may be a real module or a test-provided SimpleNamespace)
-_QUESTIONARY: Optional[Any] = None
+_QUESTIONARY: Any | None = None
+
+# Backend installed by `use_backend` for the current context only
+_SCOPED_BACKEND: ContextVar[Any | None] = ContextVar(
+    "questionary_extended_backend", default=None
+)
+
+# Incremented whenever the resolved backend (or a proxy override) changes so
+# callers can cache lookups derived from it.
+_GENERATION = 0
+
+
+def get_generation() -> int:
+    """Return the current backend generation counter."""
+    return _GENERATION
+
+
+def bump_generation() -> None:
+    """Invalidate caches derived from the resolved `questionary` backend."""
+    global _GENERATION
+    _GENERATION += 1
 
 
 def set_questionary_for_tests(obj: Any) -> None:
@@ -26,37 +54,74 @@ def set_questionary_for_tests(obj: Any) -> None:
     """
     global _QUESTIONARY
     _QUESTIONARY = obj
+    bump_generation()
 
 
 def clear_questionary_for_tests() -> None:
     """Clear any previously-set questionary object (restores lazy import)."""
     global _QUESTIONARY
     _QUESTIONARY = None
+    bump_generation()
+
+
+def get_scoped_backend() -> Any | None:
+    """Return the backend installed by :func:`use_backend` in this context."""
+    return _SCOPED_BACKEND.get()
+
+
+@contextmanager
+def use_backend(backend: Any) -> Iterator[Any]:
+    """Use `backend` as the questionary object within the current context.
+
+    Only the calling thread or asyncio task sees the override; sessions
+    running concurrently keep their own backend. Scopes nest and are
+    restored on exit. The global generation counter is left untouched, so
+    caches serving other contexts stay valid.
+
+    Args:
+        backend: questionary-like object exposing ``text``, ``select``, ...
+
+    Example::
+
+        with use_backend(recorder):
+            page.run()
+    """
+    token = _SCOPED_BACKEND.set(backend)
+    try:
+        yield backend
+    finally:
+        _SCOPED_BACKEND.reset(token)
 
 
-def get_questionary() -> Optional[Any]:
+def get_questionary() -> Any | None:
     """Return the resolved `questionary` object or ``None`` if unavailable.
 
     Resolution order:
-    1. If tests have set an explicit runtime object via
+    1. A backend installed for the current context by :func:`use_backend`.
+    2. If tests have set an explicit runtime object via
        ``set_questionary_for_tests``, return it.
-    2. If ``sys.modules['questionary']`` exists (tests often insert a fake
+    3. If ``sys.modules['questionary']`` exists (tests often insert a fake
        module there), return it and cache it.
-    3. Attempt ``importlib.import_module('questionary')`` and cache/return it.
-    4. If import fails, return ``None`` (callers decide whether to raise).
+    4. Attempt ``importlib.import_module('questionary')`` and cache/return it.
+    5. If import fails, return ``None`` (callers decide whether to raise).
     """
     global _QUESTIONARY
+    scoped = _SCOPED_BACKEND.get()
+    if scoped is not None:
+        return scoped
     if _QUESTIONARY is not None:
         return _QUESTIONARY
 
     q = sys.modules.get("questionary")
     if q is not None:
         _QUESTIONARY = q
+        bump_generation()
         return q
 
     try:
         q = importlib.import_module("questionary")
         _QUESTIONARY = q
+        bump_generation()
         return q
     except Exception:
         return None
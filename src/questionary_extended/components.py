@@ -6,7 +6,19 @@ library. Types are annotated precisely to make mypy checks easier.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
 
 
 class ColumnType(Enum):
@@ -27,7 +39,8 @@ class Choice:
 
     title: str
     value: Any = None
-    disabled: bool = False
+    # True, or a string saying why the choice cannot be picked
+    disabled: Union[bool, str] = False
     checked: bool = False
     icon: Optional[str] = None
     description: Optional[str] = None
@@ -46,6 +59,247 @@ class Separator:
     line_char: str = "-"
 
 
+def is_separator(item: Any) -> bool:
+    """True for this module's :class:`Separator` and questionary's."""
+    if isinstance(item, Separator):
+        return True
+    kind = type(item)
+    return kind.__name__ == "Separator" and kind.__module__.startswith("questionary")
+
+
+class ChoiceList(Sequence[Choice]):
+    """Compact, columnar sequence of choices for very large lists.
+
+    A :class:`Choice` per item carries its own instance and ``metadata``
+    dict; a ``ChoiceList`` keeps the columns instead:
+
+    - Titles in one list; values only for choices whose value is not the
+      title (the column is created on the first such value)
+    - Disabled/checked/separator flags packed into a bytearray, one byte
+      per choice
+    - Descriptions, disabled reasons and separators in dicts keyed by
+      index, as most choices have none
+
+    Indexing returns a new :class:`Choice` built on access (``icon`` and
+    ``metadata`` are not stored), so edits to it are not written back;
+    use :meth:`set_checked` and :meth:`set_disabled` instead. Separator
+    rows return the separator they were given and are always disabled.
+    Slices return a ``ChoiceList``.
+
+    Args:
+        choices: Strings, :class:`Choice` objects, separators or dicts with
+            ``name``, ``value``, ``disabled``, ``checked`` and
+            ``description`` keys
+    """
+
+    DISABLED = 1
+    CHECKED = 2
+    SEPARATOR = 4
+
+    __slots__ = (
+        "_titles",
+        "_values",
+        "_flags",
+        "_descriptions",
+        "_reasons",
+        "_separators",
+    )
+
+    def __init__(self, choices: Iterable[Any] = ()) -> None:
+        self._titles: List[str] = []
+        # None until a value differs from its title; None entries mean "title"
+        self._values: Optional[List[Any]] = None
+        self._flags = bytearray()
+        self._descriptions: Dict[int, str] = {}
+        # Why a choice is disabled, when given as a string
+        self._reasons: Dict[int, str] = {}
+        self._separators: Dict[int, Any] = {}
+        self.extend(choices)
+
+    @classmethod
+    def from_titles(
+        cls, titles: Iterable[str], values: Optional[Iterable[Any]] = None
+    ) -> "ChoiceList":
+        """Build from plain titles (and optionally matching values) in bulk.
+
+        Raises:
+            ValueError: If `values` and `titles` differ in length
+        """
+        choices = cls()
+        choices._titles = list(titles)
+        choices._flags = bytearray(len(choices._titles))
+        if values is not None:
+            choices._values = list(values)
+            if len(choices._values) != len(choices._titles):
+                raise ValueError("titles and values must have the same length")
+        return choices
+
+    def append(
+        self,
+        title: str,
+        value: Any = None,
+        disabled: Union[bool, str, None] = False,
+        checked: bool = False,
+        description: Optional[str] = None,
+    ) -> None:
+        """Add one choice; a string `disabled` is kept as the reason."""
+        index = len(self._titles)
+        self._titles.append(title)
+        if value is not None and value != title and self._values is None:
+            self._values = [None] * index
+        if self._values is not None:
+            self._values.append(None if value == title else value)
+        self._flags.append(
+            (self.DISABLED if disabled else 0) | (self.CHECKED if checked else 0)
+        )
+        if disabled and isinstance(disabled, str):
+            self._reasons[index] = disabled
+        if description is not None:
+            self._descriptions[index] = description
+
+    def append_separator(self, separator: Any = None) -> None:
+        """Add a separator row (a :class:`Separator` unless one is given)."""
+        if separator is None:
+            separator = Separator()
+        index = len(self._titles)
+        line = getattr(separator, "line", None) or separator.title or "-" * 15
+        self._titles.append(str(line))
+        if self._values is not None:
+            self._values.append(None)
+        self._flags.append(self.DISABLED | self.SEPARATOR)
+        self._separators[index] = separator
+
+    def extend(self, choices: Iterable[Any]) -> None:
+        """Add strings, :class:`Choice` objects, separators or dicts."""
+        for item in choices:
+            if isinstance(item, str):
+                self.append(item)
+            elif isinstance(item, dict):
+                title = item.get("name")
+                self.append(
+                    title,
+                    item.get("value"),
+                    item.get("disabled"),
+                    bool(item.get("checked")),
+                    item.get("description"),
+                )
+            elif is_separator(item):
+                self.append_separator(item)
+            else:
+                self.append(
+                    item.title,
+                    getattr(item, "value", None),
+                    getattr(item, "disabled", False),
+                    bool(getattr(item, "checked", False)),
+                    getattr(item, "description", None),
+                )
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def _index(self, index: int) -> int:
+        size = len(self._titles)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("ChoiceList index out of range")
+        return index
+
+    @overload
+    def __getitem__(self, index: int) -> Any:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ChoiceList":
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            rows = range(len(self._titles))[index]
+            part = ChoiceList.from_titles(
+                [self._titles[i] for i in rows],
+                None if self._values is None else [self._values[i] for i in rows],
+            )
+            part._flags = bytearray(self._flags[i] for i in rows)
+
+            def column(cells: Dict[int, Any]) -> Dict[int, Any]:
+                return {new: cells[old] for new, old in enumerate(rows) if old in cells}
+
+            part._descriptions = column(self._descriptions)
+            part._reasons = column(self._reasons)
+            part._separators = column(self._separators)
+            return part
+        index = self._index(index)
+        flags = self._flags[index]
+        if flags & self.SEPARATOR:
+            return self._separators[index]
+        return Choice(
+            title=self._titles[index],
+            value=self.value(index),
+            disabled=self._reasons.get(index, bool(flags & self.DISABLED)),
+            checked=bool(flags & self.CHECKED),
+            description=self._descriptions.get(index),
+        )
+
+    def __iter__(self) -> Iterator[Choice]:
+        for index in range(len(self._titles)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"<ChoiceList of {len(self._titles)} choices>"
+
+    def title(self, index: int) -> str:
+        return self._titles[self._index(index)]
+
+    def value(self, index: int) -> Any:
+        index = self._index(index)
+        if self._flags[index] & self.SEPARATOR:
+            return None
+        value = None if self._values is None else self._values[index]
+        return self._titles[index] if value is None else value
+
+    def is_disabled(self, index: int) -> bool:
+        return bool(self._flags[self._index(index)] & self.DISABLED)
+
+    def is_checked(self, index: int) -> bool:
+        return bool(self._flags[self._index(index)] & self.CHECKED)
+
+    def is_separator(self, index: int) -> bool:
+        return bool(self._flags[self._index(index)] & self.SEPARATOR)
+
+    def disabled_reason(self, index: int) -> Optional[str]:
+        return self._reasons.get(self._index(index))
+
+    def set_disabled(self, index: int, disabled: Union[bool, str] = True) -> None:
+        """Disable (with an optional reason) or enable a choice."""
+        index = self._index(index)
+        if self._flags[index] & self.SEPARATOR:
+            raise ValueError("separators are always disabled")
+        self._set(index, self.DISABLED, bool(disabled))
+        if disabled and isinstance(disabled, str):
+            self._reasons[index] = disabled
+        else:
+            self._reasons.pop(index, None)
+
+    def set_checked(self, index: int, checked: bool = True) -> None:
+        self._set(index, self.CHECKED, checked)
+
+    def _set(self, index: int, flag: int, on: bool) -> None:
+        index = self._index(index)
+        if on:
+            self._flags[index] |= flag
+        else:
+            self._flags[index] &= ~flag
+
+    def bitmap(self, flag: int) -> bytearray:
+        """Rows with `flag` set as a bitmap (bit ``i & 7`` of byte ``i >> 3``)."""
+        # Map each flag byte to an ASCII digit and parse the digits, last row
+        # first, as one binary number; both steps run in C.
+        digits = self._flags.translate(bytes(48 + bool(b & flag) for b in range(256)))
+        bits = int(bytes(digits[::-1]) or b"0", 2)
+        return bytearray(bits.to_bytes((len(self._flags) + 7) >> 3, "little"))
+
+
 @dataclass
 class Column:
     """Table column definition."""
@@ -73,7 +327,11 @@ class TableRow:
 
 @dataclass
 class TreeNode:
-    """Tree structure node."""
+    """Tree structure node.
+
+    Children may be supplied up front or by a ``loader`` called with the
+    node the first time its children are needed (see :meth:`load_children`).
+    """
 
     name: str
     value: Any = None
@@ -81,6 +339,7 @@ class TreeNode:
     expanded: bool = False
     icon: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    loader: Optional[Callable[["TreeNode"], Iterable["TreeNode"]]] = None
 
     def __post_init__(self) -> None:
         if self.value is None:
@@ -91,26 +350,36 @@ class TreeNode:
         self.children.append(node)
         return self
 
+    def load_children(self) -> List["TreeNode"]:
+        """Return the children, calling the loader once if there is one."""
+        if self.loader is not None:
+            loader, self.loader = self.loader, None
+            self.children.extend(loader(self))
+        return self.children
+
     def is_leaf(self) -> bool:
-        """Check if this is a leaf node."""
-        return len(self.children) == 0
+        """Check if this is a leaf node (without loading lazy children)."""
+        return not self.children and self.loader is None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any], name: str = "root") -> "TreeNode":
         """Create tree from nested dictionary."""
         node = cls(name=name)
-
-        for key, value in data.items():
-            if isinstance(value, dict):
-                child = cls.from_dict(value, key)
-                node.add_child(child)
-            elif isinstance(value, list):
-                for item in value:
-                    child = cls(name=str(item), value=item)
-                    node.add_child(child)
-            else:
-                child = cls(name=key, value=value)
-                node.add_child(child)
+        # Explicit stack rather than recursion, so depth is not bounded by
+        # the interpreter's recursion limit.
+        pending = [(node, data)]
+        while pending:
+            parent, mapping = pending.pop()
+            for key, value in mapping.items():
+                if isinstance(value, dict):
+                    child = cls(name=key)
+                    parent.add_child(child)
+                    pending.append((child, value))
+                elif isinstance(value, list):
+                    for item in value:
+                        parent.add_child(cls(name=str(item), value=item))
+                else:
+                    parent.add_child(cls(name=key, value=value))
 
         return node
 
@@ -8,10 +8,18 @@ This module contains the fundamental building blocks:
 - Assembly: Interactive component groups with conditional logic
 - Component: Enhanced questionary component wrappers
 - State: Page-scoped state management with assembly namespacing
+- Conditions: Compiled, sandboxed `when` expressions
+- Choices: Cached, prefetchable choice providers for selection components
+- Plan: Cached, flattened execution plans for Page trees
+- Persistent: Structure-sharing immutable map behind state history
+- Journal: Append-only write-ahead journal for crash-resume of state
+- SQLite state: Saved sessions in a WAL-mode SQLite database
+- Shared state: PageState published to shared memory for worker processes
 """
 
 from .assembly import Assembly
 from .card import Card
+from .choices import ChoiceCache
 from .component import (
     Component,
     autocomplete,
@@ -22,8 +30,14 @@ from .component import (
     select,
     text,
 )
+from .conditions import Condition, ConditionError, compile_condition
+from .journal import StateJournal
 from .page import Page
-from .state import PageState
+from .persistent import PersistentMap
+from .plan import PagePlan, PlanEntry, compile_plan, plan_for
+from .shared_state import SharedPageState, SharedStateReader, StaleSnapshotError
+from .sqlite_state import SQLitePageState, SQLiteStateStore
+from .state import PageState, StateColumns, StateDelta
 
 __all__ = [
     "Page",
@@ -31,6 +45,23 @@ __all__ = [
     "Assembly",
     "Component",
     "PageState",
+    "StateColumns",
+    "StateDelta",
+    "PersistentMap",
+    "StateJournal",
+    "SQLitePageState",
+    "SQLiteStateStore",
+    "SharedPageState",
+    "SharedStateReader",
+    "StaleSnapshotError",
+    "ChoiceCache",
+    "Condition",
+    "ConditionError",
+    "compile_condition",
+    "PagePlan",
+    "PlanEntry",
+    "compile_plan",
+    "plan_for",
     # Component convenience functions
     "text",
     "select",
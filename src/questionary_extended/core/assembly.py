@@ -7,6 +7,8 @@ conditional behavior, cross-field validation, and state management.
 
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple, Union
 
+from .plan import ComponentList
+
 if TYPE_CHECKING:
     from .page import Page
 
@@ -17,6 +19,7 @@ class Assembly:
 
     Provides:
     - Event hooks (.on_change, .on_validate, .on_complete)
+    - Computed fields derived from other fields (.computed)
     - Dynamic component visibility and interaction
     - Cross-field validation and state management
     - Reusable template patterns
@@ -32,11 +35,15 @@ class Assembly:
         """
         self.name = name
         self.parent_page = parent
-        self.components: List[Any] = []
+        self.components: List[Any] = ComponentList(self)
+        self.version = 0
         # Event handlers may be simple callables or (field, handler) tuples
         self.event_handlers: Dict[
             str, List[Union[Callable[..., Any], Tuple[str, Callable[..., Any]]]]
         ] = {"change": [], "validate": [], "complete": []}
+        # Computed fields: namespaced key -> (function, dependency keys).
+        # Compiled into the page plan so every run's state gets them.
+        self.computed_fields: Dict[str, Tuple[Callable[..., Any], Tuple[str, ...]]] = {}
 
     def text(self, name: str, **kwargs: Any) -> "Assembly":
         """
@@ -105,6 +112,37 @@ class Assembly:
         """
         # Implementation pending Event system
         self.event_handlers["change"].append((field, handler))
+        self._touch()
+        return self
+
+    def computed(
+        self, field: str, func: Callable[..., Any], depends_on: List[str]
+    ) -> "Assembly":
+        """
+        Register a computed field derived from other fields.
+
+        The value is evaluated lazily and memoized in the page state until
+        one of its dependencies changes (see ``PageState.add_computed``), and
+        ``when`` conditions can read it like any answered field. Runs on a
+        fresh state (headless replay, bulk validation, served sessions) get
+        the field too, so `func` must be picklable for process pools.
+
+        Args:
+            field: Field name the value is read under
+            func: Function called with the dependency values
+            depends_on: Fields of this assembly, or namespaced keys
+                (``other.field``) of other assemblies
+
+        Returns:
+            Self for method chaining
+        """
+        key = f"{self.name}.{field}"
+        dependencies = tuple(
+            dep if "." in dep else f"{self.name}.{dep}" for dep in depends_on
+        )
+        self.parent_page.state.add_computed(key, func, dependencies)
+        self.computed_fields[key] = (func, dependencies)
+        self._touch()
         return self
 
     def on_validate(self, handler: Callable[..., Any]) -> "Assembly":
@@ -119,6 +157,7 @@ class Assembly:
         """
         # Implementation pending Event system
         self.event_handlers["validate"].append(handler)
+        self._touch()
         return self
 
     def on_complete(self, field: str, handler: Callable[..., Any]) -> "Assembly":
@@ -134,6 +173,7 @@ class Assembly:
         """
         # Implementation pending Event system
         self.event_handlers["complete"].append((field, handler))
+        self._touch()
         return self
 
     def show_components(self, component_names: List[str]) -> None:
@@ -152,6 +192,13 @@ class Assembly:
         """Get value from other assemblies (cross-boundary access)."""
         raise NotImplementedError("Assembly get_related_value is not implemented")
 
+    def _touch(self) -> None:
+        """Record a structural change and propagate it to the parent page."""
+        self.version += 1
+        touch = getattr(self.parent_page, "_touch", None)
+        if touch is not None:
+            touch()
+
     def parent(self) -> "Page":
         """Return parent Page for navigation."""
         return self.parent_page
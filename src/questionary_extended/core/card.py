@@ -7,6 +7,8 @@ dynamic show/hide capabilities, and responsive layout management.
 
 from typing import TYPE_CHECKING, Any, List
 
+from .plan import ComponentList
+
 if TYPE_CHECKING:
     from .page import Page
 
@@ -34,7 +36,8 @@ class Card:
         self.title = title
         self.parent_page = parent
         self.style = style
-        self.components: List[Any] = []
+        self.components: List[Any] = ComponentList(self)
+        self.version = 0
         self.visible = True
 
     def text(self, name: str, **kwargs: Any) -> "Card":
@@ -92,6 +95,13 @@ class Card:
         """Hide this card."""
         self.visible = False
 
+    def _touch(self) -> None:
+        """Record a structural change and propagate it to the parent page."""
+        self.version += 1
+        touch = getattr(self.parent_page, "_touch", None)
+        if touch is not None:
+            touch()
+
     def parent(self) -> "Page":
         """Return parent Page for navigation."""
         return self.parent_page
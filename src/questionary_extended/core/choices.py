@@ -0,0 +1,185 @@
+"""
+Dynamic choice providers for questionary-extended.
+
+``select``, ``checkbox`` and ``autocomplete`` accept a callable (or a
+coroutine function) as ``choices``; it is called without arguments when the
+choices are first needed:
+
+- Results are kept in a :class:`ChoiceCache` with a time-to-live and a
+  size bound (least recently used providers are evicted first)
+- Loads of the same provider are shared: a caller arriving while a load
+  is in flight (e.g. a bridge prefetch) waits for it instead of calling
+  the provider again
+- Failed loads are not cached
+"""
+
+import asyncio
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..components import ChoiceList
+
+ChoiceProvider = Callable[[], Any]
+
+
+def is_choice_provider(choices: Any) -> bool:
+    """Return True if `choices` is a provider rather than a static list."""
+    return callable(choices)
+
+
+def _call(provider: ChoiceProvider) -> List[Any]:
+    result = provider()
+    if inspect.isawaitable(result):
+        # Providers run outside the prompt's event loop (a prefetch thread
+        # or synchronous prompt creation), so give the coroutine its own.
+        result = asyncio.run(_await(result))
+    # A ChoiceList is kept as is rather than expanded into Choice objects.
+    return result if isinstance(result, ChoiceList) else list(result)
+
+
+async def _await(awaitable: Any) -> Any:
+    return await awaitable
+
+
+class _AbandonedLoadError(Exception):
+    """A prefetch that could not be submitted; waiters load it themselves."""
+
+
+class ChoiceCache:
+    """TTL and LRU bounded cache of provider results.
+
+    Args:
+        maxsize: Providers whose results are kept
+        ttl: Seconds a result stays fresh; ``None`` keeps it until evicted
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = 300.0) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # provider -> (expiry, choices), least recently used first
+        self._entries: "OrderedDict[ChoiceProvider, Tuple[float, List[Any]]]" = (
+            OrderedDict()
+        )
+        self._loading: Dict[ChoiceProvider, "Future[List[Any]]"] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __reduce__(self) -> Any:
+        # Cached results and in-flight loads belong to this process; the
+        # default cache maps to the receiving process's default cache.
+        if self is default_choice_cache:
+            return (_default_cache, ())
+        return (type(self), (self.maxsize, self.ttl))
+
+    def _fresh(self, provider: ChoiceProvider) -> Optional[List[Any]]:
+        # Called with the lock held.
+        entry = self._entries.get(provider)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._entries[provider]
+            return None
+        self._entries.move_to_end(provider)
+        return entry[1]
+
+    def get(self, provider: ChoiceProvider) -> List[Any]:
+        """Return the provider's choices, loading them if needed.
+
+        Raises:
+            Exception: Whatever the provider raised
+        """
+        while True:
+            with self._lock:
+                choices = self._fresh(provider)
+                if choices is not None:
+                    return choices
+                future = self._loading.get(provider)
+                owner = future is None
+                if owner:
+                    future = self._loading[provider] = Future()
+            if owner:
+                self._load(provider, future)  # type: ignore[arg-type]
+            try:
+                return future.result()  # type: ignore[union-attr]
+            except _AbandonedLoadError:
+                continue
+
+    async def get_async(self, provider: ChoiceProvider) -> List[Any]:
+        """:meth:`get` for event loops: loads run in a worker thread."""
+        with self._lock:
+            choices = self._fresh(provider)
+        if choices is not None:
+            return choices
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get, provider)
+
+    def prefetch(self, provider: ChoiceProvider, executor: Executor) -> bool:
+        """Start loading the provider on `executor` unless cached or loading.
+
+        Returns:
+            True if a load was submitted
+        """
+        with self._lock:
+            if self._fresh(provider) is not None or provider in self._loading:
+                return False
+            future: "Future[List[Any]]" = Future()
+            self._loading[provider] = future
+        try:
+            executor.submit(self._load, provider, future)
+        except RuntimeError:
+            # Executor already shut down. Anyone already waiting on the
+            # future retries and loads the provider itself.
+            with self._lock:
+                del self._loading[provider]
+            future.set_exception(_AbandonedLoadError())
+            return False
+        return True
+
+    def _load(self, provider: ChoiceProvider, future: "Future[List[Any]]") -> None:
+        try:
+            choices = _call(provider)
+        except BaseException as exc:
+            with self._lock:
+                del self._loading[provider]
+            future.set_exception(exc)
+            return
+        expiry = float("inf") if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            del self._loading[provider]
+            self._entries[provider] = (expiry, choices)
+            self._entries.move_to_end(provider)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        future.set_result(choices)
+
+    def invalidate(self, provider: Optional[ChoiceProvider] = None) -> None:
+        """Drop one provider's cached choices, or all of them."""
+        with self._lock:
+            if provider is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(provider, None)
+
+
+# Shared by all components that do not pass their own `choice_cache`
+default_choice_cache = ChoiceCache()
+
+
+def _default_cache() -> ChoiceCache:
+    return default_choice_cache
+
+
+__all__ = [
+    "ChoiceCache",
+    "ChoiceProvider",
+    "default_choice_cache",
+    "is_choice_provider",
+]
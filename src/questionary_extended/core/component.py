@@ -6,9 +6,20 @@ maintaining full API compatibility while adding new capabilities.
 """
 
 import importlib
+import inspect
 import sys
+from functools import partial
 from types import SimpleNamespace
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple, Union
+
+from ..listview import is_questionary_factory, list_question, should_virtualize
+from .choices import (
+    ChoiceCache,
+    ChoiceProvider,
+    default_choice_cache,
+    is_choice_provider,
+)
+from .conditions import Condition, compile_condition
 
 # Backwards-compatible module-level attribute for tests that monkeypatch
 # the `questionary` module on this module.
@@ -35,6 +46,12 @@ except Exception:
     # patch the top-level module (sys.modules['questionary']).
     _default_questionary_placeholder = questionary
 
+try:
+    from .. import _runtime
+except Exception:
+    # Isolated module loads: skip the resolved-factory cache.
+    _runtime = None  # type: ignore[assignment]
+
 
 class Component:
     """
@@ -59,168 +76,184 @@ class Component:
         self.component_type = component_type
         self.config = kwargs
         self.when_condition: Optional[str] = kwargs.get("when")
+        # (when_condition, namespace, compiled) of the last compiled condition
+        self._condition_memo: Optional[Tuple[str, Optional[str], Condition]] = None
         self.validators: List[Callable[..., Any]] = []
+        choice_cache = kwargs.get("choice_cache")
+        self.choice_cache: ChoiceCache = (
+            default_choice_cache if choice_cache is None else choice_cache
+        )
+        # None: select/checkbox virtualize lists longer than VIRTUALIZE_THRESHOLD
+        self.virtualize: Optional[bool] = kwargs.get("virtualize")
 
         # Extract questionary-compatible config
         self.questionary_config = {
-            k: v for k, v in kwargs.items() if k not in ["when", "enhanced_validation"]
+            k: v
+            for k, v in kwargs.items()
+            if k not in ["when", "enhanced_validation", "choice_cache", "virtualize"]
         }
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Compiled conditions hold closures; receivers compile their own.
+        state = self.__dict__.copy()
+        state["_condition_memo"] = None
+        return state
+
     def add_validator(self, validator: Callable[..., Any]) -> None:
         """Add a validator function."""
         self.validators.append(validator)
 
-    def is_visible(self, state: Dict[str, Any]) -> bool:
+    @property
+    def namespace(self) -> Optional[str]:
+        """Assembly namespace of this component, if its name is namespaced."""
+        namespace, _, _ = self.name.rpartition(".")
+        return namespace or None
+
+    @property
+    def condition(self) -> Optional[Condition]:
+        """Compiled 'when' condition, or None for unconditional components."""
+        when = self.when_condition
+        if not when:
+            return None
+        # Kept on the component so visibility checks never depend on the
+        # module's bounded cache; recompiled if `when` or the name changes.
+        namespace = self.namespace
+        memo = getattr(self, "_condition_memo", None)
+        if memo is not None and memo[0] == when and memo[1] == namespace:
+            return memo[2]
+        condition = compile_condition(when, namespace)
+        self._condition_memo = (when, namespace, condition)
+        return condition
+
+    @property
+    def dependencies(self) -> FrozenSet[str]:
+        """State keys read by the 'when' condition."""
+        condition = self.condition
+        return condition.dependencies if condition is not None else frozenset()
+
+    def is_visible(self, state: Mapping[str, Any]) -> bool:
         """Check if component should be visible based on 'when' condition."""
         # Explicit visibility override (show/hide from assemblies)
         if hasattr(self, "visible"):
             return bool(self.visible)
 
-        if not self.when_condition:
-            return True
+        condition = self.condition
+        return True if condition is None else condition.evaluate(state)
 
-        # TODO: implement expression evaluation of `when` conditions safely
-        # For now, default to visible to avoid accidental hiding while the
-        # expression evaluator is implemented.
-        return True
+    @property
+    def choice_provider(self) -> Optional[Callable[[], Any]]:
+        """Callable given as ``choices``, or None for static choices."""
+        choices = self.questionary_config.get("choices")
+        return choices if is_choice_provider(choices) else None
 
-    def create_questionary_component(self) -> Any:
-        """Create the underlying questionary component."""
-        from typing import Callable as _Callable
-        # Resolution strategy (single-source-first): prefer the centralized
-        # runtime accessor so behavior is consistent with the repository-wide
-        # contract. The runtime accessor itself should consult sys.modules or
-        # an explicit test-installed object. If the accessor returns None,
-        # fall back to sys.modules/module-level/import as a last resort.
-        q = None
-        try:
-            _rt = importlib.import_module("questionary_extended._runtime")
-            q = _rt.get_questionary()
-        except Exception:
-            q = None
+    def resolve_choices(self) -> Optional[List[Any]]:
+        """Return the choices, calling (or reusing) a choice provider.
 
-        # If runtime accessor didn't supply a usable object, try sys.modules
-        # next (covers direct monkeypatch.setattr("questionary.x", ...)).
-        try:
-            if q is None:
-                q_sys = sys.modules.get("questionary")
-                if q_sys is not None:
-                    q = q_sys
-        except Exception:
-            pass
+        Returns:
+            Choice list, or None if the component has no ``choices``
+        """
+        provider = self.choice_provider
+        if provider is None:
+            return self.questionary_config.get("choices")
+        return self.choice_cache.get(provider)
+
+    async def resolve_choices_async(self) -> Optional[List[Any]]:
+        """Asynchronous :meth:`resolve_choices`; providers run off the loop."""
+        provider = self.choice_provider
+        if provider is None:
+            return self.questionary_config.get("choices")
+        return await self.choice_cache.get_async(provider)
+
+    def _validation_checks(self) -> List[Any]:
+        validate = self.questionary_config.get("validate")
+        return self.validators if validate is None else [validate, *self.validators]
+
+    @staticmethod
+    def _run_check(check: Any, value: Any) -> Any:
+        if hasattr(check, "validate"):
+            # Validator instances read `document.text`
+            text = value if isinstance(value, str) else str(value)
+            return check.validate(SimpleNamespace(text=text, cursor_position=len(text)))
+        return check(value)
+
+    @staticmethod
+    def _check_message(result: Any) -> Optional[str]:
+        if result is False:
+            return "Invalid input"
+        if isinstance(result, str):
+            return result
+        return None
+
+    def validate_answer(self, value: Any) -> Optional[str]:
+        """Validate an answer without rendering a prompt.
+
+        Applies the questionary-style ``validate`` option (a callable
+        returning True/False/message, or a Validator instance) followed by
+        validators registered with :meth:`add_validator`.
 
-        # Next prefer a module-level `questionary` attribute if present
-        # (covers tests that patch the module directly).
-        try:
-            if q is None:
-                m_q = globals().get("questionary", None)
-                if m_q is not None:
-                    q = m_q
-        except Exception:
-            pass
+        Args:
+            value: Candidate answer
 
-        # Last resort: import top-level module directly.
-        if q is None:
+        Returns:
+            Error message for the first failing validator, or None if valid
+
+        Raises:
+            RuntimeError: If a validator is a coroutine; use
+                :meth:`validate_answer_async` instead
+        """
+        for check in self._validation_checks():
             try:
-                q = importlib.import_module("questionary")
-            except Exception:
-                raise ImportError(
-                    "`questionary` is not available. In tests call setup_questionary_mocks() or set the runtime mock via questionary_extended._runtime.set_questionary_for_tests(mock)."
+                result = self._run_check(check, value)
+            except Exception as exc:
+                return str(getattr(exc, "message", None) or exc)
+            if inspect.isawaitable(result):
+                if inspect.iscoroutine(result):
+                    result.close()
+                raise RuntimeError(
+                    f"Validator for {self.name!r} is a coroutine; use validate_answer_async()"
                 )
-
-        # Prefer the first candidate that provides a callable factory for the
-        # requested component type. We search multiple candidates because
-        # tests may patch different module objects (module-level attr, the
-        # importable 'questionary' module, or the runtime accessor).
-        # Validate supported component types early so callers get a clear
-        # ValueError for unsupported types (matches existing tests).
-        supported = {"text", "select", "confirm", "password", "checkbox", "autocomplete", "path"}
-        if self.component_type not in supported:
-            raise ValueError(f"Unsupported component type: {self.component_type}")
-        candidates = []
-        # 1) runtime accessor (single source of truth)
-        try:
-            _rt = importlib.import_module("questionary_extended._runtime")
-            candidates.append(_rt.get_questionary())
-        except Exception:
-            candidates.append(None)
-
-        # 2) explicit top-level/importable module (sys.modules or import)
-        try:
-            import importlib as _il
-
-            q_imported = None
+            message = self._check_message(result)
+            if message is not None:
+                return message
+        return None
+
+    async def validate_answer_async(self, value: Any) -> Optional[str]:
+        """Asynchronous :meth:`validate_answer`; validators may be coroutines."""
+        for check in self._validation_checks():
             try:
-                q_imported = _il.import_module("questionary")
-            except Exception:
-                q_imported = sys.modules.get("questionary")
-            candidates.append(q_imported)
-        except Exception:
-            candidates.append(sys.modules.get("questionary"))
-
-        # 3) module-level attribute (may be placeholder or patched)
-        candidates.append(globals().get("questionary", None))
-
-        # Prefer module-level patches when present (tests often patch
-        # `src.questionary_extended.core.component.questionary.<name>`).
-        component_func = None
-        mod_q = globals().get("questionary", None)
-        try:
-            attr_mod = getattr(mod_q, self.component_type, None) if mod_q is not None else None
-        except Exception:
-            attr_mod = None
-
-        # Runtime accessor candidate (already at candidates[0])
-        try:
-            rt_candidate = candidates[0]
-        except Exception:
-            rt_candidate = None
-        try:
-            attr_rt = getattr(rt_candidate, self.component_type, None) if rt_candidate is not None else None
-        except Exception:
-            attr_rt = None
+                result = self._run_check(check, value)
+                if inspect.isawaitable(result):
+                    result = await result
+            except Exception as exc:
+                return str(getattr(exc, "message", None) or exc)
+            message = self._check_message(result)
+            if message is not None:
+                return message
+        return None
 
-        # Imported/top-level candidate (candidates[1])
-        try:
-            imp_candidate = candidates[1]
-        except Exception:
-            imp_candidate = None
-        try:
-            attr_imp = getattr(imp_candidate, self.component_type, None) if imp_candidate is not None else None
-        except Exception:
-            attr_imp = None
-
-        def _is_valid_factory(f):
-            if not callable(f):
-                return False
-            if f is globals().get("_questionary_placeholder"):
-                return False
-            try:
-                modname = getattr(f, "__module__", "")
-                if modname.startswith("questionary_extended._questionary_proxy"):
-                    return False
-            except Exception:
-                pass
-            return True
-
-        # Selection priority: runtime accessor (single source) -> imported/top-level -> module-level
-        # Enforce the repository contract by preferring the runtime accessor when
-        # it is set. Fall back to the importable `questionary` module and then
-        # to any module-level patched attribute. This keeps a single canonical
-        # source while still allowing reasonable fallbacks for tests that patch
-        # other places.
-        if _is_valid_factory(attr_rt):
-            component_func = attr_rt
-        elif _is_valid_factory(attr_imp):
-            component_func = attr_imp
-        elif _is_valid_factory(attr_mod):
-            component_func = attr_mod
-
-        if component_func is None:
-            raise ValueError(f"Unsupported component type or missing factory: {self.component_type}")
+    def create_questionary_component(self) -> Any:
+        """Create the underlying questionary component."""
+        # Resolve first: scoped and test backends always get the prompt.
+        component_func = _resolve_factory(self.component_type)
+
+        config = self.questionary_config
+        if self.choice_provider is not None:
+            config = {**config, "choices": self.resolve_choices()}
+        if (
+            self.component_type in ("select", "checkbox")
+            and is_questionary_factory(component_func)
+            and should_virtualize(config.get("choices"), self.virtualize, config)
+        ):
+            component_func = partial(
+                list_question, multi=self.component_type == "checkbox"
+            )
+        if inspect.iscoroutinefunction(config.get("validate")):
+            # prompt_toolkit validates synchronously; coroutine validators
+            # are applied after the answer by the async bridge instead.
+            config = {k: v for k, v in config.items() if k != "validate"}
 
         try:
-            return component_func(**self.questionary_config)
+            return component_func(**config)
         except Exception as exc:
             # Some environments (CI, headless Windows) raise a
             # NoConsoleScreenBufferError from prompt_toolkit when a real
@@ -238,6 +271,194 @@ class Component:
             raise
 
 
+_SUPPORTED_TYPES = frozenset(
+    {"text", "select", "confirm", "password", "checkbox", "autocomplete", "path"}
+)
+
+
+def _probe_factory(component_type: str) -> Tuple[Any, Callable[..., Any]]:
+    """Locate the questionary factory for `component_type` (uncached).
+
+    Returns:
+        Tuple of (object the factory was read from, factory callable)
+    """
+    # Resolution strategy (single-source-first): prefer the centralized
+    # runtime accessor so behavior is consistent with the repository-wide
+    # contract. The runtime accessor itself should consult sys.modules or
+    # an explicit test-installed object. If the accessor returns None,
+    # fall back to sys.modules/module-level/import as a last resort.
+    q = None
+    try:
+        _rt = importlib.import_module("questionary_extended._runtime")
+        q = _rt.get_questionary()
+    except Exception:
+        q = None
+
+    # If runtime accessor didn't supply a usable object, try sys.modules
+    # next (covers direct monkeypatch.setattr("questionary.x", ...)).
+    try:
+        if q is None:
+            q_sys = sys.modules.get("questionary")
+            if q_sys is not None:
+                q = q_sys
+    except Exception:
+        pass
+
+    # Next prefer a module-level `questionary` attribute if present
+    # (covers tests that patch the module directly).
+    try:
+        if q is None:
+            m_q = globals().get("questionary", None)
+            if m_q is not None:
+                q = m_q
+    except Exception:
+        pass
+
+    # Last resort: import top-level module directly.
+    if q is None:
+        try:
+            q = importlib.import_module("questionary")
+        except Exception:
+            raise ImportError(
+                "`questionary` is not available. In tests call setup_questionary_mocks() or set the runtime mock via questionary_extended._runtime.set_questionary_for_tests(mock)."
+            )
+
+    # Prefer the first candidate that provides a callable factory for the
+    # requested component type. We search multiple candidates because
+    # tests may patch different module objects (module-level attr, the
+    # importable 'questionary' module, or the runtime accessor).
+    # Validate supported component types early so callers get a clear
+    # ValueError for unsupported types (matches existing tests).
+    if component_type not in _SUPPORTED_TYPES:
+        raise ValueError(f"Unsupported component type: {component_type}")
+    candidates = []
+    # 1) runtime accessor (single source of truth)
+    try:
+        _rt = importlib.import_module("questionary_extended._runtime")
+        candidates.append(_rt.get_questionary())
+    except Exception:
+        candidates.append(None)
+
+    # 2) explicit top-level/importable module (sys.modules or import)
+    try:
+        import importlib as _il
+
+        q_imported = None
+        try:
+            q_imported = _il.import_module("questionary")
+        except Exception:
+            q_imported = sys.modules.get("questionary")
+        candidates.append(q_imported)
+    except Exception:
+        candidates.append(sys.modules.get("questionary"))
+
+    # 3) module-level attribute (may be placeholder or patched)
+    candidates.append(globals().get("questionary", None))
+
+    # Prefer module-level patches when present (tests often patch
+    # `src.questionary_extended.core.component.questionary.<name>`).
+    component_func = None
+    mod_q = globals().get("questionary", None)
+    try:
+        attr_mod = getattr(mod_q, component_type, None) if mod_q is not None else None
+    except Exception:
+        attr_mod = None
+
+    # Runtime accessor candidate (already at candidates[0])
+    try:
+        rt_candidate = candidates[0]
+    except Exception:
+        rt_candidate = None
+    try:
+        attr_rt = getattr(rt_candidate, component_type, None) if rt_candidate is not None else None
+    except Exception:
+        attr_rt = None
+
+    # Imported/top-level candidate (candidates[1])
+    try:
+        imp_candidate = candidates[1]
+    except Exception:
+        imp_candidate = None
+    try:
+        attr_imp = getattr(imp_candidate, component_type, None) if imp_candidate is not None else None
+    except Exception:
+        attr_imp = None
+
+    def _is_valid_factory(f):
+        if not callable(f):
+            return False
+        if f is globals().get("_questionary_placeholder"):
+            return False
+        try:
+            modname = getattr(f, "__module__", "")
+            if modname.startswith("questionary_extended._questionary_proxy"):
+                return False
+        except Exception:
+            pass
+        return True
+
+    # Selection priority: runtime accessor (single source) -> imported/top-level -> module-level
+    # Enforce the repository contract by preferring the runtime accessor when
+    # it is set. Fall back to the importable `questionary` module and then
+    # to any module-level patched attribute. This keeps a single canonical
+    # source while still allowing reasonable fallbacks for tests that patch
+    # other places.
+    if _is_valid_factory(attr_rt):
+        component_func = attr_rt
+    elif _is_valid_factory(attr_imp):
+        component_func = attr_imp
+    elif _is_valid_factory(attr_mod):
+        component_func = attr_mod
+
+    if component_func is None:
+        raise ValueError(f"Unsupported component type or missing factory: {component_type}")
+
+    # Report which candidate supplied the factory so the cache can verify it
+    if component_func is attr_rt:
+        return rt_candidate, component_func
+    if component_func is attr_imp:
+        return imp_candidate, component_func
+    return mod_q, component_func
+
+
+# Resolved factories keyed by component type: (generation, source, factory).
+# An entry is valid while the runtime generation is unchanged (it is bumped
+# when the backend is swapped or proxy overrides change) and the source still
+# exposes the same factory (covers monkeypatching attributes in place).
+_FACTORY_CACHE: Dict[str, Tuple[int, Any, Callable[..., Any]]] = {}
+
+
+def _resolve_factory(component_type: str) -> Callable[..., Any]:
+    """Return the questionary factory for `component_type`, using the cache."""
+    if _runtime is not None:
+        # A backend scoped to this context (`_runtime.use_backend`) is
+        # authoritative and bypasses the process-wide cache entirely.
+        scoped = _runtime.get_scoped_backend()
+        if scoped is not None:
+            if component_type not in _SUPPORTED_TYPES:
+                raise ValueError(f"Unsupported component type: {component_type}")
+            factory = getattr(scoped, component_type, None)
+            if not callable(factory):
+                raise ValueError(
+                    f"Unsupported component type or missing factory: {component_type}"
+                )
+            return factory
+
+    cached = _FACTORY_CACHE.get(component_type)
+    if cached is not None and _runtime is not None:
+        generation, source, factory = cached
+        if (
+            generation == _runtime.get_generation()
+            and getattr(source, component_type, None) is factory
+        ):
+            return factory
+
+    source, factory = _probe_factory(component_type)
+    if _runtime is not None:
+        _FACTORY_CACHE[component_type] = (_runtime.get_generation(), source, factory)
+    return factory
+
+
 # Convenience wrapper functions matching questionary API
 def text(name: str, message: Optional[str] = None, **kwargs: Any) -> Component:
     """Create a text input component."""
@@ -249,10 +470,10 @@ def text(name: str, message: Optional[str] = None, **kwargs: Any) -> Component:
 def select(
     name: str,
     message: Optional[str] = None,
-    choices: Optional[List[str]] = None,
+    choices: Optional[Union[List[Any], ChoiceProvider]] = None,
     **kwargs: Any,
 ) -> Component:
-    """Create a selection component."""
+    """Create a selection component; `choices` may be a choice provider."""
     if message is None:
         message = f"Choose {name.replace('_', ' ')}:"
     if choices is None:
@@ -277,10 +498,10 @@ def password(name: str, message: Optional[str] = None, **kwargs: Any) -> Compone
 def checkbox(
     name: str,
     message: Optional[str] = None,
-    choices: Optional[List[str]] = None,
+    choices: Optional[Union[List[Any], ChoiceProvider]] = None,
     **kwargs: Any,
 ) -> Component:
-    """Create a checkbox component."""
+    """Create a checkbox component; `choices` may be a choice provider."""
     if message is None:
         message = f"Select {name.replace('_', ' ')}:"
     if choices is None:
@@ -291,10 +512,10 @@ def checkbox(
 def autocomplete(
     name: str,
     message: Optional[str] = None,
-    choices: Optional[List[str]] = None,
+    choices: Optional[Union[List[Any], ChoiceProvider]] = None,
     **kwargs: Any,
 ) -> Component:
-    """Create an autocomplete component."""
+    """Create an autocomplete component; `choices` may be a choice provider."""
     if message is None:
         message = f"Choose {name.replace('_', ' ')}:"
     if choices is None:
@@ -0,0 +1,379 @@
+"""
+Conditional visibility expressions for questionary-extended.
+
+Components accept ``when`` strings such as ``"app_type == 'web'"`` or
+``"web_config.framework == 'django' and not debug"``. This module compiles
+those strings into small evaluator closures:
+
+- Parsing happens once per expression string using :mod:`ast` and only a
+  restricted subset of Python expression syntax is accepted; compiled
+  conditions are kept in a bounded LRU cache
+- ``*`` may not build strings or sequences longer than
+  :data:`MAX_REPEAT_LENGTH`, and ``%`` is arithmetic only (no string
+  formatting)
+- No ``eval``/``exec`` is involved; evaluation walks precompiled closures
+- Every compiled condition exposes the state keys it reads so callers can
+  track dependencies
+"""
+
+import ast
+import operator
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional, Tuple
+
+Evaluator = Callable[[Mapping[str, Any]], Any]
+
+_MISSING = object()
+
+# Longest string/sequence a ``*`` in a condition may build
+MAX_REPEAT_LENGTH = 10_000
+
+# Compiled conditions kept by compile_condition
+CACHE_MAXSIZE = 1024
+
+
+def _multiply(left: Any, right: Any) -> Any:
+    # Sequence repetition is bounded so that a literal such as
+    # ``'a' * 1000000000000`` cannot exhaust memory.
+    if isinstance(left, int) and not isinstance(left, bool):
+        count, sequence = left, right
+    else:
+        count, sequence = right, left
+    if (
+        isinstance(count, int)
+        and isinstance(sequence, (str, bytes, tuple, list))
+        and len(sequence) * count > MAX_REPEAT_LENGTH
+    ):
+        raise OverflowError("sequence repetition in condition is too large")
+    return left * right
+
+
+def _modulo(left: Any, right: Any) -> Any:
+    # ``str % args`` formatting has no size bound ('%0999999999d' % 1
+    # builds a gigabyte), so ``%`` is arithmetic only.
+    if isinstance(left, (str, bytes)):
+        raise TypeError("string formatting is not allowed in conditions")
+    return left % right
+
+
+_COMPARE_OPS: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Is: operator.is_,
+    ast.IsNot: operator.is_not,
+    ast.In: lambda a, b: a in b,
+    ast.NotIn: lambda a, b: a not in b,
+}
+
+_BINARY_OPS: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: _multiply,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: _modulo,
+}
+
+_UNARY_OPS: Dict[type, Callable[[Any], Any]] = {
+    ast.Not: operator.not_,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+
+class ConditionError(ValueError):
+    """Raised when a ``when`` expression is malformed or not allowed."""
+
+
+class Condition:
+    """A compiled, reusable ``when`` expression.
+
+    Instances are immutable and shared between all components that use the
+    same expression within the same assembly namespace.
+    """
+
+    __slots__ = ("source", "namespace", "dependencies", "_evaluator")
+
+    def __init__(
+        self,
+        source: str,
+        namespace: Optional[str],
+        dependencies: FrozenSet[str],
+        evaluator: Evaluator,
+    ) -> None:
+        self.source = source
+        self.namespace = namespace
+        self.dependencies = dependencies
+        self._evaluator = evaluator
+
+    def evaluate(self, state: Mapping[str, Any]) -> bool:
+        """Evaluate the condition against flat (namespaced) page state.
+
+        Args:
+            state: Mapping with namespaced keys, e.g. ``PageState.view()``
+
+        Returns:
+            Truthiness of the expression. Operations that fail on the
+            values involved (e.g. ``port > 1024`` while ``port`` is still
+            unanswered) evaluate to False.
+        """
+        try:
+            return bool(self._evaluator(state))
+        except (TypeError, ArithmeticError):
+            return False
+
+    __call__ = evaluate
+
+    def __repr__(self) -> str:
+        return f"<Condition {self.source!r} namespace={self.namespace!r}>"
+
+
+class _Compiler:
+    """Translate a validated expression AST into nested closures."""
+
+    def __init__(self, namespace: Optional[str]) -> None:
+        self.prefix = f"{namespace}." if namespace else ""
+        self.dependencies: set = set()
+
+    def compile(self, node: ast.AST) -> Evaluator:
+        method = _NODE_COMPILERS.get(type(node))
+        if method is None:
+            raise ConditionError(
+                f"Unsupported syntax in condition: {type(node).__name__}"
+            )
+        return method(self, node)
+
+    # Leaves -------------------------------------------------------------
+
+    def _compile_constant(self, node: ast.Constant) -> Evaluator:
+        value = node.value
+        return lambda state: value
+
+    def _compile_name(self, node: ast.Name) -> Evaluator:
+        return self._lookup(self._keys_for(node.id))
+
+    def _compile_attribute(self, node: ast.Attribute) -> Evaluator:
+        # `assembly.field` (or deeper) names an absolute state key.
+        parts = [node.attr]
+        value = node.value
+        while isinstance(value, ast.Attribute):
+            parts.append(value.attr)
+            value = value.value
+        if not isinstance(value, ast.Name):
+            raise ConditionError("Attribute access is only allowed on state keys")
+        parts.append(value.id)
+        key = ".".join(reversed(parts))
+        return self._lookup((key,))
+
+    def _keys_for(self, name: str) -> Tuple[str, ...]:
+        # Bare names resolve to the component's own assembly first and then
+        # to a page-global key.
+        if self.prefix:
+            return (self.prefix + name, name)
+        return (name,)
+
+    def _lookup(self, keys: Tuple[str, ...]) -> Evaluator:
+        self.dependencies.update(keys)
+        if len(keys) == 1:
+            key = keys[0]
+            return lambda state: state.get(key)
+
+        local_key, global_key = keys
+
+        def lookup(state: Mapping[str, Any]) -> Any:
+            value = state.get(local_key, _MISSING)
+            if value is _MISSING:
+                return state.get(global_key)
+            return value
+
+        return lookup
+
+    # Containers ---------------------------------------------------------
+
+    def _compile_sequence(self, elts: Any, factory: Callable[..., Any]) -> Evaluator:
+        items = [self.compile(e) for e in elts]
+        if all(isinstance(e, ast.Constant) for e in elts):
+            constant = factory(e.value for e in elts)
+            return lambda state: constant
+        return lambda state: factory(item(state) for item in items)
+
+    def _compile_list(self, node: ast.List) -> Evaluator:
+        # Lists are only ever read, so a tuple is an equivalent and cheaper
+        # container.
+        return self._compile_sequence(node.elts, tuple)
+
+    def _compile_tuple(self, node: ast.Tuple) -> Evaluator:
+        return self._compile_sequence(node.elts, tuple)
+
+    def _compile_set(self, node: ast.Set) -> Evaluator:
+        return self._compile_sequence(node.elts, frozenset)
+
+    # Operators ----------------------------------------------------------
+
+    def _compile_bool_op(self, node: ast.BoolOp) -> Evaluator:
+        operands = tuple(self.compile(v) for v in node.values)
+
+        if isinstance(node.op, ast.And):
+
+            def evaluate_and(state: Mapping[str, Any]) -> Any:
+                result: Any = True
+                for operand in operands:
+                    result = operand(state)
+                    if not result:
+                        return result
+                return result
+
+            return evaluate_and
+
+        def evaluate_or(state: Mapping[str, Any]) -> Any:
+            result: Any = False
+            for operand in operands:
+                result = operand(state)
+                if result:
+                    return result
+            return result
+
+        return evaluate_or
+
+    def _compile_unary_op(self, node: ast.UnaryOp) -> Evaluator:
+        op = _UNARY_OPS.get(type(node.op))
+        if op is None:
+            raise ConditionError(
+                f"Unsupported operator in condition: {type(node.op).__name__}"
+            )
+        operand = self.compile(node.operand)
+        return lambda state: op(operand(state))
+
+    def _compile_bin_op(self, node: ast.BinOp) -> Evaluator:
+        op = _BINARY_OPS.get(type(node.op))
+        if op is None:
+            raise ConditionError(
+                f"Unsupported operator in condition: {type(node.op).__name__}"
+            )
+        if (
+            isinstance(node.op, ast.Mod)
+            and isinstance(node.left, ast.Constant)
+            and isinstance(node.left.value, (str, bytes))
+        ):
+            raise ConditionError(
+                "String formatting with % is not allowed in conditions"
+            )
+        left = self.compile(node.left)
+        right = self.compile(node.right)
+        if isinstance(node.left, ast.Constant) and isinstance(node.right, ast.Constant):
+            # Reject oversized literal repetition now rather than on every
+            # evaluation.
+            try:
+                op(node.left.value, node.right.value)
+            except OverflowError as exc:
+                raise ConditionError(f"Invalid condition: {exc}") from exc
+            except (TypeError, ArithmeticError):
+                pass
+        return lambda state: op(left(state), right(state))
+
+    def _compile_compare(self, node: ast.Compare) -> Evaluator:
+        ops = []
+        for op_node in node.ops:
+            op = _COMPARE_OPS.get(type(op_node))
+            if op is None:
+                raise ConditionError(
+                    f"Unsupported comparison in condition: {type(op_node).__name__}"
+                )
+            ops.append(op)
+        left = self.compile(node.left)
+        comparators = [self.compile(c) for c in node.comparators]
+
+        if len(ops) == 1:
+            op, right = ops[0], comparators[0]
+            return lambda state: op(left(state), right(state))
+
+        pairs = tuple(zip(ops, comparators))
+
+        def compare_chain(state: Mapping[str, Any]) -> bool:
+            current = left(state)
+            for op, comparator in pairs:
+                following = comparator(state)
+                if not op(current, following):
+                    return False
+                current = following
+            return True
+
+        return compare_chain
+
+    def _compile_if_exp(self, node: ast.IfExp) -> Evaluator:
+        test = self.compile(node.test)
+        body = self.compile(node.body)
+        orelse = self.compile(node.orelse)
+        return lambda state: body(state) if test(state) else orelse(state)
+
+
+_NODE_COMPILERS: Dict[type, Callable[[_Compiler, Any], Evaluator]] = {
+    ast.Constant: _Compiler._compile_constant,
+    ast.Name: _Compiler._compile_name,
+    ast.Attribute: _Compiler._compile_attribute,
+    ast.List: _Compiler._compile_list,
+    ast.Tuple: _Compiler._compile_tuple,
+    ast.Set: _Compiler._compile_set,
+    ast.BoolOp: _Compiler._compile_bool_op,
+    ast.UnaryOp: _Compiler._compile_unary_op,
+    ast.BinOp: _Compiler._compile_bin_op,
+    ast.Compare: _Compiler._compile_compare,
+    ast.IfExp: _Compiler._compile_if_exp,
+}
+
+# (expression, namespace) -> condition, least recently used first
+_CACHE: "OrderedDict[Tuple[str, Optional[str]], Condition]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def compile_condition(expression: str, namespace: Optional[str] = None) -> Condition:
+    """Compile a ``when`` expression, reusing a cached result when possible.
+
+    Args:
+        expression: Condition source, e.g. ``"app_type == 'web'"``
+        namespace: Assembly namespace used to resolve bare names; a bare
+            ``field`` reads ``namespace.field`` before the global ``field``
+
+    Returns:
+        Compiled :class:`Condition`
+
+    Raises:
+        ConditionError: If the expression is not valid or uses syntax
+            outside the allowed subset (calls, subscripts, lambdas, ...)
+    """
+    cache_key = (expression, namespace)
+    with _CACHE_LOCK:
+        condition = _CACHE.get(cache_key)
+        if condition is not None:
+            _CACHE.move_to_end(cache_key)
+            return condition
+
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as exc:
+        raise ConditionError(f"Invalid condition {expression!r}: {exc.msg}") from exc
+
+    compiler = _Compiler(namespace)
+    evaluator = compiler.compile(tree.body)
+    condition = Condition(
+        expression, namespace, frozenset(compiler.dependencies), evaluator
+    )
+    with _CACHE_LOCK:
+        _CACHE[cache_key] = condition
+        while len(_CACHE) > CACHE_MAXSIZE:
+            _CACHE.popitem(last=False)
+    return condition
+
+
+def clear_condition_cache() -> None:
+    """Drop all cached compiled conditions."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+__all__ = ["Condition", "ConditionError", "compile_condition", "clear_condition_cache"]
@@ -0,0 +1,254 @@
+"""
+Write-ahead journal for questionary-extended page state.
+
+A :class:`StateJournal` records every PageState change to an append-only
+JSONL file so a dropped session can resume where it stopped:
+
+- One record per ``set``/``delete``, buffered in memory and written by a
+  background thread (group commit); writes never wait for the disk
+- The file is flushed and fsynced every ``fsync_interval`` seconds, or on
+  every write when the interval is ``0``
+- Every ``compact_every`` records the journal is folded into a snapshot
+  file and truncated, keeping it bounded
+- A torn trailing record (crash mid-write) is ignored and cut off on reopen
+
+Values must be JSON-serializable, which holds for all questionary answers.
+A value that is not is skipped and the error is raised from :meth:`close`.
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .state import PageState
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+_DELETED = object()
+
+
+def _read_snapshot(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, encoding="utf-8") as handle:
+            return dict(json.load(handle)["state"])
+    except FileNotFoundError:
+        return {}
+
+
+def _read_journal(path: str, state: Dict[str, Any]) -> int:
+    """Apply journal records to `state`; return the end of the valid prefix."""
+    offset = 0
+    try:
+        handle = open(path, "rb")
+    except FileNotFoundError:
+        return 0
+    with handle:
+        for line in handle:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            if "x" in record:
+                state.pop(record["k"], None)
+            else:
+                state[record["k"]] = record["v"]
+            offset += len(line)
+    return offset
+
+
+class StateJournal:
+    """Append-only journal of PageState changes.
+
+    Args:
+        path: Journal file; the snapshot is kept next to it as
+            ``<path>.snapshot``
+        fsync_interval: Seconds between group commits; ``0`` commits
+            synchronously on every change
+        compact_every: Records written between compactions
+
+    Example::
+
+        with StateJournal("wizard.journal") as journal:
+            journal.attach(page.state)  # replays earlier answers
+            ...
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        fsync_interval: float = 0.5,
+        compact_every: int = 1000,
+    ) -> None:
+        if fsync_interval < 0:
+            raise ValueError("fsync_interval must not be negative")
+        if compact_every < 1:
+            raise ValueError("compact_every must be at least 1")
+        self.path = os.fspath(path)
+        self.snapshot_path = self.path + ".snapshot"
+        self.fsync_interval = fsync_interval
+        self.compact_every = compact_every
+
+        self._state: Optional[PageState] = None
+        self._pending: List[Tuple[str, Any]] = []
+        self._pending_lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._file: Any = None
+        # Journaled state as of the last commit, used to write snapshots
+        # without reading the live PageState from the writer thread.
+        self._committed: Dict[str, Any] = {}
+        self._since_compaction = 0
+        self._error: Optional[Exception] = None
+
+    def __enter__(self) -> "StateJournal":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def load(self) -> Dict[str, Any]:
+        """Return the state recorded on disk (snapshot plus journal)."""
+        state = _read_snapshot(self.snapshot_path)
+        _read_journal(self.path, state)
+        return state
+
+    def attach(self, state: PageState) -> None:
+        """Replay the recorded state into `state` and journal its changes.
+
+        Replayed values are written without notifying watchers, so no
+        ``on_change`` handlers fire for answers given in an earlier session.
+
+        Args:
+            state: PageState to restore and record
+        """
+        if self._state is not None:
+            raise RuntimeError("journal is already attached")
+
+        recorded = _read_snapshot(self.snapshot_path)
+        valid_end = _read_journal(self.path, recorded)
+        state._load(recorded)
+        self._committed = recorded
+        self._since_compaction = 0
+
+        self._file = open(self.path, "ab")
+        # Drop a torn record left by a crash so new records start cleanly.
+        self._file.truncate(valid_end)
+        self._state = state
+        state.watch(self._on_change)
+        if self.fsync_interval > 0:
+            self._thread = threading.Thread(
+                target=self._run, name="questionary-extended-journal", daemon=True
+            )
+            self._thread.start()
+
+    def _on_change(self, key: str) -> None:
+        state = self._state
+        assert state is not None
+        # Stored values only; computed entries are derived again on replay.
+        value = state._flat.get(key, _DELETED)
+        if value is _DELETED and state.is_computed(key):
+            return
+        with self._pending_lock:
+            self._pending.append((key, value))
+        if self._thread is None:
+            self.flush()
+
+    def _run(self) -> None:
+        while not self._closed.is_set():
+            self._wake.wait(self.fsync_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        """Write, flush and fsync all buffered records now."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        with self._io_lock:
+            if self._file is None or not pending:
+                return
+            lines = []
+            for key, value in pending:
+                if value is _DELETED:
+                    record: Dict[str, Any] = {"k": key, "x": 1}
+                else:
+                    record = {"k": key, "v": value}
+                try:
+                    line = json.dumps(record, separators=(",", ":"))
+                except (TypeError, ValueError) as e:
+                    # Keep journaling the other keys; report on close().
+                    self._error = self._error or e
+                    continue
+                if value is _DELETED:
+                    self._committed.pop(key, None)
+                else:
+                    self._committed[key] = value
+                lines.append(line + "\n")
+            self._file.write("".join(lines).encode("utf-8"))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._since_compaction += len(lines)
+            if self._since_compaction >= self.compact_every:
+                self._compact()
+
+    def compact(self) -> None:
+        """Fold the journal into the snapshot file and truncate it."""
+        self.flush()
+        with self._io_lock:
+            if self._file is not None:
+                self._compact()
+
+    def _compact(self) -> None:
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump({"state": self._committed}, handle, separators=(",", ":"))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        # A crash before the truncation only means replaying records the
+        # snapshot already contains, which yields the same state.
+        self._file.truncate(0)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._since_compaction = 0
+
+    def close(self) -> None:
+        """Commit outstanding records and stop journaling.
+
+        Raises:
+            TypeError: If a recorded value could not be serialized
+        """
+        if self._state is not None:
+            self._state.unwatch(self._on_change)
+        self._closed.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+        with self._io_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        self._state = None
+        error, self._error = self._error, None
+        if error is not None:
+            raise TypeError(f"journal could not record a value: {error}") from error
+
+    def discard(self) -> None:
+        """Close the journal and delete its files, e.g. after completion."""
+        try:
+            self.close()
+        finally:
+            for path in (self.path, self.snapshot_path):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+
+__all__ = ["StateJournal"]
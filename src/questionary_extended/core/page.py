@@ -5,8 +5,9 @@ The Page class serves as the top-level container for complex multi-component UIs
 providing state management, navigation, and orchestration of Cards and Assemblies.
 """
 
-from typing import TYPE_CHECKING, Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from .plan import ComponentList, PagePlan, compile_plan
 from .state import PageState
 
 if TYPE_CHECKING:
@@ -32,8 +33,36 @@ class Page:
             title: Optional page title for display
         """
         self.title = title
-        self.components: List[Any] = []
+        self.components: List[Any] = ComponentList(self)
         self.state = PageState()
+        # Bumped on any change to the component tree; see plan()
+        self.version = 0
+        self._plan: Optional[PagePlan] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The cached plan is rebuilt on demand after unpickling.
+        data = self.__dict__.copy()
+        data["_plan"] = None
+        return data
+
+    def _touch(self) -> None:
+        """Record a structural change, invalidating the cached plan."""
+        self.version += 1
+
+    def plan(self) -> PagePlan:
+        """Return the compiled execution plan for this page.
+
+        The plan is cached and rebuilt only when the page, or any of its
+        Cards or Assemblies, has changed since it was compiled.
+
+        Returns:
+            Flat, ordered PagePlan of this page's components
+        """
+        plan = self._plan
+        if plan is None or plan.version != self.version:
+            plan = compile_plan(self.components, self.version)
+            self._plan = plan
+        return plan
 
     def card(self, title: str, **kwargs: Any) -> "Card":
         """Add a Card for visual grouping of components.
@@ -0,0 +1,289 @@
+"""
+Persistent (immutable) mapping for questionary-extended state history.
+
+:class:`PersistentMap` is a hash array mapped trie (HAMT). Updates return a
+new map and copy only the nodes on the path to the changed key, so:
+
+- ``set``/``delete`` cost O(log32 n) time and memory
+- Every older map stays valid and shares all unchanged nodes with newer
+  ones, which makes keeping thousands of versions cheap
+- :meth:`PersistentMap.diff` skips shared subtrees and so costs roughly
+  O(changes * log n) between related versions
+
+Keys must be hashable; values are compared by identity when diffing.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+# 64-bit hashes are exhausted after 13 levels; deeper keys share a
+# collision node.
+_MAX_SHIFT = 64
+_HASH_MASK = (1 << 64) - 1
+
+_MISSING = object()
+
+Leaf = Tuple[Any, Any]
+
+
+def _hash(key: Any) -> int:
+    return hash(key) & _HASH_MASK
+
+
+def _index(bitmap: int, bit: int) -> int:
+    return bin(bitmap & (bit - 1)).count("1")
+
+
+class _Node:
+    """Bitmap-indexed trie node; slots hold leaves or child nodes."""
+
+    __slots__ = ("bitmap", "slots")
+
+    def __init__(self, bitmap: int, slots: Tuple[Any, ...]) -> None:
+        self.bitmap = bitmap
+        self.slots = slots
+
+
+class _Collision:
+    """Leaves whose hashes are identical in all 64 bits."""
+
+    __slots__ = ("leaves",)
+
+    def __init__(self, leaves: Tuple[Leaf, ...]) -> None:
+        self.leaves = leaves
+
+
+_EMPTY_NODE = _Node(0, ())
+
+
+def _items(slot: Any) -> Iterator[Leaf]:
+    if type(slot) is tuple:
+        yield slot
+    elif type(slot) is _Collision:
+        yield from slot.leaves
+    else:
+        for child in slot.slots:
+            yield from _items(child)
+
+
+def _get(node: Any, key: Any, h: int) -> Any:
+    shift = 0
+    while True:
+        if type(node) is _Collision:
+            for leaf in node.leaves:
+                if leaf[0] == key:
+                    return leaf[1]
+            return _MISSING
+        bit = 1 << ((h >> shift) & _MASK)
+        if not node.bitmap & bit:
+            return _MISSING
+        slot = node.slots[_index(node.bitmap, bit)]
+        if type(slot) is tuple:
+            return slot[1] if slot[0] == key else _MISSING
+        node = slot
+        shift += _BITS
+
+
+def _pair(first: Leaf, second: Leaf, h2: int, shift: int) -> Any:
+    """Subtree holding two leaves with different keys."""
+    if shift >= _MAX_SHIFT:
+        return _Collision((first, second))
+    h1 = _hash(first[0])
+    i1 = (h1 >> shift) & _MASK
+    i2 = (h2 >> shift) & _MASK
+    if i1 == i2:
+        return _Node(1 << i1, (_pair(first, second, h2, shift + _BITS),))
+    slots = (first, second) if i1 < i2 else (second, first)
+    return _Node((1 << i1) | (1 << i2), slots)
+
+
+def _set(node: Any, key: Any, value: Any, h: int, shift: int) -> Tuple[Any, bool]:
+    """Return (new node, whether a key was added)."""
+    if type(node) is _Collision:
+        leaves = node.leaves
+        for i, leaf in enumerate(leaves):
+            if leaf[0] == key:
+                if leaf[1] is value:
+                    return node, False
+                return _Collision(leaves[:i] + ((key, value),) + leaves[i + 1 :]), False
+        return _Collision(leaves + ((key, value),)), True
+
+    bit = 1 << ((h >> shift) & _MASK)
+    idx = _index(node.bitmap, bit)
+    slots = node.slots
+    if not node.bitmap & bit:
+        return (
+            _Node(node.bitmap | bit, slots[:idx] + ((key, value),) + slots[idx:]),
+            True,
+        )
+
+    slot = slots[idx]
+    added = False
+    if type(slot) is tuple:
+        if slot[0] == key:
+            if slot[1] is value:
+                return node, False
+            new_slot: Any = (key, value)
+        else:
+            new_slot = _pair(slot, (key, value), h, shift + _BITS)
+            added = True
+    else:
+        new_slot, added = _set(slot, key, value, h, shift + _BITS)
+        if new_slot is slot:
+            return node, False
+    return _Node(node.bitmap, slots[:idx] + (new_slot,) + slots[idx + 1 :]), added
+
+
+def _delete(node: Any, key: Any, h: int, shift: int) -> Any:
+    """Return the node without `key`: the same node if absent, None if empty."""
+    if type(node) is _Collision:
+        leaves = tuple(leaf for leaf in node.leaves if leaf[0] != key)
+        if len(leaves) == len(node.leaves):
+            return node
+        if len(leaves) == 1:
+            # Let the parent inline the remaining leaf.
+            return _Node(1, leaves)
+        return _Collision(leaves)
+
+    bit = 1 << ((h >> shift) & _MASK)
+    if not node.bitmap & bit:
+        return node
+    idx = _index(node.bitmap, bit)
+    slots = node.slots
+    slot = slots[idx]
+    if type(slot) is tuple:
+        if slot[0] != key:
+            return node
+        new_slot = None
+    else:
+        new_slot = _delete(slot, key, h, shift + _BITS)
+        if new_slot is slot:
+            return node
+        if (
+            type(new_slot) is _Node
+            and len(new_slot.slots) == 1
+            and type(new_slot.slots[0]) is tuple
+        ):
+            new_slot = new_slot.slots[0]
+
+    if new_slot is None:
+        if node.bitmap == bit:
+            return None
+        return _Node(node.bitmap & ~bit, slots[:idx] + slots[idx + 1 :])
+    return _Node(node.bitmap, slots[:idx] + (new_slot,) + slots[idx + 1 :])
+
+
+def _diff(a: Any, b: Any) -> Iterator[Any]:
+    """Yield keys whose presence or value differs between two subtrees."""
+    if a is b:
+        return
+    if type(a) is _Node and type(b) is _Node:
+        a_slots, b_slots = a.slots, b.slots
+        a_idx = b_idx = 0
+        combined = a.bitmap | b.bitmap
+        while combined:
+            bit = combined & -combined
+            combined ^= bit
+            sa = sb = None
+            if a.bitmap & bit:
+                sa = a_slots[a_idx]
+                a_idx += 1
+            if b.bitmap & bit:
+                sb = b_slots[b_idx]
+                b_idx += 1
+            if sa is sb:
+                continue
+            if sa is None:
+                for leaf in _items(sb):
+                    yield leaf[0]
+            elif sb is None:
+                for leaf in _items(sa):
+                    yield leaf[0]
+            else:
+                yield from _diff(sa, sb)
+        return
+
+    # Leaves, collisions or mixed shapes: compare the (small) subtrees.
+    left: Dict[Any, Any] = dict(_items(a))
+    right: Dict[Any, Any] = dict(_items(b))
+    for key, value in left.items():
+        if right.get(key, _MISSING) is not value:
+            yield key
+    for key in right:
+        if key not in left:
+            yield key
+
+
+class PersistentMap(Mapping):  # type: ignore[type-arg]
+    """Immutable mapping with cheap, structure-sharing updates."""
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, items: Optional[Iterable[Tuple[Any, Any]]] = None) -> None:
+        root: Any = _EMPTY_NODE
+        size = 0
+        for key, value in items or ():
+            root, added = _set(root, key, value, _hash(key), 0)
+            size += added
+        self._root = root
+        self._size = size
+
+    @classmethod
+    def _make(cls, root: Any, size: int) -> "PersistentMap":
+        instance = cls.__new__(cls)
+        instance._root = root
+        instance._size = size
+        return instance
+
+    def __reduce__(self) -> Any:
+        # String hashes differ between processes, so rebuild from items.
+        return (type(self), (list(self.items()),))
+
+    def __getitem__(self, key: Any) -> Any:
+        value = _get(self._root, key, _hash(key))
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = _get(self._root, key, _hash(key))
+        return default if value is _MISSING else value
+
+    def __contains__(self, key: Any) -> bool:
+        return _get(self._root, key, _hash(key)) is not _MISSING
+
+    def __iter__(self) -> Iterator[Any]:
+        for leaf in _items(self._root):
+            yield leaf[0]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"PersistentMap({dict(_items(self._root))!r})"
+
+    def set(self, key: Any, value: Any) -> "PersistentMap":
+        """Return a map with `key` bound to `value`."""
+        root, added = _set(self._root, key, value, _hash(key), 0)
+        if root is self._root:
+            return self
+        return self._make(root, self._size + added)
+
+    def delete(self, key: Any) -> "PersistentMap":
+        """Return a map without `key`; missing keys are ignored."""
+        root = _delete(self._root, key, _hash(key), 0)
+        if root is self._root:
+            return self
+        return self._make(_EMPTY_NODE if root is None else root, self._size - 1)
+
+    def diff(self, other: "PersistentMap") -> Iterator[Any]:
+        """Yield keys that were added, removed or rebound between two maps.
+
+        Subtrees shared by both maps are skipped without being visited.
+        """
+        return _diff(self._root, other._root)
+
+
+__all__ = ["PersistentMap"]
@@ -0,0 +1,271 @@
+"""
+Compiled execution plans for questionary-extended pages.
+
+Walking a Page -> Card/Assembly -> Component tree with duck-typing probes on
+every run is wasted work when the same page definition is executed many
+times. A :class:`PagePlan` is the flattened, immutable result of that walk:
+
+- Ordered component records with precomputed names, namespaces and
+  prompt factories
+- A reverse index from state key to the components whose `when` reads it
+- Assembly ``on_change`` handlers indexed by namespaced key
+- Assembly computed fields, installed into the state of every run
+
+Containers track their own mutations with a version counter (see
+:class:`ComponentList`), so a cached plan is reused until the tree changes.
+"""
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+ChangeHandler = Tuple[Callable[..., Any], Any]
+ComputedSpec = Tuple[Callable[..., Any], Tuple[str, ...]]
+
+
+class ComponentList(list):  # type: ignore[type-arg]
+    """List of child components that reports mutations to its owner.
+
+    Every mutating operation calls ``owner._touch()`` so cached plans are
+    invalidated even when callers append to ``container.components``
+    directly.
+    """
+
+    def __init__(self, owner: Any, items: Iterable[Any] = ()) -> None:
+        super().__init__(items)
+        self._owner = owner
+
+    def __reduce__(self) -> Any:
+        # Restore the owner before the items so mutators never run ownerless.
+        return (type(self), (self._owner, list(self)))
+
+    def _changed(self) -> None:
+        self._owner._touch()
+
+    def append(self, item: Any) -> None:
+        super().append(item)
+        self._changed()
+
+    def extend(self, items: Iterable[Any]) -> None:
+        super().extend(items)
+        self._changed()
+
+    def insert(self, index: Any, item: Any) -> None:
+        super().insert(index, item)
+        self._changed()
+
+    def remove(self, item: Any) -> None:
+        super().remove(item)
+        self._changed()
+
+    def pop(self, index: Any = -1) -> Any:
+        item = super().pop(index)
+        self._changed()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, items: Iterable[Any]) -> "ComponentList":
+        super().__iadd__(items)
+        self._changed()
+        return self
+
+
+@dataclass(frozen=True)
+class PlanEntry:
+    """One component of a compiled page plan."""
+
+    component: Any
+    name: str
+    namespace: Optional[str]
+    component_type: Optional[str]
+    # None when the component does not declare its `when` dependencies
+    dependencies: Optional[FrozenSet[str]]
+    create: Callable[[], Any]
+
+
+@dataclass(frozen=True)
+class PagePlan:
+    """Flat, ordered and immutable execution plan for a page tree."""
+
+    entries: Tuple[PlanEntry, ...]
+    dependents: Mapping[str, Tuple[int, ...]]
+    change_handlers: Mapping[str, Tuple[ChangeHandler, ...]]
+    version: int = 0
+    computed: Mapping[str, ComputedSpec] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+    def __iter__(self) -> Iterator[PlanEntry]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def install_computed(self, state: Any) -> None:
+        """Register the plan's computed fields on `state` (a PageState).
+
+        Keys the state already computes (e.g. the page's own state) are
+        left as they are.
+        """
+        for key, (func, depends_on) in self.computed.items():
+            if not state.is_computed(key):
+                state.add_computed(key, func, depends_on)
+
+
+def _is_component(item: Any) -> bool:
+    # Prefer duck-typing over strict isinstance checks so tests that load
+    # modules in isolation (file-based imports) still work when objects
+    # implement the expected interface.
+    return hasattr(item, "create_questionary_component") and hasattr(item, "name")
+
+
+def walk_components(items: Iterable[Any]) -> Iterator[Any]:
+    """Yield Component instances from nested Card/Assembly/component containers."""
+    for item in items:
+        if _is_component(item):
+            yield item
+            continue
+
+        # Container-like: object that exposes a `components` attribute
+        comps = getattr(item, "components", None)
+        if comps is None:
+            # Unknown/unsupported item: ignore
+            continue
+
+        yield from walk_components(comps)
+
+
+def _collect_change_handlers(
+    items: Iterable[Any], index: Dict[str, List[ChangeHandler]]
+) -> None:
+    for item in items:
+        handlers = getattr(item, "event_handlers", None)
+        if handlers:
+            for entry in handlers.get("change", []):
+                if not isinstance(entry, tuple):
+                    continue
+                field, handler = entry
+                key = field if "." in field else f"{item.name}.{field}"
+                index.setdefault(key, []).append((handler, item))
+        comps = getattr(item, "components", None)
+        if comps and not _is_component(item):
+            _collect_change_handlers(comps, index)
+
+
+def _collect_computed(items: Iterable[Any], index: Dict[str, ComputedSpec]) -> None:
+    for item in items:
+        if _is_component(item):
+            continue
+        index.update(getattr(item, "computed_fields", None) or {})
+        comps = getattr(item, "components", None)
+        if comps:
+            _collect_computed(comps, index)
+
+
+def compile_plan(items: Iterable[Any], version: int = 0) -> PagePlan:
+    """Flatten a component tree into a :class:`PagePlan`.
+
+    Args:
+        items: Root items, typically ``Page.components``
+        version: Version of the owning container the plan was built from
+
+    Returns:
+        Compiled plan
+    """
+    items = list(items)
+    entries: List[PlanEntry] = []
+    dependents: Dict[str, List[int]] = {}
+
+    for index, component in enumerate(walk_components(items)):
+        name = component.name
+        namespace, _, _ = name.rpartition(".")
+        try:
+            dependencies = getattr(component, "dependencies", None)
+        except Exception:
+            # Malformed `when`: leave it to run-time evaluation, which
+            # treats errors as visible.
+            dependencies = None
+        if dependencies is not None:
+            dependencies = frozenset(dependencies)
+            for key in dependencies:
+                dependents.setdefault(key, []).append(index)
+        entries.append(
+            PlanEntry(
+                component=component,
+                name=name,
+                namespace=namespace or None,
+                component_type=getattr(component, "component_type", None),
+                dependencies=dependencies,
+                create=component.create_questionary_component,
+            )
+        )
+
+    handlers: Dict[str, List[ChangeHandler]] = {}
+    _collect_change_handlers(items, handlers)
+    computed: Dict[str, ComputedSpec] = {}
+    _collect_computed(items, computed)
+
+    return PagePlan(
+        entries=tuple(entries),
+        dependents=MappingProxyType(
+            {key: tuple(idx) for key, idx in dependents.items()}
+        ),
+        change_handlers=MappingProxyType(
+            {key: tuple(h) for key, h in handlers.items()}
+        ),
+        version=version,
+        computed=MappingProxyType(computed),
+    )
+
+
+def plan_for(page: Any) -> PagePlan:
+    """Return the plan for a page, a plan, or a list of components.
+
+    Pages (and other containers with a ``plan()`` method) reuse their
+    cached plan; plain component lists are compiled.
+    """
+    if isinstance(page, PagePlan):
+        return page
+    if hasattr(page, "plan"):
+        return page.plan()
+    return compile_plan(page)
+
+
+__all__ = [
+    "ComponentList",
+    "PagePlan",
+    "PlanEntry",
+    "compile_plan",
+    "plan_for",
+    "walk_components",
+]
@@ -0,0 +1,330 @@
+"""
+Shared-memory page state for questionary-extended.
+
+:class:`SharedPageState` publishes its stored keys into a
+:mod:`multiprocessing.shared_memory` segment so worker processes can read
+the live form state through a :class:`SharedStateReader`:
+
+- Each :meth:`~SharedPageState.commit` (the bridge calls it after every
+  answer) writes a complete image of the state into one of two slots
+- A sequence counter works as a seqlock: it is odd while the writer
+  publishes, so readers retry instead of seeing a torn image
+- The image is a small marshalled index of ``(key, kind, offset, length)``
+  entries followed by the raw value bytes; a reader decodes the index
+  once per snapshot and each value only when it is read
+- ``bytes``-like values and NumPy arrays are returned as read-only views of
+  the segment (zero-copy); strings are decoded from UTF-8 and other values
+  from :mod:`marshal`, falling back to :mod:`pickle` only for values
+  marshal cannot represent
+
+Memory layout::
+
+    header | slot 0 | slot 1
+    header = magic, sequence, active slot, slot capacity, index length,
+             data length
+    slot   = marshalled index | value bytes
+
+A snapshot stays readable until the writer starts reusing its slot, i.e.
+during the next publish and until the one after it begins.
+"""
+
+import marshal
+import pickle
+import struct
+import time
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from .state import PageState
+
+_MAGIC = b"QXS1"
+# magic, sequence, active slot, slot capacity, index length, data length
+_HEADER = struct.Struct("<4s4xQQQQQ")
+_SEQ = struct.Struct("<Q")
+_SEQ_OFFSET = 8
+
+# Value kinds in the index
+_BYTES = 0
+_STR = 1
+_MARSHAL = 2
+_PICKLE = 3
+_ARRAY = 4
+
+
+class StaleSnapshotError(RuntimeError):
+    """Raised when a snapshot's slot has been reused by the writer."""
+
+
+def _encode(value: Any) -> Tuple[int, Any, Any]:
+    """Return (kind, buffer, metadata) for a value."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return _BYTES, memoryview(value).cast("B"), None
+    if isinstance(value, str):
+        return _STR, value.encode("utf-8"), None
+    if hasattr(value, "__array_interface__") and hasattr(value, "flags"):
+        # NumPy array: raw buffer plus what np.frombuffer needs to rebuild it
+        if value.flags.c_contiguous and not value.dtype.hasobject:
+            return _ARRAY, memoryview(value).cast("B"), (value.dtype.str, value.shape)
+    try:
+        return _MARSHAL, marshal.dumps(value), None
+    except ValueError:
+        return _PICKLE, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), None
+
+
+class SharedPageState(PageState):
+    """PageState whose stored keys are published to shared memory.
+
+    Args:
+        name: Segment name (generated if omitted); pass it to
+            :class:`SharedStateReader` in the worker processes
+        capacity: Bytes available to one published image
+
+    The instance owns the segment: :meth:`close` (or leaving the ``with``
+    block) releases and unlinks it. Computed entries are not published.
+    """
+
+    def __init__(
+        self, name: Optional[str] = None, capacity: int = 16 * 1024 * 1024
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        super().__init__()
+        self.capacity = capacity
+        self._shm = shared_memory.SharedMemory(
+            name=name, create=True, size=_HEADER.size + 2 * capacity
+        )
+        self.name = self._shm.name
+        self._seq = 0
+        _HEADER.pack_into(self._shm.buf, 0, _MAGIC, 0, 0, capacity, 0, 0)
+        self.publish()
+
+    def __enter__(self) -> "SharedPageState":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        raise TypeError(
+            "SharedPageState owns its segment; give workers SharedStateReader(state.name)"
+        )
+
+    @property
+    def published_version(self) -> int:
+        """Number of images published so far (``SharedStateReader.version``)."""
+        return self._seq // 2
+
+    def commit(self) -> None:
+        """Publish the current state; called after each answer burst."""
+        self.publish()
+
+    def publish(self) -> None:
+        """Write the current stored state to shared memory.
+
+        Raises:
+            ValueError: If the encoded state exceeds ``capacity``; the
+                previously published image stays in place
+        """
+        index: List[Tuple[Any, ...]] = []
+        buffers = []
+        offset = 0
+        for key, value in self._flat.items():
+            kind, buffer, meta = _encode(value)
+            length = len(buffer)
+            index.append((key, kind, offset, length, meta))
+            buffers.append(buffer)
+            offset += length
+        encoded_index = marshal.dumps(index)
+        if len(encoded_index) + offset > self.capacity:
+            raise ValueError(
+                f"state needs {len(encoded_index) + offset} bytes; "
+                f"capacity is {self.capacity}"
+            )
+
+        buf = self._shm.buf
+        seq = self._seq
+        _SEQ.pack_into(buf, _SEQ_OFFSET, seq + 1)
+        # Publishes alternate slots, so snapshots of the previous image stay
+        # valid while this one is written.
+        slot = (seq // 2 + 1) % 2
+        start = _HEADER.size + slot * self.capacity
+        end = start + len(encoded_index)
+        buf[start:end] = encoded_index
+        for buffer in buffers:
+            buf[end : end + len(buffer)] = buffer
+            end += len(buffer)
+        _HEADER.pack_into(
+            buf, 0, _MAGIC, seq + 1, slot, self.capacity, len(encoded_index), offset
+        )
+        _SEQ.pack_into(buf, _SEQ_OFFSET, seq + 2)
+        self._seq = seq + 2
+
+    def close(self) -> None:
+        """Release and unlink the shared-memory segment."""
+        if self._shm is None:
+            return
+        shm, self._shm = self._shm, None
+        shm.close()
+        shm.unlink()
+
+
+class SharedStateSnapshot(Mapping):  # type: ignore[type-arg]
+    """Consistent, lazily decoded view of one published image.
+
+    Values are decoded when read. Bytes-like values and arrays are read-only
+    views of the shared segment: they are only guaranteed to hold this
+    snapshot's data while :attr:`valid` is true.
+    """
+
+    def __init__(
+        self,
+        reader: "SharedStateReader",
+        seq: int,
+        data_start: int,
+        index: Dict[str, Tuple[int, int, int, Any]],
+    ) -> None:
+        self._reader = reader
+        self.version = seq // 2
+        self._seq = seq
+        self._data_start = data_start
+        self._index = index
+
+    @property
+    def valid(self) -> bool:
+        """True until the writer begins overwriting this snapshot's slot."""
+        # The next publish uses the other slot; the one after that reuses
+        # ours and moves the sequence to seq + 3 before writing.
+        return self._reader._sequence() < self._seq + 3
+
+    def __getitem__(self, key: str) -> Any:
+        kind, offset, length, meta = self._index[key]
+        start = self._data_start + offset
+        view = self._reader._buf[start : start + length].toreadonly()
+        if kind == _BYTES:
+            value: Any = view
+        elif kind == _ARRAY:
+            import numpy as np
+
+            dtype, shape = meta
+            value = np.frombuffer(view, dtype=dtype).reshape(shape)
+        elif kind == _STR:
+            value = str(view, "utf-8")
+        elif kind == _MARSHAL:
+            value = marshal.loads(view)
+        else:
+            value = pickle.loads(view)
+        if not self.valid:
+            raise StaleSnapshotError(f"snapshot {self.version} was overwritten")
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(version={self.version}, keys={list(self._index)!r})"
+        )
+
+
+class SharedStateReader:
+    """Read access to a :class:`SharedPageState` from another process.
+
+    Args:
+        name: Segment name, ``SharedPageState.name``
+
+    Example::
+
+        with SharedStateReader(name) as reader:
+            state = reader.snapshot()
+            render(state["build.config"], state["build.assets"])
+    """
+
+    def __init__(self, name: str) -> None:
+        self._shm = _attach(name)
+        self._buf = self._shm.buf
+        self._last: Optional[SharedStateSnapshot] = None
+        if bytes(self._buf[:4]) != _MAGIC:
+            self.close()
+            raise ValueError(f"shared memory segment {name!r} holds no page state")
+
+    def __enter__(self) -> "SharedStateReader":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _sequence(self) -> int:
+        return _SEQ.unpack_from(self._buf, _SEQ_OFFSET)[0]
+
+    @property
+    def version(self) -> int:
+        """Version of the most recently published image."""
+        return self._sequence() // 2
+
+    def snapshot(self) -> SharedStateSnapshot:
+        """Return a consistent view of the latest published image.
+
+        The decoded index is reused until the writer publishes again.
+        """
+        while True:
+            seq = self._sequence()
+            if self._last is not None and self._last._seq == seq:
+                return self._last
+            if seq % 2:
+                # The writer is mid-publish; let it finish.
+                time.sleep(0)
+                continue
+            _, _, slot, capacity, index_length, _ = _HEADER.unpack_from(self._buf, 0)
+            start = _HEADER.size + slot * capacity
+            try:
+                entries = marshal.loads(self._buf[start : start + index_length])
+            except (EOFError, ValueError, TypeError):
+                entries = None
+            if self._sequence() == seq and entries is not None:
+                break
+        index = {
+            key: (kind, offset, length, meta)
+            for key, kind, offset, length, meta in entries
+        }
+        self._last = SharedStateSnapshot(self, seq, start + index_length, index)
+        return self._last
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Read one key from the latest image."""
+        snapshot = self.snapshot()
+        return snapshot[key] if key in snapshot else default
+
+    def close(self) -> None:
+        """Detach from the segment.
+
+        Views returned by snapshots must be released first.
+        """
+        if self._shm is None:
+            return
+        shm, self._shm = self._shm, None
+        self._last = None
+        shm.close()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        # Python 3.13+: readers must not track (and so unlink) the segment.
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    except TypeError:
+        # Older versions register it with the resource tracker, which is
+        # harmless for workers started by the owner: they share its tracker.
+        return shared_memory.SharedMemory(name=name)
+
+
+__all__ = [
+    "SharedPageState",
+    "SharedStateReader",
+    "SharedStateSnapshot",
+    "StaleSnapshotError",
+]
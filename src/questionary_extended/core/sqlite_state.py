@@ -0,0 +1,245 @@
+"""
+SQLite-backed page state for questionary-extended.
+
+Keeps many saved sessions (partially completed forms) in one database file
+using only the stdlib :mod:`sqlite3` module:
+
+- WAL journaling, so readers never block the writer
+- One row per (session, namespaced key), clustered on that primary key,
+  plus an index on (session, namespace) for per-assembly loads
+- :class:`SQLitePageState` is a PageState that loads an assembly namespace
+  only when it is first read, so opening one session among many is a
+  handful of index lookups rather than a full load
+- Writes are buffered and committed in one transaction per answer burst
+  (the bridge calls :meth:`PageState.commit` after each answer)
+
+Values are stored as JSON, which holds for all questionary answers.
+"""
+
+import json
+import os
+import sqlite3
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Union
+
+from .persistent import PersistentMap
+from .state import Items, PageState, StateColumns
+
+_DELETED = object()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS page_state (
+    session TEXT NOT NULL,
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (session, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS page_state_namespace
+    ON page_state (session, namespace);
+"""
+
+
+def _namespace(key: str) -> str:
+    # Global keys live in the empty namespace.
+    return key.split(".", 1)[0] if "." in key else ""
+
+
+class SQLiteStateStore:
+    """A database of saved page-state sessions.
+
+    Args:
+        path: Database file (``":memory:"`` for a private in-memory store)
+        batch_size: Pending writes that force a commit even mid-burst
+    """
+
+    def __init__(
+        self, path: Union[str, "os.PathLike[str]"], batch_size: int = 500
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.batch_size = batch_size
+        # Transactions are managed explicitly in commit().
+        self._conn = sqlite3.connect(os.fspath(path), isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "SQLiteStateStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def session(self, session_id: str) -> "SQLitePageState":
+        """Open a session's state; nothing is read until it is accessed."""
+        return SQLitePageState(self, session_id)
+
+    def sessions(self) -> Iterator[str]:
+        """Yield the ids of all sessions with saved state."""
+        for (session,) in self._conn.execute(
+            "SELECT DISTINCT session FROM page_state ORDER BY session"
+        ):
+            yield session
+
+    def delete_session(self, session_id: str) -> None:
+        """Remove all saved state of a session."""
+        self._conn.execute("DELETE FROM page_state WHERE session = ?", (session_id,))
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _load(self, session_id: str, namespace: Optional[str]) -> List[Any]:
+        if namespace is None:
+            cursor = self._conn.execute(
+                "SELECT key, value FROM page_state WHERE session = ?", (session_id,)
+            )
+        else:
+            cursor = self._conn.execute(
+                "SELECT key, value FROM page_state WHERE session = ? AND namespace = ?",
+                (session_id, namespace),
+            )
+        return [(key, json.loads(value)) for key, value in cursor]
+
+    def _write(self, session_id: str, pending: Mapping[str, Any]) -> None:
+        upserts = []
+        deletes = []
+        for key, value in pending.items():
+            if value is _DELETED:
+                deletes.append((session_id, key))
+            else:
+                upserts.append((session_id, _namespace(key), key, json.dumps(value)))
+        conn = self._conn
+        conn.execute("BEGIN")
+        try:
+            if deletes:
+                conn.executemany(
+                    "DELETE FROM page_state WHERE session = ? AND key = ?", deletes
+                )
+            if upserts:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO page_state (session, namespace, key, value)"
+                    " VALUES (?, ?, ?, ?)",
+                    upserts,
+                )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+
+class SQLitePageState(PageState):
+    """PageState persisted in a :class:`SQLiteStateStore` session.
+
+    Assembly namespaces are loaded on first access (``get``,
+    ``get_assembly_state``, ``has_key``, writes); whole-state reads such as
+    ``view()`` and ``get_all_state()`` load whatever is still missing.
+    Changes are kept in memory until :meth:`commit`.
+    """
+
+    def __init__(self, store: SQLiteStateStore, session_id: str) -> None:
+        super().__init__()
+        self.store = store
+        self.session_id = session_id
+        self._loaded: Set[str] = set()
+        self._all_loaded = False
+        # key -> value (or _DELETED) written since the last commit
+        self._pending: Dict[str, Any] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        raise TypeError("SQLitePageState is bound to a database connection")
+
+    def _ensure(self, namespace: str) -> None:
+        if self._all_loaded or namespace in self._loaded:
+            return
+        self._loaded.add(namespace)
+        for key, value in self.store._load(self.session_id, namespace):
+            # Values written before the namespace was first read are newer.
+            if key not in self._pending:
+                PageState._store(self, key, value)
+
+    def _ensure_all(self) -> None:
+        if self._all_loaded:
+            return
+        for key, value in self.store._load(self.session_id, None):
+            if _namespace(key) not in self._loaded and key not in self._pending:
+                PageState._store(self, key, value)
+        self._all_loaded = True
+
+    def _store(self, key: str, value: Any) -> None:
+        self._ensure(_namespace(key))
+        super()._store(key, value)
+        self._pending[key] = value
+        if len(self._pending) >= self.store.batch_size:
+            self.commit()
+
+    def _remove(self, key: str) -> None:
+        super()._remove(key)
+        self._pending[key] = _DELETED
+
+    def set_many(self, items: Items) -> None:
+        values = items if isinstance(items, dict) else dict(items)
+        for namespace in {_namespace(key) for key in values}:
+            self._ensure(namespace)
+        super().set_many(values)
+        self._pending.update(values)
+        if len(self._pending) >= self.store.batch_size:
+            self.commit()
+
+    def get_many(self, keys: Iterable[str], default: Any = None) -> List[Any]:
+        keys = list(keys)
+        for namespace in {_namespace(key) for key in keys}:
+            self._ensure(namespace)
+        return super().get_many(keys, default)
+
+    def export(self) -> StateColumns:
+        self._ensure_all()
+        return super().export()
+
+    def commit(self) -> None:
+        """Write all pending changes in one transaction."""
+        if self._pending:
+            pending, self._pending = self._pending, {}
+            self.store._write(self.session_id, pending)
+
+    def delete(self, key: str) -> None:
+        self._ensure(_namespace(key))
+        super().delete(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        self._ensure(_namespace(key))
+        return super().get(key, default)
+
+    def get_assembly_state(self, assembly_name: str) -> Dict[str, Any]:
+        self._ensure(assembly_name)
+        return super().get_assembly_state(assembly_name)
+
+    def has_key(self, key: str) -> bool:
+        self._ensure(_namespace(key))
+        return super().has_key(key)
+
+    def get_all_state(self) -> Dict[str, Any]:
+        self._ensure_all()
+        return super().get_all_state()
+
+    def view(self) -> Mapping[str, Any]:
+        self._ensure_all()
+        return super().view()
+
+    def snapshot(self) -> PersistentMap:
+        self._ensure_all()
+        return super().snapshot()
+
+    def clear_assembly(self, assembly_name: str) -> None:
+        self._ensure(assembly_name)
+        for field in self._assemblies.get(assembly_name, ()):
+            self._pending[f"{assembly_name}.{field}"] = _DELETED
+        super().clear_assembly(assembly_name)
+
+    def clear_all(self) -> None:
+        self._ensure_all()
+        for key in self._flat:
+            self._pending[key] = _DELETED
+        super().clear_all()
+
+
+__all__ = ["SQLitePageState", "SQLiteStateStore"]
@@ -5,7 +5,97 @@ This module provides page-scoped state management with assembly namespacing,
 cross-component communication, and state persistence capabilities.
 """
 
-from typing import Any, Dict
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .persistent import PersistentMap
+
+_MISSING = object()
+
+# Called with the namespaced keys that changed, in first-change order
+Subscriber = Callable[[Tuple[str, ...]], None]
+
+
+Items = Union[Mapping[str, Any], Iterable[Tuple[str, Any]]]
+
+
+def _namespace_of(key: str) -> str:
+    return key.split(".", 1)[0] if "." in key else ""
+
+
+class _StateView(Mapping):  # type: ignore[type-arg]
+    """Live, read-only view of stored and computed keys of a PageState.
+
+    While the state has no computed entries, ``get`` is the flat dict's own
+    method, so condition evaluation pays nothing for computed support.
+    """
+
+    def __init__(self, state: "PageState") -> None:
+        self._state = state
+        self._flat = state._flat
+        self.get = self._flat.get  # type: ignore[method-assign]
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._flat.get(key, _MISSING)
+        if value is _MISSING:
+            if key not in self._state._computed:
+                raise KeyError(key)
+            value = self._state._evaluate(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:  # type: ignore[override]
+        return self._state.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._flat or key in self._state._computed
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._flat
+        for key in self._state._computed:
+            if key not in self._flat:
+                yield key
+
+    def __len__(self) -> int:
+        flat = self._flat
+        return len(flat) + sum(1 for key in self._state._computed if key not in flat)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+class StateColumns(NamedTuple):
+    """Columnar export of a flat state: parallel key and value lists."""
+
+    keys: List[str]
+    values: List[Any]
+
+
+class StateDelta(NamedTuple):
+    """Changes between two state versions, as returned by ``PageState.diff``.
+
+    ``changed`` holds the current value of every key set (or added) since
+    the base version and ``removed`` the keys deleted since then. A ``full``
+    delta carries the complete state: keys missing from ``changed`` are to
+    be dropped.
+    """
+
+    version: int
+    changed: Dict[str, Any]
+    removed: Tuple[str, ...]
+    full: bool = False
 
 
 class PageState:
@@ -15,14 +105,81 @@ class PageState:
     Provides:
     - Assembly namespacing (assembly.field format)
     - Cross-assembly state access
+    - Computed entries derived from other keys
     - State validation and type checking
     - Optional persistence and undo/redo
+
+    Change notifications go to :meth:`watch` callbacks (once per key) and
+    to :meth:`subscribe` callbacks, which can target one key, one assembly
+    namespace or every key. Inside ``with state.batch():`` notifications
+    are held back and delivered once, for all keys changed in the block.
+
+    History is off until the first :meth:`snapshot`. From then on every
+    change is recorded as a new version in a persistent map that shares
+    unchanged structure with older versions, so snapshots are O(1) and
+    :meth:`undo`/:meth:`redo` cost O(log n) per changed key.
+
+    Delta tracking is likewise off until :attr:`version` is first read.
+    Each change then stamps its keys with a new version number, so
+    :meth:`diff` costs O(changes since the given version), not O(state).
+
+    Computed entries (:meth:`add_computed`) read like stored keys but are
+    evaluated on first access and memoized until one of their dependencies
+    changes. They are not stored: history, snapshots, :meth:`export` and
+    pickling cover stored keys only.
     """
 
     def __init__(self) -> None:
         """Initialize empty page state."""
         self._state: Dict[str, Any] = {}
         self._assemblies: Dict[str, Dict[str, Any]] = {}
+        # Flat namespaced view (global keys plus 'assembly.field' keys),
+        # maintained incrementally so reads never rebuild it.
+        self._flat: Dict[str, Any] = {}
+        # Computed entries: key -> (function, dependency keys), memoized
+        # values, and the computed keys each key invalidates.
+        self._computed: Dict[str, Tuple[Callable[..., Any], Tuple[str, ...]]] = {}
+        self._computed_values: Dict[str, Any] = {}
+        self._dependents: Dict[str, List[str]] = {}
+        self._flat_view = _StateView(self)
+        # Callbacks invoked with each namespaced key that changes
+        self._watchers: List[Callable[[str], None]] = []
+        # Subscriptions indexed by key and by namespace, plus wildcards, so
+        # dispatch only touches the subscribers a change concerns.
+        self._key_subscribers: Dict[str, List[Subscriber]] = {}
+        self._namespace_subscribers: Dict[str, List[Subscriber]] = {}
+        self._wildcard_subscribers: List[Subscriber] = []
+        # Watchers plus subscriptions; lets set() skip notification entirely
+        self._listeners = 0
+        # Keys changed inside batch() (dict as an ordered set)
+        self._batch_depth = 0
+        self._batched: Dict[str, None] = {}
+        # Version history, started by the first snapshot(): one persistent
+        # map per version, the keys each version changed relative to the
+        # one before it, and the index of the current version.
+        self._versions: Optional[List[PersistentMap]] = None
+        self._changes: List[Tuple[str, ...]] = []
+        self._cursor = 0
+        # Delta tracking, started by the first read of `version`: the
+        # version of the last change to each key (removed keys included),
+        # kept in ascending stamp order, and the version tracking began at.
+        self._version = 0
+        self._stamps: Optional[Dict[str, int]] = None
+        self._tracked_from = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The flat view is derived data, and watchers, computed entries and
+        # history belong to the live process; none of them is pickled.
+        return {"_state": self._state, "_assemblies": self._assemblies}
+
+    def __setstate__(self, data: Dict[str, Any]) -> None:
+        self.__init__()  # type: ignore[misc]
+        self._state = data["_state"]
+        self._assemblies = data["_assemblies"]
+        self._flat.update(self._state)
+        for assembly_name, fields in self._assemblies.items():
+            for field, value in fields.items():
+                self._flat[f"{assembly_name}.{field}"] = value
 
     def set(self, key: str, value: Any) -> None:
         """Set a state value with optional assembly namespacing.
@@ -31,6 +188,114 @@ class PageState:
             key: State key, optionally namespaced (assembly.field)
             value: Value to store
         """
+        self._store(key, value)
+        if self._versions is not None:
+            self._record((key,))
+        if self._stamps is not None:
+            self._stamp((key,))
+        if self._listeners or self._dependents:
+            self._notify((key,))
+
+    def delete(self, key: str) -> None:
+        """Remove a state value; missing keys are ignored.
+
+        Args:
+            key: State key, optionally namespaced (assembly.field)
+        """
+        if key not in self._flat:
+            return
+        self._remove(key)
+        if self._versions is not None:
+            self._record((key,))
+        if self._stamps is not None:
+            self._stamp((key,))
+        if self._listeners or self._dependents:
+            self._notify((key,))
+
+    def set_many(self, items: Items) -> None:
+        """Set many values at once.
+
+        Each key's namespace is parsed once, writes are grouped per
+        assembly, and watchers/subscribers get a single notification (and
+        history a single version) for the whole batch.
+
+        Args:
+            items: Mapping or iterable of ``(key, value)`` pairs
+        """
+        # A dict keeps the last value per key, as sequential set() would.
+        values = items if isinstance(items, dict) else dict(items)
+        if not values:
+            return
+        global_values: Dict[str, Any] = {}
+        grouped: Dict[str, Dict[str, Any]] = {}
+        for key, value in values.items():
+            assembly, dot, field = key.partition(".")
+            if dot:
+                fields = grouped.get(assembly)
+                if fields is None:
+                    fields = grouped[assembly] = {}
+                fields[field] = value
+            else:
+                global_values[key] = value
+        self._state.update(global_values)
+        assemblies = self._assemblies
+        for assembly, fields in grouped.items():
+            if assembly in assemblies:
+                assemblies[assembly].update(fields)
+            else:
+                assemblies[assembly] = fields
+        self._flat.update(values)
+
+        if self._stamps is not None:
+            self._stamp(values)
+        if self._versions is not None or self._listeners or self._dependents:
+            keys = tuple(values)
+            if self._versions is not None:
+                self._record(keys)
+            self._notify(keys)
+
+    def get_many(self, keys: Iterable[str], default: Any = None) -> List[Any]:
+        """Get many values at once, in the order of `keys`.
+
+        Args:
+            keys: State keys, optionally namespaced (assembly.field)
+            default: Value for keys that are not set
+
+        Returns:
+            List of values aligned with `keys`
+        """
+        get = self._flat.get
+        return [get(key, default) for key in keys]
+
+    def export(self) -> StateColumns:
+        """Export the flat state as parallel key and value lists.
+
+        The columnar form pickles smaller than a dict and is loaded with
+        :meth:`import_` without rebuilding a per-key mapping.
+        """
+        return StateColumns(list(self._flat), list(self._flat.values()))
+
+    def import_(
+        self,
+        columns: Union[StateColumns, Tuple[Sequence[str], Sequence[Any]]],
+        replace: bool = False,
+    ) -> None:
+        """Load state exported by :meth:`export`.
+
+        Args:
+            columns: ``(keys, values)`` pair of equal-length sequences
+            replace: Clear the current state first; notifications for the
+                removal and the import are delivered together
+        """
+        keys, values = columns
+        if len(keys) != len(values):
+            raise ValueError("keys and values must have the same length")
+        with self.batch():
+            if replace:
+                self.clear_all()
+            self.set_many(zip(keys, values))
+
+    def _store(self, key: str, value: Any) -> None:
         if "." in key:
             # Namespaced key (assembly.field)
             assembly, field = key.split(".", 1)
@@ -40,6 +305,29 @@ class PageState:
         else:
             # Global key
             self._state[key] = value
+        self._flat[key] = value
+
+    def _remove(self, key: str) -> None:
+        if "." in key:
+            assembly, field = key.split(".", 1)
+            fields = self._assemblies[assembly]
+            del fields[field]
+            if not fields:
+                del self._assemblies[assembly]
+        else:
+            del self._state[key]
+        del self._flat[key]
+
+    def _load(self, values: Mapping[str, Any]) -> None:
+        """Store `values` as restored state: recorded, but not notified."""
+        for key, value in values.items():
+            self._store(key, value)
+        if self._versions is not None and values:
+            self._record(values)
+        if self._stamps is not None and values:
+            self._stamp(values)
+        if self._dependents:
+            self._invalidate(values)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a state value with optional assembly namespacing.
@@ -51,15 +339,13 @@ class PageState:
         Returns:
             Stored value or default
         """
-        if "." in key:
-            # Namespaced key (assembly.field)
-            assembly, field = key.split(".", 1)
-            if assembly in self._assemblies:
-                return self._assemblies[assembly].get(field, default)
+        # The flat index holds every key in its namespaced form already.
+        value = self._flat.get(key, _MISSING)
+        if value is _MISSING:
+            if key in self._computed:
+                return self._evaluate(key)
             return default
-        else:
-            # Global key
-            return self._state.get(key, default)
+        return value
 
     def get_assembly_state(self, assembly_name: str) -> Dict[str, Any]:
         """Get all state for a specific assembly.
@@ -75,17 +361,28 @@ class PageState:
     def get_all_state(self) -> Dict[str, Any]:
         """Get complete state as flat dictionary.
 
+        Computed entries are included (and evaluated if stale).
+
         Returns:
             Flat dictionary with namespaced keys (assembly.field)
         """
-        result = self._state.copy()
+        state = self._flat.copy()
+        for key in self._computed:
+            if key not in state:
+                state[key] = self._evaluate(key)
+        return state
 
-        # Add namespaced assembly state
-        for assembly_name, assembly_state in self._assemblies.items():
-            for field, value in assembly_state.items():
-                result[f"{assembly_name}.{field}"] = value
+    def view(self) -> Mapping[str, Any]:
+        """Get a live, read-only view of the complete flat state.
 
-        return result
+        Unlike :meth:`get_all_state` no copy is made; the returned mapping
+        reflects later changes to this PageState, and computed entries are
+        only evaluated when read.
+
+        Returns:
+            Read-only mapping with namespaced keys (assembly.field)
+        """
+        return self._flat_view
 
     def has_key(self, key: str) -> bool:
         """Check if a key exists in state.
@@ -94,13 +391,9 @@ class PageState:
             key: State key to check
 
         Returns:
-            True if key exists, False otherwise
+            True if key exists (stored or computed), False otherwise
         """
-        if "." in key:
-            assembly, field = key.split(".", 1)
-            return assembly in self._assemblies and field in self._assemblies[assembly]
-        else:
-            return key in self._state
+        return key in self._flat or key in self._computed
 
     def clear_assembly(self, assembly_name: str) -> None:
         """Clear all state for a specific assembly.
@@ -108,13 +401,419 @@ class PageState:
         Args:
             assembly_name: Name of assembly to clear
         """
-        if assembly_name in self._assemblies:
-            del self._assemblies[assembly_name]
+        fields = self._assemblies.pop(assembly_name, None)
+        if fields:
+            removed = [f"{assembly_name}.{field}" for field in fields]
+            for key in removed:
+                del self._flat[key]
+            if self._versions is not None:
+                self._record(removed)
+            if self._stamps is not None:
+                self._stamp(removed)
+            self._notify(removed)
 
     def clear_all(self) -> None:
         """Clear all state."""
+        removed = list(self._flat)
         self._state.clear()
         self._assemblies.clear()
+        self._flat.clear()
+        if self._versions is not None and removed:
+            self._record(removed)
+        if self._stamps is not None and removed:
+            self._stamp(removed)
+        self._notify(removed)
+
+    def add_computed(
+        self,
+        key: str,
+        func: Callable[..., Any],
+        depends_on: Iterable[str],
+    ) -> None:
+        """Register a computed entry derived from other keys.
+
+        ``func`` is called with the values of ``depends_on`` (``None`` for
+        unset keys) the first time `key` is read, and the result is reused
+        until one of those keys changes. Dependencies may themselves be
+        computed. A change to a dependency is reported to watchers and
+        subscribers as a change of `key` too, without evaluating it.
+
+        A stored value under the same key takes precedence.
+
+        Args:
+            key: Namespaced key the entry is read under (``"order.total"``)
+            func: Function of the dependency values
+            depends_on: Keys the value is derived from
+
+        Raises:
+            ValueError: If the dependencies lead back to `key`
+        """
+        depends_on = tuple(depends_on)
+        pending = list(depends_on)
+        seen = set()
+        while pending:
+            dependency = pending.pop()
+            if dependency == key:
+                raise ValueError(f"computed key {key!r} depends on itself")
+            if dependency not in seen and dependency in self._computed:
+                seen.add(dependency)
+                pending.extend(self._computed[dependency][1])
+
+        if key in self._computed:
+            self._unlink(key)
+        self._computed[key] = (func, depends_on)
+        for dependency in dict.fromkeys(depends_on):
+            self._dependents.setdefault(dependency, []).append(key)
+        self._view_fast_path()
+        self._notify((key,))
+
+    def remove_computed(self, key: str) -> None:
+        """Unregister a computed entry; unknown keys are ignored."""
+        if key not in self._computed:
+            return
+        self._unlink(key)
+        del self._computed[key]
+        self._view_fast_path()
+        self._notify((key,))
+
+    def is_computed(self, key: str) -> bool:
+        """Check if `key` is a computed entry (see :meth:`add_computed`)."""
+        return key in self._computed
+
+    def _unlink(self, key: str) -> None:
+        for dependency in dict.fromkeys(self._computed[key][1]):
+            dependents = self._dependents[dependency]
+            dependents.remove(key)
+            if not dependents:
+                del self._dependents[dependency]
+        self._computed_values.pop(key, None)
+
+    def _view_fast_path(self) -> None:
+        view = self._flat_view
+        if self._computed:
+            vars(view).pop("get", None)
+        else:
+            view.get = self._flat.get  # type: ignore[method-assign]
+
+    def _evaluate(self, key: str) -> Any:
+        value = self._computed_values.get(key, _MISSING)
+        if value is _MISSING:
+            func, depends_on = self._computed[key]
+            value = func(*[self.get(dependency) for dependency in depends_on])
+            self._computed_values[key] = value
+        return value
+
+    def _invalidate(self, keys: Iterable[str]) -> Tuple[str, ...]:
+        """Drop memoized values derived from `keys`.
+
+        Returns:
+            `keys` followed by every computed key that depends on them,
+            directly or through other computed keys
+        """
+        changed = dict.fromkeys(keys)
+        dependents = self._dependents
+        pending = [key for key in changed if key in dependents]
+        while pending:
+            for computed in dependents.get(pending.pop(), ()):
+                if computed not in changed:
+                    changed[computed] = None
+                    self._computed_values.pop(computed, None)
+                    pending.append(computed)
+        return tuple(changed)
+
+    @property
+    def version(self) -> int:
+        """Current state version, for a later :meth:`diff`.
+
+        The first read starts delta tracking; from then on every change
+        increments the version.
+        """
+        if self._stamps is None:
+            # Changes made before now are unstamped; a version below the new
+            # one therefore asks for the full state.
+            self._stamps = {}
+            self._version += 1
+            self._tracked_from = self._version
+        return self._version
+
+    def diff(self, since_version: int) -> StateDelta:
+        """Return the stored keys changed since `since_version`.
+
+        Costs O(keys changed since then). For a version from before delta
+        tracking began (such as ``0`` for a first sync) a ``full`` delta
+        with the complete state is returned instead.
+
+        Args:
+            since_version: Value of :attr:`version` at the last sync
+
+        Returns:
+            :class:`StateDelta` to pass to :meth:`apply_delta`
+        """
+        version = self.version
+        if since_version > version:
+            raise ValueError(f"version {since_version} is newer than {version}")
+        if since_version < self._tracked_from:
+            return StateDelta(version, dict(zip(*self.export())), (), True)
+
+        flat = self._flat
+        changed: Dict[str, Any] = {}
+        removed: List[str] = []
+        stamps = self._stamps
+        assert stamps is not None
+        # Stamps are kept in ascending order, so walk back from the newest.
+        for key in reversed(stamps):
+            if stamps[key] <= since_version:
+                break
+            value = flat.get(key, _MISSING)
+            if value is _MISSING:
+                removed.append(key)
+            else:
+                changed[key] = value
+        return StateDelta(version, changed, tuple(removed))
+
+    def apply_delta(self, delta: StateDelta) -> None:
+        """Apply a delta produced by :meth:`diff` of another PageState.
+
+        Watchers and subscribers are notified once, after the whole delta.
+
+        Args:
+            delta: Delta to apply; a ``full`` delta replaces all stored keys
+        """
+        with self.batch():
+            if delta.full:
+                for key in self.export().keys:
+                    if key not in delta.changed:
+                        self.delete(key)
+            for key in delta.removed:
+                self.delete(key)
+            self.set_many(delta.changed)
+
+    def _stamp(self, keys: Iterable[str]) -> None:
+        stamps = self._stamps
+        assert stamps is not None
+        self._version += 1
+        version = self._version
+        for key in keys:
+            # Re-inserting moves the key to the end, keeping stamp order.
+            stamps.pop(key, None)
+            stamps[key] = version
+
+    def commit(self) -> None:
+        """Persist pending changes; called after each answer burst.
+
+        In-memory state has nothing to persist. Storage-backed subclasses
+        override this to write their buffered changes in one batch.
+        """
+
+    def snapshot(self) -> PersistentMap:
+        """Return an immutable snapshot of the complete flat state in O(1).
+
+        The first call starts version history (one O(n) pass over the
+        current state); later snapshots share structure with each other.
+
+        Returns:
+            Read-only mapping with namespaced keys (assembly.field)
+        """
+        if self._versions is None:
+            self._versions = [PersistentMap(self._flat.items())]
+            self._changes = [()]
+            self._cursor = 0
+        return self._versions[self._cursor]
+
+    def restore(self, snapshot: Mapping[str, Any]) -> None:
+        """Return state to `snapshot` as a new, undoable version.
+
+        Only keys that differ are touched; between snapshots of this state
+        that costs O(changes * log n).
+
+        Args:
+            snapshot: Mapping returned by :meth:`snapshot`
+        """
+        current = self.snapshot()
+        if isinstance(snapshot, PersistentMap):
+            changed = list(current.diff(snapshot))
+            target = snapshot
+        else:
+            changed = [k for k in current if k not in snapshot]
+            changed += [
+                k for k, v in snapshot.items() if current.get(k, _MISSING) is not v
+            ]
+            target = PersistentMap(snapshot.items())
+        if not changed:
+            return
+        self._apply(target, changed)
+        self._push(target, tuple(changed))
+        if self._stamps is not None:
+            self._stamp(changed)
+        self._notify(changed)
+
+    def undo(self) -> bool:
+        """Revert the most recent recorded change.
+
+        Returns:
+            True if a change was undone, False at the start of history
+        """
+        if not self._versions or self._cursor == 0:
+            return False
+        changed = self._changes[self._cursor]
+        self._cursor -= 1
+        self._apply(self._versions[self._cursor], changed)
+        if self._stamps is not None:
+            self._stamp(changed)
+        self._notify(list(changed))
+        return True
+
+    def redo(self) -> bool:
+        """Re-apply the change most recently undone.
+
+        Returns:
+            True if a change was redone, False at the end of history
+        """
+        if not self._versions or self._cursor == len(self._versions) - 1:
+            return False
+        self._cursor += 1
+        changed = self._changes[self._cursor]
+        self._apply(self._versions[self._cursor], changed)
+        if self._stamps is not None:
+            self._stamp(changed)
+        self._notify(list(changed))
+        return True
+
+    def clear_history(self) -> None:
+        """Drop all recorded versions; the current state is kept."""
+        self._versions = None
+        self._changes = []
+        self._cursor = 0
+
+    def _record(self, keys: Iterable[str]) -> None:
+        """Append a version reflecting the current values of `keys`."""
+        root = self._versions[self._cursor]  # type: ignore[index]
+        keys = tuple(keys)
+        for key in keys:
+            value = self._flat.get(key, _MISSING)
+            root = root.delete(key) if value is _MISSING else root.set(key, value)
+        if root is not self._versions[self._cursor]:  # type: ignore[index]
+            self._push(root, keys)
+
+    def _push(self, root: PersistentMap, keys: Tuple[str, ...]) -> None:
+        versions = self._versions
+        assert versions is not None
+        # A new change after undo() discards the redo branch.
+        del versions[self._cursor + 1 :]
+        del self._changes[self._cursor + 1 :]
+        versions.append(root)
+        self._changes.append(keys)
+        self._cursor += 1
+
+    def _apply(self, target: PersistentMap, keys: Iterable[str]) -> None:
+        """Make `keys` match `target` without recording a version."""
+        for key in keys:
+            value = target.get(key, _MISSING)
+            if value is _MISSING:
+                if key in self._flat:
+                    self._remove(key)
+            else:
+                self._store(key, value)
+
+    def watch(self, callback: Callable[[str], None]) -> None:
+        """Register a callback invoked with every key that changes.
+
+        Args:
+            callback: Function called as ``callback(key)`` after a key is
+                set or removed
+        """
+        self._watchers.append(callback)
+        self._listeners += 1
+
+    def unwatch(self, callback: Callable[[str], None]) -> None:
+        """Remove a callback previously registered with :meth:`watch`."""
+        if callback in self._watchers:
+            self._watchers.remove(callback)
+            self._listeners -= 1
+
+    def subscribe(
+        self,
+        callback: Subscriber,
+        key: Optional[str] = None,
+        namespace: Optional[str] = None,
+    ) -> Callable[[], None]:
+        """Subscribe to changes of one key, one namespace, or all keys.
+
+        Args:
+            callback: Called as ``callback(keys)`` with the tuple of changed
+                keys the subscription covers; once per change, or once per
+                :meth:`batch` block. A callback subscribed several times is
+                still called once, with the union of its keys
+            key: Namespaced key to watch (``"db.host"``)
+            namespace: Assembly namespace to watch (``"db"``); ``""``
+                selects global keys. With neither, every key is watched
+
+        Returns:
+            Function that cancels the subscription
+        """
+        if key is not None and namespace is not None:
+            raise ValueError("subscribe to a key or a namespace, not both")
+        if key is not None:
+            subscribers = self._key_subscribers.setdefault(key, [])
+        elif namespace is not None:
+            subscribers = self._namespace_subscribers.setdefault(namespace, [])
+        else:
+            subscribers = self._wildcard_subscribers
+        subscribers.append(callback)
+        self._listeners += 1
+
+        def unsubscribe() -> None:
+            if callback in subscribers:
+                subscribers.remove(callback)
+                self._listeners -= 1
+
+        return unsubscribe
+
+    @contextmanager
+    def batch(self) -> Iterator["PageState"]:
+        """Coalesce change notifications until the block exits.
+
+        Every watcher and subscriber is notified at most once per changed
+        key, after the outermost ``batch()`` block ends (also on error).
+        Blocks may be nested.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batched:
+                keys = tuple(self._batched)
+                self._batched.clear()
+                self._dispatch(keys)
+
+    def _notify(self, keys: Iterable[str]) -> None:
+        if self._dependents:
+            keys = self._invalidate(keys)
+        if self._batch_depth:
+            for key in keys:
+                self._batched[key] = None
+        elif self._listeners:
+            self._dispatch(tuple(keys))
+
+    def _dispatch(self, keys: Tuple[str, ...]) -> None:
+        for watcher in tuple(self._watchers):
+            for key in keys:
+                watcher(key)
+
+        # Group the changed keys per subscriber so each is called once.
+        calls: Dict[Subscriber, Dict[str, None]] = {}
+        key_subscribers = self._key_subscribers
+        namespace_subscribers = self._namespace_subscribers
+        for key in keys:
+            for subscriber in key_subscribers.get(key, ()):
+                calls.setdefault(subscriber, {})[key] = None
+            for subscriber in namespace_subscribers.get(_namespace_of(key), ()):
+                calls.setdefault(subscriber, {})[key] = None
+        for subscriber in self._wildcard_subscribers:
+            calls.setdefault(subscriber, {}).update(dict.fromkeys(keys))
+        for subscriber, changed in calls.items():
+            subscriber(tuple(changed))
 
 
-__all__ = ["PageState"]
+__all__ = ["PageState", "StateColumns", "StateDelta"]
@@ -0,0 +1,532 @@
+"""
+Indexed fuzzy matching for large choice lists.
+
+:class:`FuzzyMatcher` answers ``fuzzy_select`` keystrokes without rescanning
+every choice:
+
+- Choices are normalized once (lowercased unless case sensitive) into a
+  sorted prefix index, searched with :mod:`bisect`, and one newline-joined
+  buffer scanned with ``str.find``
+- Results are ranked in tiers: exact (1.0), prefix (0.9), substring (0.8)
+  and, when ``min_score`` allows it, subsequence matches scored
+  ``0.7 * len(query) / span`` over their shortest span; tiers below
+  ``min_score`` are never searched
+- A query's substring scan stops once it has enough results and remembers
+  how far it got; a query that extends an earlier one filters that query's
+  hits and resumes its scan, so typing a word scans the buffer at most once
+- Subsequence candidates are kept in a bounded heap (top-k)
+
+Within a tier, prefix matches are ordered by key and substring and
+subsequence matches by choice order.
+
+:class:`FuzzyIndex` is the batch counterpart for offline matching (e.g.
+deduplicating one list against another), and needs NumPy
+(``pip install questionary-extended[fuzzy]``):
+
+- Choices are lowercased, split into word tokens and reduced to their sets
+  of character bigrams (tokens padded with a space, so word boundaries
+  count), kept as posting lists in NumPy arrays
+- Queries are scored in batches: bigram extraction and vocabulary lookup
+  are vectorized over the whole batch, then one ``bincount`` over a
+  query's posting lists gives its overlap with every choice, and the
+  score is their Dice coefficient
+  ``2 * shared / (query bigrams + choice bigrams)``, ranked for the batch
+  with one ``argpartition``
+- ``match_many`` returns the top-k choices per query and can fan the
+  queries out over a process pool
+"""
+
+import heapq
+import os
+import pickle
+import re
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from prompt_toolkit.completion import CompleteEvent, Completer, Completion
+from prompt_toolkit.document import Document
+
+from ._parallel import chunks, map_chunks
+
+EXACT_SCORE = 1.0
+PREFIX_SCORE = 0.9
+SUBSTRING_SCORE = 0.8
+SUBSEQUENCE_SCORE = 0.7
+
+# Extra gap allowed when collecting a subsequence pool, and its size limit
+_POOL_SLACK = 1
+_POOL_LIMIT = 50_000
+_UNBOUNDED = 1 << 62
+
+
+class _Scan:
+    """Progress of one query's substring scan over the joined buffer."""
+
+    __slots__ = ("query", "hits", "pos", "done", "fuzzy", "pool", "pool_gap")
+
+    def __init__(self, query: str, hits: List[int], pos: int, done: bool) -> None:
+        self.query = query
+        # Choices containing the query that start before `pos`, in order
+        self.hits = hits
+        self.pos = pos
+        self.done = done
+        # Subsequence results, once computed: [(choice index, score)]
+        self.fuzzy: Optional[List[Tuple[int, float]]] = None
+        # Choices holding the query as a subsequence with gaps of at most
+        # `pool_gap` characters (None when too many to keep)
+        self.pool: Optional[List[int]] = None
+        self.pool_gap = 0
+
+
+def _spans(
+    pattern: "re.Pattern[str]", text: str, query: str
+) -> Iterator[Tuple[int, int]]:
+    """Yield ``(start, span)`` of the shortest match from every start.
+
+    Lazy gaps make each match the shortest one from its start, but
+    ``finditer`` skips starts inside an earlier match, and one of those can
+    give a shorter span (``"a_ab_c"`` for ``"abc"``); they are matched
+    separately.
+    """
+    first, length = query[0], len(query)
+    for match in pattern.finditer(text):
+        start, end = match.span()
+        yield start, end - start
+        # A contiguous match cannot be beaten.
+        pos = text.find(first, start + 1, end) if end - start > length else -1
+        while pos >= 0:
+            inner = pattern.match(text, pos)
+            if inner is not None:
+                yield pos, inner.end() - pos
+            pos = text.find(first, pos + 1, end)
+
+
+class FuzzyMatcher:
+    """Prebuilt index over a list of string choices.
+
+    Args:
+        choices: Choices to search
+        min_score: Lowest score returned (0.0-1.0)
+        case_sensitive: Whether matching distinguishes case
+        cache_size: Recent queries whose scans are kept for narrowing
+    """
+
+    def __init__(
+        self,
+        choices: Iterable[str],
+        min_score: float = 0.6,
+        case_sensitive: bool = False,
+        cache_size: int = 64,
+    ) -> None:
+        self.choices: List[str] = list(choices)
+        self.min_score = min_score
+        self.case_sensitive = case_sensitive
+        self.cache_size = cache_size
+        keys = self.choices if case_sensitive else [c.lower() for c in self.choices]
+        self._keys = keys
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self._order = array("l", order)
+        self._sorted = [keys[i] for i in order]
+        # One scannable buffer; find() hits are mapped back to choices
+        # through their offsets.
+        self._blob = "\n".join(keys)
+        # starts[i] is the offset of choice i; one sentinel past the end
+        self._starts = array(
+            "q",
+            (
+                total + i
+                for i, total in enumerate(accumulate(map(len, keys), initial=0))
+            ),
+        )
+        self._scans: "OrderedDict[str, _Scan]" = OrderedDict()
+        # Completions may run on prompt_toolkit's completion threads.
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.choices)
+
+    def _normalize(self, query: str) -> str:
+        return query if self.case_sensitive else query.lower()
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """Return up to `limit` ``(choice, score)`` pairs, best first."""
+        q = self._normalize(query)
+        if not q or limit < 1:
+            return []
+        with self._lock:
+            return self._search(q, limit)
+
+    def _search(self, q: str, limit: int) -> List[Tuple[str, float]]:
+        min_score = self.min_score
+        choices = self.choices
+        results: List[Tuple[str, float]] = []
+
+        # Exact and prefix matches: one contiguous run of the sorted keys,
+        # with keys equal to the query first.
+        if EXACT_SCORE >= min_score:
+            sorted_keys = self._sorted
+            j = bisect_left(sorted_keys, q)
+            end = len(sorted_keys)
+            while j < end and len(results) < limit:
+                key = sorted_keys[j]
+                if key == q:
+                    score = EXACT_SCORE
+                elif PREFIX_SCORE >= min_score and key.startswith(q):
+                    score = PREFIX_SCORE
+                else:
+                    break
+                results.append((choices[self._order[j]], score))
+                j += 1
+        if len(results) >= limit or SUBSTRING_SCORE < min_score:
+            return results
+
+        # Prefix matches were all taken above, or the limit was reached.
+        scan = self._scan(q, limit - len(results))
+        keys = self._keys
+        for index in scan.hits:
+            if not keys[index].startswith(q):
+                results.append((choices[index], SUBSTRING_SCORE))
+                if len(results) >= limit:
+                    return results
+
+        if scan.done and SUBSEQUENCE_SCORE >= min_score and len(q) > 1:
+            if scan.fuzzy is None:
+                scan.fuzzy = self._subsequence(scan, limit)
+            for index, score in scan.fuzzy:
+                if len(results) >= limit:
+                    break
+                results.append((choices[index], score))
+        return results
+
+    def _scan(self, q: str, need: int) -> _Scan:
+        """Return q's scan, advanced until it has `need` non-prefix hits."""
+        scans = self._scans
+        scan = scans.get(q)
+        if scan is None:
+            scan = _Scan(q, [], 0, False)
+            # Narrow the longest cached query this one extends.
+            for length in range(len(q) - 1, 0, -1):
+                base = scans.get(q[:length])
+                if base is not None:
+                    keys = self._keys
+                    scan.hits = [i for i in base.hits if q in keys[i]]
+                    scan.pos, scan.done = base.pos, base.done
+                    break
+            scans[q] = scan
+            if len(scans) > self.cache_size:
+                scans.popitem(last=False)
+        else:
+            scans.move_to_end(q)
+
+        keys = self._keys
+        found = sum(1 for i in scan.hits if not keys[i].startswith(q))
+        if found >= need or scan.done:
+            return scan
+        blob, starts, hits = self._blob, self._starts, scan.hits
+        last = len(keys) - 1
+        pos = scan.pos
+        while found < need:
+            hit = blob.find(q, pos)
+            if hit < 0:
+                scan.done = True
+                break
+            index = bisect_right(starts, hit) - 1
+            if hit + len(q) >= starts[index + 1]:
+                # A query holding a newline matched across two choices.
+                pos = starts[index + 1]
+                continue
+            hits.append(index)
+            if hit != starts[index]:
+                found += 1
+            if index == last:
+                scan.done = True
+                break
+            pos = starts[index + 1]
+        scan.pos = pos
+        return scan
+
+    def _subsequence(self, scan: _Scan, limit: int) -> List[Tuple[int, float]]:
+        """Best `limit` choices holding the query's characters in order.
+
+        Only called once the substring scan is complete; its hits are left
+        to the substring tier.
+        """
+        q = scan.query
+        # span <= SUBSEQUENCE_SCORE * len(q) / min_score keeps score >= min_score
+        if self.min_score > 0:
+            gap = int(SUBSEQUENCE_SCORE * len(q) / self.min_score) - len(q)
+            if gap < 1:
+                return []
+            # Allow a little more so the next keystrokes can narrow the pool.
+            pool_gap = gap + _POOL_SLACK
+        else:
+            gap = pool_gap = _UNBOUNDED
+        base = self._pool_base(q, gap)
+        if base is not None:
+            # The narrowed pool is only complete up to the base's gaps.
+            pool_gap = min(pool_gap, base.pool_gap)
+        scan.pool_gap = pool_gap
+        between = "[^\\n]*?" if pool_gap == _UNBOUNDED else "[^\\n]{0,%d}?" % pool_gap
+        pattern = re.compile(between.join(re.escape(c) for c in q))
+
+        # choice index -> shortest span
+        spans: Dict[int, int] = {}
+        if base is not None:
+            keys = self._keys
+            for index in base.pool:  # type: ignore[union-attr]
+                for _, span in _spans(pattern, keys[index], q):
+                    if span < spans.get(index, _UNBOUNDED):
+                        spans[index] = span
+        else:
+            starts = self._starts
+            for start, span in _spans(pattern, self._blob, q):
+                index = bisect_right(starts, start) - 1
+                if span < spans.get(index, _UNBOUNDED):
+                    spans[index] = span
+        scan.pool = list(spans) if len(spans) <= _POOL_LIMIT else None
+
+        exclude = set(scan.hits)
+        heap: List[Tuple[float, int]] = []
+        for index, span in spans.items():
+            score = SUBSEQUENCE_SCORE * len(q) / span
+            if score < self.min_score or index in exclude:
+                continue
+            # Earlier choices win ties: negate the index so they sort larger.
+            entry = (score, -index)
+            if len(heap) < limit:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+        return [(-neg, score) for score, neg in sorted(heap, reverse=True)]
+
+    def _pool_base(self, q: str, gap: int) -> Optional[_Scan]:
+        """Scan of the longest cached query q extends with a usable pool."""
+        # A choice matching q with gaps <= `gap` matches any prefix of q with
+        # the same gaps, so a prefix's pool built with wider gaps covers it.
+        for length in range(len(q) - 1, 1, -1):
+            base = self._scans.get(q[:length])
+            if base is not None and base.pool is not None and base.pool_gap >= gap:
+                return base
+        return None
+
+
+class FuzzyChoiceCompleter(Completer):
+    """prompt_toolkit completer backed by a :class:`FuzzyMatcher`.
+
+    Args:
+        matcher: Index to search
+        limit: Completions shown per keystroke
+    """
+
+    def __init__(self, matcher: FuzzyMatcher, limit: int = 50) -> None:
+        self.matcher = matcher
+        self.limit = limit
+
+    def get_completions(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> Iterator[Completion]:
+        text = document.text_before_cursor
+        if text:
+            matches: Sequence[Any] = [
+                choice for choice, _ in self.matcher.search(text, self.limit)
+            ]
+        else:
+            matches = self.matcher.choices[: self.limit]
+        for choice in matches:
+            yield Completion(choice, start_position=-len(text))
+
+
+# Tokens are runs of word characters; everything else separates them.
+_SEPARATORS = re.compile(r"[^\w\n]+|_+")
+# (query, choice) cells counted per batch: bounds a batch's memory
+_BATCH_CELLS = 1 << 22
+# Per-worker index, installed once by _init_worker
+_WORKER_INDEX: Optional["FuzzyIndex"] = None
+
+
+def _numpy() -> Any:
+    try:
+        import numpy as np
+    except ImportError as exc:
+        raise ImportError(
+            "FuzzyIndex requires NumPy: pip install questionary-extended[fuzzy]"
+        ) from exc
+    return np
+
+
+def _bigrams(np: Any, texts: Sequence[str]) -> Tuple[Any, Any]:
+    """Return (owner, bigram) arrays: each text's distinct bigrams, by owner."""
+    # Owners are counted by newlines, so a newline inside a text separates
+    # words like any other whitespace instead of starting a new text.
+    joined = "\n".join(text.replace("\n", " ") for text in texts)
+    blob = _SEPARATORS.sub(" ", joined.lower())
+    blob = " " + blob.replace("\n", " \n ") + " "
+    codes = np.frombuffer(blob.encode("utf-32-le"), dtype="<u4").astype(np.uint64)
+    newline = codes == 10
+    owner = np.cumsum(newline)
+    left, right = codes[:-1], codes[1:]
+    space = np.uint64(32)
+    # Drop pairs spanning two texts and the blank pairs around empty tokens.
+    keep = ~(newline[:-1] | newline[1:]) & ~((left == space) & (right == space))
+    # Code points fit in 21 bits, so a bigram packs into 42.
+    keys = (left[keep] << np.uint64(21)) | right[keep]
+    pairs = np.sort((owner[:-1][keep].astype(np.uint64) << np.uint64(42)) | keys)
+    if len(pairs):
+        pairs = pairs[np.concatenate(([True], pairs[1:] != pairs[:-1]))]
+    return (pairs >> np.uint64(42)).astype(np.int64), pairs & np.uint64((1 << 42) - 1)
+
+
+class FuzzyIndex:
+    """Bigram index for scoring many queries against one list of choices.
+
+    Args:
+        choices: Choices to match against
+
+    The index is picklable; ``match_many(processes=...)`` sends it to each
+    worker once.
+    """
+
+    def __init__(self, choices: Iterable[str]) -> None:
+        np = _numpy()
+        self.choices: List[str] = list(choices)
+        owners, keys = _bigrams(np, self.choices)
+        # Posting lists: choices holding each bigram, in choice order
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        self._postings = owners[order].astype(np.int32)
+        first = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+        if len(keys):
+            first = np.concatenate(([0], first))
+        self._vocab = keys[first]
+        self._offsets = np.append(first, len(keys)).astype(np.int64)
+        # Dice denominators: distinct bigrams per choice (at least 1, so an
+        # empty query against an empty choice does not divide by zero)
+        sizes = np.bincount(owners, minlength=len(self.choices))
+        self._sizes = np.maximum(sizes, 1).astype(np.float32)
+
+    def __len__(self) -> int:
+        return len(self.choices)
+
+    def match(
+        self, query: str, limit: int = 10, threshold: float = 0.0
+    ) -> List[Tuple[str, float]]:
+        """Return the best `limit` ``(choice, score)`` pairs for one query."""
+        return self._match_batch([query], limit, threshold)[0]
+
+    def match_many(
+        self,
+        queries: Iterable[str],
+        limit: int = 10,
+        threshold: float = 0.0,
+        processes: Optional[int] = 1,
+        chunk_size: int = 1024,
+    ) -> Iterator[List[Tuple[str, float]]]:
+        """Match many queries, scoring them in vectorized batches.
+
+        Args:
+            queries: Queries to match
+            limit: Results per query (top-k)
+            threshold: Lowest score returned
+            processes: Worker processes; ``None`` uses ``os.cpu_count()``,
+                ``1`` matches in this process
+            chunk_size: Queries sent to a worker per task
+
+        Yields:
+            For each query, in input order, up to `limit` ``(choice, score)``
+            pairs, best first; choices sharing no bigram with the query are
+            left out
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        chunked = chunks(queries, chunk_size)
+        workers = processes or os.cpu_count() or 1
+        if workers == 1:
+            for chunk in chunked:
+                yield from self._match_batch(chunk, limit, threshold)
+            return
+
+        results = map_chunks(
+            _match_chunk,
+            chunked,
+            workers,
+            initializer=_init_worker,
+            initargs=(pickle.dumps(self),),
+            args=(limit, threshold),
+        )
+        for chunk_results in results:
+            yield from chunk_results
+
+    def _match_batch(
+        self, queries: List[str], limit: int, threshold: float
+    ) -> List[List[Tuple[str, float]]]:
+        np = _numpy()
+        count = len(self.choices)
+        results: List[List[Tuple[str, float]]] = []
+        if not queries or not len(self._vocab) or limit < 1:
+            return [[] for _ in queries]
+        owners, keys = _bigrams(np, queries)
+        query_sizes = np.bincount(owners, minlength=len(queries)).astype(np.float32)
+        # Bigrams the choices never use still count towards the query size.
+        slots = np.minimum(np.searchsorted(self._vocab, keys), len(self._vocab) - 1)
+        known = self._vocab[slots] == keys
+        owners, slots = owners[known], slots[known]
+
+        batch = max(1, _BATCH_CELLS // count)
+        k = min(limit, count)
+        postings, offsets = self._postings, self._offsets
+        bounds = np.searchsorted(owners, np.arange(len(queries) + 1)).tolist()
+        for start in range(0, len(queries), batch):
+            stop = min(start + batch, len(queries))
+            # shared[row, choice]: bigrams query `start + row` has in common
+            # with the choice, counted over the query's posting lists
+            shared = np.zeros((stop - start, count), dtype=np.float32)
+            for row in range(stop - start):
+                lo, hi = bounds[start + row], bounds[start + row + 1]
+                if lo == hi:
+                    continue
+                lists = [
+                    postings[offsets[slot] : offsets[slot + 1]]
+                    for slot in slots[lo:hi].tolist()
+                ]
+                shared[row] = np.bincount(np.concatenate(lists), minlength=count)
+            denominators = query_sizes[start:stop, None] + self._sizes
+            scores = shared / denominators
+            if k < count:
+                top = np.argpartition(scores, count - k, axis=1)[:, count - k :]
+            else:
+                top = np.broadcast_to(np.arange(count), scores.shape)
+            for row, candidates in enumerate(top):
+                # Exact scores for the few candidates kept
+                row_shared = shared[row, candidates].astype(np.float64)
+                row_scores = 2.0 * row_shared / denominators[row, candidates]
+                # Best first, earlier choices first among equal scores
+                order = np.lexsort((candidates, -row_scores))
+                results.append(
+                    [
+                        (self.choices[index], score)
+                        for index, score in zip(
+                            candidates[order].tolist(), row_scores[order].tolist()
+                        )
+                        if score > 0 and score >= threshold
+                    ]
+                )
+        return results
+
+
+def _init_worker(index_bytes: bytes) -> None:
+    global _WORKER_INDEX
+    _WORKER_INDEX = pickle.loads(index_bytes)
+
+
+def _match_chunk(
+    queries: List[str], limit: int, threshold: float
+) -> List[List[Tuple[str, float]]]:
+    assert _WORKER_INDEX is not None, "worker was not initialized"
+    return _WORKER_INDEX._match_batch(queries, limit, threshold)
+
+
+__all__ = ["FuzzyChoiceCompleter", "FuzzyIndex", "FuzzyMatcher"]
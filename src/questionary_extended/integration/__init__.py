@@ -5,10 +5,29 @@ This module handles seamless integration with the original questionary library:
 - Questionary Bridge: Compatibility layer ensuring existing code works unchanged
 - Validators: Enhanced validation system with questionary compatibility
 - Result Conversion: Format conversion between questionary and qe results
+- Headless: Replay of recorded answers without prompt_toolkit
+- Bulk: Process-pool validation of recorded answer sets
+- Server: Multi-session telnet server sharing one compiled page
 """
 
+from .bulk import validate_answer_sets
+from .headless import (
+    FieldError,
+    HeadlessAnswerError,
+    HeadlessBridge,
+    ReplayResult,
+    replay_answer_sets,
+)
 from .questionary_bridge import QuestionaryBridge
+from .server import PageServer
 
 __all__ = [
     "QuestionaryBridge",
+    "HeadlessBridge",
+    "HeadlessAnswerError",
+    "FieldError",
+    "ReplayResult",
+    "replay_answer_sets",
+    "validate_answer_sets",
+    "PageServer",
 ]
@@ -0,0 +1,95 @@
+"""
+Bulk validation of recorded answer sets for questionary-extended.
+
+Fans answer records out over a :class:`concurrent.futures.ProcessPoolExecutor`
+and replays each one headlessly (see :mod:`.headless`) against the same page
+definition:
+
+- The page is pickled once in the parent and unpickled once per worker
+- Records are sent in chunks, with a bounded number of chunks in flight so
+  arbitrarily large inputs are streamed rather than loaded
+- Results come back in input order, one list of field errors per record
+
+Validators and ``on_change`` handlers must be picklable (module-level
+functions or the classes in ``validators.py``), since the page travels to
+the workers.
+"""
+
+import os
+import pickle
+from typing import Any, Iterable, Iterator, List, Optional, Union
+
+from .._parallel import chunks, map_chunks
+from ..core.plan import PagePlan, plan_for
+from ..core.state import PageState
+from .headless import AnswerSource, FieldError, HeadlessBridge, iter_jsonl
+
+# Per-worker plan, installed once by _init_worker
+_WORKER_PLAN: Optional[PagePlan] = None
+
+
+def _validate_records(
+    plan: PagePlan, records: Iterable[AnswerSource]
+) -> List[List[FieldError]]:
+    results: List[List[FieldError]] = []
+    for answers in records:
+        bridge = HeadlessBridge(PageState(), answers, strict=False)
+        bridge.run(plan)
+        results.append(bridge.errors)
+    return results
+
+
+def _init_worker(page_bytes: bytes) -> None:
+    global _WORKER_PLAN
+    _WORKER_PLAN = plan_for(pickle.loads(page_bytes))
+
+
+def _validate_chunk(records: List[AnswerSource]) -> List[List[FieldError]]:
+    assert _WORKER_PLAN is not None, "worker was not initialized"
+    return _validate_records(_WORKER_PLAN, records)
+
+
+def validate_answer_sets(
+    page: Any,
+    answer_sets: Union[str, "os.PathLike[str]", Iterable[AnswerSource]],
+    processes: Optional[int] = None,
+    chunk_size: int = 256,
+) -> Iterator[List[FieldError]]:
+    """Validate many recorded answer sets against a page in parallel.
+
+    Args:
+        page: Page definition (or component list) to validate against
+        answer_sets: JSONL path (one answer set per line), or iterable of
+            answer sources as accepted by HeadlessBridge
+        processes: Worker processes; defaults to ``os.cpu_count()``. With
+            ``1`` records are validated in this process
+        chunk_size: Records sent to a worker per task
+
+    Yields:
+        For each record, in input order, the list of field errors (empty
+        when the record is valid)
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if isinstance(answer_sets, (str, os.PathLike)):
+        answer_sets = iter_jsonl(answer_sets)
+
+    workers = processes or os.cpu_count() or 1
+    if workers == 1:
+        plan = plan_for(page)
+        for chunk in chunks(answer_sets, chunk_size):
+            yield from _validate_records(plan, chunk)
+        return
+
+    results = map_chunks(
+        _validate_chunk,
+        chunks(answer_sets, chunk_size),
+        workers,
+        initializer=_init_worker,
+        initargs=(pickle.dumps(page),),
+    )
+    for chunk_results in results:
+        yield from chunk_results
+
+
+__all__ = ["validate_answer_sets"]
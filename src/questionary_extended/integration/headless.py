@@ -0,0 +1,205 @@
+"""
+Headless replay backend for questionary-extended.
+
+Runs pages from recorded answers instead of interactive prompts. No
+questionary or prompt_toolkit objects are created; each visible component
+takes its answer from the recording, is validated with the component's own
+validators and is written to PageState, so `when` conditions and Assembly
+``on_change`` handlers behave exactly as in an interactive run.
+
+Answer sources:
+- A mapping of component name to answer (``{"web.port": "8000"}``)
+- Any other iterable/iterator, consumed positionally: one answer per
+  visible component, in page order
+- A JSONL file of answer sets (one mapping per line) via
+  :func:`replay_answer_sets` or :func:`iter_jsonl`
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Union,
+)
+
+from ..core.component import Component
+from ..core.plan import PlanEntry, plan_for
+from ..core.state import PageState
+from .questionary_bridge import QuestionaryBridge
+
+AnswerSource = Union[Mapping[str, Any], Iterable[Any]]
+
+_NO_ANSWER = object()
+
+
+@dataclass
+class FieldError:
+    """A recorded answer that could not be applied to a component."""
+
+    name: str
+    message: str
+
+
+class HeadlessAnswerError(ValueError):
+    """Raised in strict mode when a recorded answer is missing or invalid."""
+
+    def __init__(self, error: FieldError) -> None:
+        super().__init__(f"{error.name}: {error.message}")
+        self.error = error
+
+
+@dataclass
+class ReplayResult:
+    """Outcome of replaying one answer set against a page."""
+
+    state: Dict[str, Any]
+    errors: List[FieldError] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+
+class HeadlessBridge(QuestionaryBridge):
+    """QuestionaryBridge that answers components from recorded answers.
+
+    Args:
+        state: PageState receiving the answers
+        answers: Mapping of component name to answer, or an iterable
+            consumed positionally for each visible component
+        strict: Raise :class:`HeadlessAnswerError` on the first missing or
+            invalid answer; otherwise collect them in :attr:`errors` and
+            continue without writing the rejected value
+    """
+
+    def __init__(
+        self, state: PageState, answers: AnswerSource, strict: bool = True
+    ) -> None:
+        # Recorded answers never render a prompt, so neither choices nor
+        # prompt objects are built ahead.
+        super().__init__(state, prefetch=0, prebuild=0)
+        self.strict = strict
+        self.errors: List[FieldError] = []
+        if isinstance(answers, Mapping):
+            self._answers: Optional[Mapping[str, Any]] = answers
+            self._sequence: Optional[Iterator[Any]] = None
+        else:
+            self._answers = None
+            self._sequence = iter(answers)
+
+    def _recorded(self, name: str) -> Any:
+        if self._answers is not None:
+            return self._answers.get(name, _NO_ANSWER)
+        return next(self._sequence, _NO_ANSWER)  # type: ignore[arg-type]
+
+    def _fail(self, name: str, message: str) -> None:
+        error = FieldError(name, message)
+        if self.strict:
+            raise HeadlessAnswerError(error)
+        self.errors.append(error)
+
+    def _take(self, name: str, component: Any) -> Any:
+        """Return the recorded (or default) answer, or _NO_ANSWER."""
+        value = self._recorded(name)
+        if value is _NO_ANSWER:
+            config = getattr(component, "config", {})
+            if "default" not in config:
+                self._fail(name, "No recorded answer")
+                return _NO_ANSWER
+            value = config["default"]
+        return value
+
+    def _answer(self, name: str, component: Any) -> Any:
+        value = self._take(name, component)
+        if value is _NO_ANSWER:
+            return None
+
+        validate = getattr(component, "validate_answer", None)
+        message = validate(value) if validate is not None else None
+        if message is not None:
+            self._fail(name, message)
+            return None
+
+        self.state.set(name, value)
+        return value
+
+    async def _answer_async(self, name: str, component: Any) -> Any:
+        value = self._take(name, component)
+        if value is _NO_ANSWER:
+            return None
+
+        validate = getattr(component, "validate_answer_async", None)
+        message = await validate(value) if validate is not None else None
+        if message is not None:
+            self._fail(name, message)
+            return None
+
+        self.state.set(name, value)
+        return value
+
+    def ask_component(self, component: Component) -> Any:
+        """Answer a single Component from the recording."""
+        return self._answer(component.name, component)
+
+    async def ask_component_async(self, component: Component) -> Any:
+        """Answer a single Component from the recording; validators may be async."""
+        return await self._answer_async(component.name, component)
+
+    def _ask_entry(self, entry: PlanEntry) -> Any:
+        return self._answer(entry.name, entry.component)
+
+    async def _ask_entry_async(self, entry: PlanEntry) -> Any:
+        return await self._answer_async(entry.name, entry.component)
+
+
+def iter_jsonl(path: Union[str, "os.PathLike[str]"]) -> Iterator[Dict[str, Any]]:
+    """Yield one answer set per non-blank line of a JSONL file."""
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def replay_answer_sets(
+    page: Any,
+    answer_sets: Union[str, "os.PathLike[str]", Iterable[AnswerSource]],
+) -> Iterator[ReplayResult]:
+    """Replay many recorded answer sets against one page definition.
+
+    Each answer set runs against a fresh PageState; the page's own state is
+    not touched. Missing or invalid answers are reported per result rather
+    than raised.
+
+    Args:
+        page: Page (anything with ``plan()``), PagePlan, or component list
+        answer_sets: JSONL path, or iterable of answer sources
+
+    Yields:
+        One :class:`ReplayResult` per answer set, in input order
+    """
+    if isinstance(answer_sets, (str, os.PathLike)):
+        answer_sets = iter_jsonl(answer_sets)
+
+    plan = plan_for(page)
+    for answers in answer_sets:
+        state = PageState()
+        bridge = HeadlessBridge(state, answers, strict=False)
+        bridge.run(plan)
+        yield ReplayResult(state.get_all_state(), bridge.errors)
+
+
+__all__ = [
+    "FieldError",
+    "HeadlessAnswerError",
+    "HeadlessBridge",
+    "ReplayResult",
+    "iter_jsonl",
+    "replay_answer_sets",
+]
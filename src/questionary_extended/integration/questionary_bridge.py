@@ -8,11 +8,33 @@ This is a minimal, incremental implementation intended to be expanded as the
 core Page/Card/Assembly APIs are completed.
 """
 
-from typing import Any, Iterable
+import asyncio
+import contextvars
+import dataclasses
 import importlib
+import inspect
+import time
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from types import SimpleNamespace
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from ..core.component import Component
+from ..core.plan import PagePlan, PlanEntry, compile_plan, walk_components
 from ..core.state import PageState
 
 
@@ -41,12 +63,32 @@ _FALLBACK_QUESTIONARY = SimpleNamespace(
 # even if the real runtime resolver isn't configured.
 questionary = _FALLBACK_QUESTIONARY
 
+_MISSING = object()
 
-class QuestionaryBridge:
-    """Lightweight bridge to run questionary prompts from core components."""
 
-    def __init__(self, state: PageState) -> None:
+class QuestionaryBridge:
+    """Lightweight bridge to run questionary prompts from core components.
+
+    Args:
+        state: PageState receiving the answers
+        prefetch: Number of upcoming visible components with a choice
+            provider whose choices are loaded on a thread pool while the
+            current question is answered; ``0`` disables prefetching
+        prebuild: Number of upcoming visible components whose prompt
+            objects :meth:`run` builds in a background thread while the
+            current question is answered; ``0`` (the default) builds each
+            on demand
+
+    After a run, :attr:`question_gaps` holds the seconds between each answer
+    and the next question being ready to ask.
+    """
+
+    def __init__(self, state: PageState, prefetch: int = 3, prebuild: int = 0) -> None:
         self.state = state
+        self.prefetch = prefetch
+        self.prebuild = prebuild
+        self.question_gaps: List[float] = []
+        self._answered_at: Optional[float] = None
 
     def _resolve_questionary(self):
         """Resolve the active questionary object using the preferred order:
@@ -87,6 +129,10 @@ class QuestionaryBridge:
         The Component wrapper exposes `create_questionary_component()` which
         returns a questionary prompt object (for supported component types).
         """
+        return self._ask(component.name, component.create_questionary_component)
+
+    def _create_prompt(self, create: Callable[[], Any]) -> Any:
+        """Build a prompt object with `create`, normalizing creation errors."""
         questionary = self._resolve_questionary()
 
         # If the resolved questionary is explicitly absent (tests may set
@@ -102,7 +148,7 @@ class QuestionaryBridge:
         # raised during `.ask()` to propagate so calling code can handle
         # specific exceptions like KeyboardInterrupt.
         try:
-            prompt = component.create_questionary_component()
+            return create()
         except Exception as e:
             try:
                 from prompt_toolkit.output.win32 import NoConsoleScreenBufferError
@@ -114,6 +160,11 @@ class QuestionaryBridge:
 
             raise RuntimeError(f"questionary prompt creation failed: {e}") from e
 
+    def _ask(self, name: str, create: Callable[[], Any]) -> Any:
+        """Build a prompt with `create`, ask it and store the answer under `name`."""
+        prompt = self._create_prompt(create)
+        self._question_ready()
+
         # Wrap `.ask()` exceptions into a normalized RuntimeError message so
         # tests that assert on the bridge's error text remain stable. Preserve
         # the original exception as the __cause__.
@@ -121,55 +172,376 @@ class QuestionaryBridge:
             answer = prompt.ask()
         except Exception as e:
             raise RuntimeError("prompt failed") from e
+        self._answered_at = time.perf_counter()
 
         # Persist into state using the component name (global key)
         # Callers may prefer to namespace the key (assembly.field) themselves
-        self.state.set(component.name, answer)
+        self.state.set(name, answer)
         return answer
 
-    def _walk_components(self, items: Iterable[Any]) -> Iterable[Component]:
-        """Yield Component instances from nested Card/Assembly/component containers."""
-        for item in items:
-            # Prefer duck-typing over strict isinstance checks so tests that
-            # load modules in isolation (file-based imports) still work when
-            # objects implement the expected interface.
-            if hasattr(item, "create_questionary_component") and hasattr(item, "name"):
-                # Component-like object
-                yield item
-                continue
+    def _ask_entry(self, entry: PlanEntry) -> Any:
+        """Answer one visible plan entry; backends override this hook."""
+        return self._ask(entry.name, entry.create)
+
+    async def ask_component_async(self, component: Component) -> Any:
+        """Asynchronous :meth:`ask_component` built on questionary's ``ask_async``."""
+        await self._resolve_choices_async(component)
+        return await self._ask_async(
+            component.name, component.create_questionary_component, component
+        )
+
+    async def _ask_async(
+        self, name: str, create: Callable[[], Any], component: Any = None
+    ) -> Any:
+        """Async counterpart of :meth:`_ask`.
+
+        Coroutine validators cannot run inside prompt_toolkit's validation,
+        so answers are checked with ``component.validate_answer_async`` after
+        the prompt returns and the question is asked again on failure.
+        Nothing is written to state until an answer is accepted, so
+        cancelling while the prompt waits leaves PageState untouched.
+        """
+        validate = getattr(component, "validate_answer_async", None)
+        while True:
+            prompt = self._create_prompt(create)
+            self._question_ready()
+            try:
+                answer = await prompt.ask_async()
+            except Exception as e:
+                raise RuntimeError("prompt failed") from e
+            self._answered_at = time.perf_counter()
+
+            # None means the user aborted the prompt; store it as `_ask` does.
+            if answer is None or validate is None:
+                break
+            message = await validate(answer)
+            if message is None:
+                break
+            self._report(message)
+
+        self.state.set(name, answer)
+        return answer
 
-            # Container-like: object that exposes a `components` attribute
-            comps = getattr(item, "components", None)
-            if comps is None:
-                # Unknown/unsupported item: ignore
-                continue
+    def _question_ready(self) -> None:
+        """Record the gap since the previous answer (see `question_gaps`)."""
+        if self._answered_at is not None:
+            self.question_gaps.append(time.perf_counter() - self._answered_at)
+            self._answered_at = None
 
-            # Iterate the child components and recurse where necessary
-            for c in comps:
-                # If child looks like a Component, yield it; otherwise recurse
-                if hasattr(c, "create_questionary_component") and hasattr(c, "name"):
-                    yield c
-                else:
-                    yield from self._walk_components(getattr(c, "components", []))
+    def _report(self, message: str) -> None:
+        """Show a rejected-answer message on the prompts' output.
 
-    def run(self, root_items: Iterable[Any]) -> None:
+        Written through the current prompt_toolkit app session, so it
+        reaches the same terminal (or session output) as the prompts.
         """
-        Run all components found under `root_items` (typically a Page.components list).
+        from prompt_toolkit import print_formatted_text
 
-        Results are written into the provided PageState instance.
-        """
-        for component in self._walk_components(root_items):
-            # Determine visibility; visibility code may raise, so default to
-            # visible on error to avoid hiding components unexpectedly.
-            try:
-                visible = component.is_visible(self.state.get_all_state())
-            except Exception:
-                visible = True
+        print_formatted_text(message)
 
-            if not visible:
-                continue
+    async def _ask_entry_async(self, entry: PlanEntry) -> Any:
+        """Answer one visible plan entry asynchronously; backends override this hook."""
+        await self._resolve_choices_async(entry.component)
+        return await self._ask_async(entry.name, entry.create, entry.component)
 
-            self.ask_component(component)
+    @staticmethod
+    async def _resolve_choices_async(component: Any) -> None:
+        # Load provider choices off the event loop before building the
+        # prompt, which then reads them from the cache.
+        resolve = getattr(component, "resolve_choices_async", None)
+        if resolve is not None:
+            await resolve()
+
+    def _walk_components(self, items: Iterable[Any]) -> Iterable[Component]:
+        """Yield Component instances from nested Card/Assembly/component containers."""
+        return walk_components(items)
+
+    def run(
+        self, root_items: Union[PagePlan, Iterable[Any]], skip_answered: bool = False
+    ) -> None:
+        """
+        Run all components of a compiled PagePlan, or found under `root_items`
+        (typically a Page.components list, compiled on the fly).
+
+        Results are written into the provided PageState instance. Visibility
+        is evaluated once up front and afterwards only for the components
+        whose `when` condition reads a key that changed. With
+        `skip_answered`, components whose key is already in state (e.g.
+        restored from a journal) are not asked again.
+        """
+        plan = root_items if isinstance(root_items, PagePlan) else compile_plan(root_items)
+        plan.install_computed(self.state)
+        tracker = _DependencyTracker(plan, self.state)
+        prefetcher = _ChoicePrefetcher(plan, tracker, self.prefetch)
+        builder = _PromptBuilder(plan, tracker, self.prebuild)
+        answered = frozenset(self.state.view()) if skip_answered else frozenset()
+        self._start_run()
+        self.state.watch(tracker.on_change)
+        self.state.watch(builder.on_change)
+        try:
+            for index, entry in enumerate(plan.entries):
+                if entry.name in answered or not tracker.is_visible(index):
+                    continue
+
+                prefetcher.after(index, answered)
+                prebuilt = builder.take(index)
+                builder.after(index, answered)
+                if prebuilt is not None:
+                    entry = dataclasses.replace(entry, create=prebuilt.result)
+                self._ask_entry(entry)
+                # The answer and the writes of its handlers form one burst.
+                self.state.commit()
+        finally:
+            self.state.unwatch(tracker.on_change)
+            self.state.unwatch(builder.on_change)
+            prefetcher.close()
+            builder.close()
+
+    def _start_run(self) -> None:
+        self.question_gaps = []
+        self._answered_at = None
+
+    async def run_async(
+        self, root_items: Union[PagePlan, Iterable[Any]], skip_answered: bool = False
+    ) -> None:
+        """Asynchronous :meth:`run` for use inside an event loop.
+
+        Assembly ``on_change`` handlers may be coroutine functions; they are
+        awaited in registration order after each answer. If the run is
+        cancelled while such handlers are pending, the state written since
+        that answer (the answer itself and anything its handlers set) is
+        rolled back, so PageState holds only fully processed answers.
+        """
+        plan = root_items if isinstance(root_items, PagePlan) else compile_plan(root_items)
+        plan.install_computed(self.state)
+        tracker = _DependencyTracker(plan, self.state, allow_async=True)
+        prefetcher = _ChoicePrefetcher(plan, tracker, self.prefetch)
+        answered = frozenset(self.state.view()) if skip_answered else frozenset()
+        self._start_run()
+        self.state.watch(tracker.on_change)
+        try:
+            for index, entry in enumerate(plan.entries):
+                if entry.name in answered or not tracker.is_visible(index):
+                    continue
+
+                prefetcher.after(index, answered)
+
+                # Only answers with change handlers can be interrupted after
+                # the write, so only those need a checkpoint.
+                # Stored keys only: computed entries follow on their own.
+                checkpoint = (
+                    dict(zip(*self.state.export()))
+                    if entry.name in plan.change_handlers
+                    else None
+                )
+                try:
+                    await self._ask_entry_async(entry)
+                    await tracker.drain()
+                    self.state.commit()
+                except asyncio.CancelledError:
+                    if checkpoint is not None:
+                        self.state.unwatch(tracker.on_change)
+                        self._restore(checkpoint)
+                    raise
+        finally:
+            self.state.unwatch(tracker.on_change)
+            tracker.discard()
+            prefetcher.close()
+
+    def _restore(self, checkpoint: Dict[str, Any]) -> None:
+        """Return state to `checkpoint`, touching only keys that differ."""
+        current = self.state.view()
+        for key in [k for k in current if k not in checkpoint]:
+            self.state.delete(key)
+        for key, value in checkpoint.items():
+            if current.get(key, _MISSING) is not value:
+                self.state.set(key, value)
+
+
+class _ChoicePrefetcher:
+    """Loads choice providers of upcoming components on a thread pool."""
+
+    def __init__(self, plan: PagePlan, tracker: "_DependencyTracker", window: int) -> None:
+        self.plan = plan
+        self.tracker = tracker
+        self.window = window
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Plan indices of components whose choices come from a provider
+        self._indices: List[int] = []
+        if window > 0:
+            self._indices = [
+                index
+                for index, entry in enumerate(plan.entries)
+                if getattr(entry.component, "choice_provider", None) is not None
+            ]
+
+    def after(self, index: int, answered: FrozenSet[str]) -> None:
+        """Prefetch for the next visible components following `index`."""
+        if not self._indices:
+            return
+        entries = self.plan.entries
+        started = 0
+        for upcoming in self._indices[bisect_right(self._indices, index) :]:
+            if started == self.window:
+                break
+            entry = entries[upcoming]
+            if entry.name in answered or not self.tracker.is_visible(upcoming):
+                continue
+            started += 1
+            component = entry.component
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.window, thread_name_prefix="questionary-extended-choices"
+                )
+            component.choice_cache.prefetch(component.choice_provider, self._executor)
+
+    def close(self) -> None:
+        # Loads already queued still finish and fill the cache.
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+class _PromptBuilder:
+    """Builds prompt objects of upcoming components in a background thread.
+
+    A prebuilt prompt is dropped when a key its component's ``when``
+    condition reads changes, and built again if still needed.
+    """
+
+    def __init__(self, plan: PagePlan, tracker: "_DependencyTracker", window: int) -> None:
+        self.plan = plan
+        self.tracker = tracker
+        self.window = window
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._built: Dict[int, "Future[Any]"] = {}
+        # Builds run in the caller's context so scoped backends apply.
+        self._context = contextvars.copy_context()
+
+    def take(self, index: int) -> Optional["Future[Any]"]:
+        """Hand over the prompt built for `index`, if any."""
+        return self._built.pop(index, None)
+
+    def after(self, index: int, answered: FrozenSet[str]) -> None:
+        """Start building the next visible prompts following `index`."""
+        if self.window <= 0:
+            return
+        entries = self.plan.entries
+        pending = self.window
+        for upcoming in range(index + 1, len(entries)):
+            if not pending:
+                break
+            entry = entries[upcoming]
+            if entry.name in answered or not self.tracker.is_visible(upcoming):
+                continue
+            pending -= 1
+            if upcoming not in self._built:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="questionary-extended-prompts"
+                    )
+                self._built[upcoming] = self._executor.submit(
+                    self._context.run, entry.create
+                )
+
+    def on_change(self, key: str) -> None:
+        for index in self.plan.dependents.get(key, ()):
+            future = self._built.pop(index, None)
+            if future is not None:
+                future.cancel()
+
+    def close(self) -> None:
+        # Every queued build is in _built; cancel them by hand, as
+        # shutdown(cancel_futures=True) needs Python 3.9.
+        for future in self._built.values():
+            future.cancel()
+        self._built.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+class _DependencyTracker:
+    """Visibility cache for one bridge run over a PagePlan.
+
+    Visibility is evaluated once per component. When a state key changes
+    only the components reading that key (per the plan's reverse index) are
+    re-evaluated, and any Assembly ``on_change`` handlers registered for the
+    key are fired. With ``allow_async`` coroutine handlers are queued for
+    :meth:`drain`; otherwise they are rejected.
+    """
+
+    def __init__(self, plan: PagePlan, state: PageState, allow_async: bool = False) -> None:
+        self.plan = plan
+        self.view = state.view()
+        self._dispatching: Set[str] = set()
+        self.pending: Optional[Deque[Tuple[str, Awaitable[Any]]]] = (
+            deque() if allow_async else None
+        )
+        # None marks components without declared dependencies; those are
+        # evaluated when reached, as before.
+        self.visible: List[Optional[bool]] = [
+            None if entry.dependencies is None else self._evaluate(entry.component)
+            for entry in plan.entries
+        ]
+
+    def _evaluate(self, component: Any) -> bool:
+        # Visibility code may raise, so default to visible on error to avoid
+        # hiding components unexpectedly.
+        try:
+            return bool(component.is_visible(self.view))
+        except Exception:
+            return True
+
+    def is_visible(self, index: int) -> bool:
+        visible = self.visible[index]
+        if visible is None:
+            return self._evaluate(self.plan.entries[index].component)
+        return visible
+
+    def on_change(self, key: str) -> None:
+        entries = self.plan.entries
+        for index in self.plan.dependents.get(key, ()):
+            self.visible[index] = self._evaluate(entries[index].component)
+
+        handlers = self.plan.change_handlers.get(key)
+        # A handler that writes the key it watches must not re-trigger itself.
+        if handlers and key not in self._dispatching:
+            self._dispatching.add(key)
+            try:
+                value = self.view.get(key)
+                for handler, assembly in handlers:
+                    result = handler(value, assembly)
+                    if inspect.isawaitable(result):
+                        self._defer(key, result)
+            finally:
+                self._dispatching.discard(key)
+
+    def _defer(self, key: str, awaitable: Awaitable[Any]) -> None:
+        if self.pending is None:
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+            raise RuntimeError(
+                f"on_change handler for {key!r} is a coroutine; use run_async()"
+            )
+        self.pending.append((key, awaitable))
+
+    async def drain(self) -> None:
+        """Await queued coroutine handlers, including any they trigger."""
+        pending = self.pending
+        while pending:
+            key, awaitable = pending.popleft()
+            self._dispatching.add(key)
+            try:
+                await awaitable
+            finally:
+                self._dispatching.discard(key)
+
+    def discard(self) -> None:
+        """Drop queued handlers that will never be awaited."""
+        while self.pending:
+            _, awaitable = self.pending.popleft()
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
 
 
 __all__ = ["QuestionaryBridge"]
@@ -0,0 +1,141 @@
+"""
+Multi-session terminal server for questionary-extended.
+
+Serves one page definition to many concurrent clients from a single
+process using prompt_toolkit's telnet server:
+
+- The page is compiled once; every session shares the same immutable
+  :class:`~questionary_extended.core.plan.PagePlan`
+- Each connection gets its own PageState and prompt_toolkit app session,
+  so answers, visibility and ``on_change`` effects never leak between
+  clients
+- Sessions run as tasks on one event loop via the bridge's async path
+
+Because the component tree is shared, anything an ``on_change`` handler
+writes through its Assembly or a captured page goes to the page's own
+PageState, not to the session's; pages served this way should derive
+follow-up visibility from ``when`` conditions instead.
+"""
+
+import asyncio
+import inspect
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+from ..core.plan import PagePlan, plan_for
+from ..core.state import PageState
+from .questionary_bridge import QuestionaryBridge
+
+CompletionCallback = Callable[[Dict[str, Any], Any], Union[None, Awaitable[None]]]
+
+
+class _SessionBridge(QuestionaryBridge):
+    """Bridge that reports rejected answers to its own connection."""
+
+    def __init__(self, state: PageState, connection: Any = None) -> None:
+        super().__init__(state)
+        self.connection = connection
+
+    def _report(self, message: str) -> None:
+        if self.connection is None:
+            super()._report(message)
+        else:
+            self.connection.send(f"{message}\n")
+
+
+class PageServer:
+    """Serve a page to many telnet clients at once.
+
+    Args:
+        page: Page (anything with ``plan()``), PagePlan, or component list.
+            It is compiled once, when the server is created
+        host: Interface to listen on
+        port: TCP port to listen on
+        on_complete: Optional callback (or coroutine function) called with
+            the session's flat state and its connection once a client has
+            answered every visible component
+        encoding: Character encoding used on the wire
+        enable_cpr: Ask clients for cursor position reports; disable for
+            clients that do not answer them
+    """
+
+    def __init__(
+        self,
+        page: Any,
+        host: str = "127.0.0.1",
+        port: int = 2323,
+        on_complete: Optional[CompletionCallback] = None,
+        encoding: str = "utf-8",
+        enable_cpr: bool = True,
+    ) -> None:
+        self.plan: PagePlan = plan_for(page)
+        self.host = host
+        self.port = port
+        self.on_complete = on_complete
+        self.encoding = encoding
+        self.enable_cpr = enable_cpr
+        self.active_sessions = 0
+
+    async def run_session(
+        self, state: Optional[PageState] = None, connection: Any = None
+    ) -> Dict[str, Any]:
+        """Run the shared plan once inside the current app session.
+
+        Args:
+            state: PageState for this session; a fresh one by default
+            connection: Connection the session belongs to, if any
+
+        Returns:
+            Flat dictionary with the session's results
+        """
+        if state is None:
+            state = PageState()
+        self.active_sessions += 1
+        try:
+            await _SessionBridge(state, connection).run_async(self.plan)
+        finally:
+            self.active_sessions -= 1
+
+        result = state.get_all_state()
+        if self.on_complete is not None:
+            outcome = self.on_complete(result, connection)
+            if inspect.isawaitable(outcome):
+                await outcome
+        return result
+
+    async def _interact(self, connection: Any) -> None:
+        try:
+            await self.run_session(PageState(), connection)
+        except RuntimeError as exc:
+            # The client hung up mid-prompt; nothing to report to anyone.
+            if not isinstance(exc.__cause__, EOFError):
+                raise
+
+    async def serve(self, ready_cb: Optional[Callable[[], None]] = None) -> None:
+        """Accept telnet connections until cancelled.
+
+        Args:
+            ready_cb: Called once the server is listening
+        """
+        try:
+            from prompt_toolkit.contrib.telnet.server import TelnetServer
+        except ImportError as e:
+            raise RuntimeError("prompt_toolkit is required for PageServer") from e
+
+        server = TelnetServer(
+            host=self.host,
+            port=self.port,
+            interact=self._interact,
+            encoding=self.encoding,
+            enable_cpr=self.enable_cpr,
+        )
+        await server.run(ready_cb=ready_cb)
+
+    def serve_forever(self) -> None:
+        """Blocking :meth:`serve` for scripts; stop with Ctrl-C."""
+        try:
+            asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            pass
+
+
+__all__ = ["PageServer"]
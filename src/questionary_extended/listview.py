@@ -0,0 +1,559 @@
+"""
+Virtualized list control for very large ``select``/``checkbox`` prompts.
+
+questionary formats every choice on each redraw, so a keypress costs time
+proportional to the list. :class:`ListView` keeps the work proportional to
+the screen instead:
+
+- Choices stay in the caller's sequence (strings, ``name``/``value`` dicts,
+  questionary or ``components`` ``Choice``/``Separator`` objects, or a
+  columnar ``ChoiceList``) and are interpreted one row at a time, when
+  first shown
+- Only the rows in the viewport plus ``overscan`` rows either side are
+  formatted; their title fragments are cached and dropped as they scroll
+  out of range
+- Checkbox selection is an index bitmap (one bit per choice), so select
+  all/invert and reading the answer never touch the choice objects
+- Disabled choices and separators are skipped by the cursor
+
+``select_enhanced``, ``checkbox_enhanced`` and the ``core.component``
+``select``/``checkbox`` helpers switch to :func:`list_question` for lists
+longer than :data:`VIRTUALIZE_THRESHOLD` (or when passed ``virtualize=True``),
+as long as they run on the default questionary backend and do not ask for
+options only questionary's prompt implements (``use_search_filter``,
+``use_shortcuts``, ``use_indicator``); see :func:`should_virtualize`.
+"""
+
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from .components import ChoiceList, is_separator
+
+# prompt_toolkit style fragments: (style, text)
+Fragments = List[Tuple[str, str]]
+
+# Choice lists longer than this use the virtualized control by default
+VIRTUALIZE_THRESHOLD = 1000
+
+DEFAULT_OVERSCAN = 5
+
+
+# questionary select/checkbox options list_question does not implement, with
+# questionary's defaults; any other value needs questionary's own prompt.
+_QUESTIONARY_ONLY: Dict[str, Any] = {
+    "use_shortcuts": False,
+    "use_indicator": False,
+    "use_search_filter": False,
+}
+
+
+def unsupported_options(options: Mapping[str, Any]) -> List[str]:
+    """Names of the questionary-only options `options` asks for."""
+    return sorted(
+        name
+        for name, default in _QUESTIONARY_ONLY.items()
+        if name in options and options[name] != default
+    )
+
+
+def should_virtualize(
+    choices: Any,
+    virtualize: Optional[bool] = None,
+    options: Optional[Mapping[str, Any]] = None,
+) -> bool:
+    """Decide whether a prompt over `choices` should use :func:`list_question`.
+
+    By default, lists longer than :data:`VIRTUALIZE_THRESHOLD` are
+    virtualized unless `options` ask for something only questionary's
+    prompt implements (such as ``use_search_filter``); those keep
+    questionary's prompt.
+
+    Args:
+        choices: The prompt's choices (providers and other non-sequences are
+            left to questionary; a :class:`ChoiceList` always virtualizes)
+        virtualize: Explicit choice; ``None`` decides as described above
+        options: The prompt's other keyword arguments
+
+    Raises:
+        ValueError: If virtualization is required (``virtualize=True`` or a
+            ``ChoiceList``) but `options` ask for questionary-only features
+    """
+    if virtualize is False:
+        return False
+    unsupported = unsupported_options(options or {})
+    if virtualize or isinstance(choices, ChoiceList):
+        # questionary's factories cannot read ChoiceList rows
+        if unsupported:
+            raise ValueError(
+                f"The virtualized list does not support: {', '.join(unsupported)}"
+            )
+        return True
+    if unsupported:
+        return False
+    try:
+        return len(choices) > VIRTUALIZE_THRESHOLD
+    except TypeError:
+        return False
+
+
+def is_questionary_factory(factory: Any) -> bool:
+    """True for questionary's own prompt functions (the default backend).
+
+    Test, scoped (``use_backend``) and headless backends keep their own
+    factories, so their prompts are never swapped for :func:`list_question`.
+    """
+    return (getattr(factory, "__module__", None) or "").startswith("questionary.")
+
+
+def _title(title: Any) -> str:
+    if isinstance(title, list):
+        # questionary accepts formatted text titles
+        return "".join(fragment[1] for fragment in title)
+    return str(title)
+
+
+def describe(item: Any) -> Tuple[str, Any, Any, bool]:
+    """``(title, value, disabled, checked)`` for one choice.
+
+    ``disabled`` is falsy for selectable choices; a string explains why the
+    choice is disabled. Separators are reported as disabled.
+    """
+    if isinstance(item, str):
+        return item, item, None, False
+    if isinstance(item, dict):
+        title = _title(item.get("name"))
+        value = item.get("value")
+        return (
+            title,
+            title if value is None else value,
+            item.get("disabled"),
+            bool(item.get("checked")),
+        )
+    if is_separator(item):
+        line = getattr(item, "line", None) or getattr(item, "title", "") or "-" * 15
+        return str(line), None, True, False
+    title = _title(getattr(item, "title", item))
+    value = getattr(item, "value", None)
+    return (
+        title,
+        title if value is None else value,
+        getattr(item, "disabled", None),
+        bool(getattr(item, "checked", False)),
+    )
+
+
+def _description(item: Any) -> Optional[str]:
+    if isinstance(item, dict):
+        return item.get("description")
+    return getattr(item, "description", None)
+
+
+class ListView:
+    """Cursor, scroll and selection state over a list of choices.
+
+    Args:
+        choices: Choices in display order
+        height: Rows rendered at once
+        multi: Track a checkbox selection
+        overscan: Rows kept formatted above and below the viewport
+        default: Value (or choice) the cursor starts on
+        pointer: Marker for the cursor row
+    """
+
+    def __init__(
+        self,
+        choices: Sequence[Any],
+        height: int = 10,
+        multi: bool = False,
+        overscan: int = DEFAULT_OVERSCAN,
+        default: Any = None,
+        pointer: str = "»",
+    ) -> None:
+        if height < 1:
+            raise ValueError("height must be at least 1")
+        if overscan < 0:
+            raise ValueError("overscan must not be negative")
+        self.choices = choices
+        self.height = height
+        self.multi = multi
+        self.overscan = overscan
+        self.pointer = pointer
+        self.cursor = 0
+        self.top = 0
+        # row -> (title fragments, selectable) for rows near the viewport
+        self._rows: Dict[int, Tuple[Fragments, bool]] = {}
+        # Bit `row` of `_bits` is set for checked rows, of `_blocked` for
+        # disabled rows and separators (read up front only for checkboxes)
+        self._bits = bytearray((len(choices) + 7) >> 3)
+        self._blocked = bytearray(len(self._bits))
+        if multi:
+            self._scan_flags()
+        if default is not None:
+            self._move_to_default(default)
+        if not self.selectable(self.cursor):
+            self.cursor = self._nearest(self.cursor, 1)
+        self._scroll()
+
+    def __len__(self) -> int:
+        return len(self.choices)
+
+    def _scan_flags(self) -> None:
+        """Read initial checked flags and unselectable rows into bitmaps."""
+        if isinstance(self.choices, ChoiceList):
+            blocked_bits = int.from_bytes(
+                self.choices.bitmap(ChoiceList.DISABLED), "little"
+            )
+            checked_bits = int.from_bytes(
+                self.choices.bitmap(ChoiceList.CHECKED), "little"
+            )
+            self._blocked = bytearray(blocked_bits.to_bytes(len(self._bits), "little"))
+            self._store(checked_bits & ~blocked_bits)
+            return
+        checked, blocked = self._bits, self._blocked
+        for index, item in enumerate(self.choices):
+            if isinstance(item, str):
+                continue
+            _, _, disabled, is_checked = describe(item)
+            if disabled:
+                blocked[index >> 3] |= 1 << (index & 7)
+            elif is_checked:
+                checked[index >> 3] |= 1 << (index & 7)
+
+    def _move_to_default(self, default: Any) -> None:
+        for index, item in enumerate(self.choices):
+            if item is default or describe(item)[1] == default:
+                self.cursor = index
+                return
+
+    def selectable(self, row: int) -> bool:
+        """True if `row` exists and is neither disabled nor a separator."""
+        if not 0 <= row < len(self.choices):
+            return False
+        cached = self._rows.get(row)
+        if cached is not None:
+            return cached[1]
+        return not describe(self.choices[row])[2]
+
+    def _nearest(self, row: int, step: int) -> int:
+        """First selectable row from `row` in direction `step`, then the other way."""
+        for direction in (step, -step):
+            probe = row
+            while 0 <= probe < len(self.choices):
+                if self.selectable(probe):
+                    return probe
+                probe += direction
+        return self.cursor
+
+    @property
+    def selected(self) -> Any:
+        """Choice under the cursor (None for an empty list)."""
+        return self.choices[self.cursor] if self.choices else None
+
+    @property
+    def value(self) -> Any:
+        """Value of the choice under the cursor."""
+        return describe(self.choices[self.cursor])[1] if self.choices else None
+
+    def move(self, delta: int) -> None:
+        """Move the cursor by `delta` rows, clamped and skipping disabled rows."""
+        if not self.choices or not delta:
+            return
+        target = min(max(self.cursor + delta, 0), len(self.choices) - 1)
+        self.cursor = self._nearest(target, 1 if delta > 0 else -1)
+        self._scroll()
+
+    def move_to(self, row: int) -> None:
+        self.move(row - self.cursor)
+
+    def move_to_end(self) -> None:
+        self.move_to(len(self.choices) - 1)
+
+    def _scroll(self) -> None:
+        if self.cursor < self.top:
+            self.top = self.cursor
+        elif self.cursor >= self.top + self.height:
+            self.top = self.cursor - self.height + 1
+
+    # Selection bitmap
+
+    def is_checked(self, row: int) -> bool:
+        return bool(self._bits[row >> 3] >> (row & 7) & 1)
+
+    def toggle(self, row: Optional[int] = None) -> None:
+        """Flip the checked state of a selectable row (the cursor's by default)."""
+        row = self.cursor if row is None else row
+        if self.multi and self.selectable(row):
+            self._bits[row >> 3] ^= 1 << (row & 7)
+
+    def _selectable_mask(self) -> int:
+        blocked = int.from_bytes(self._blocked, "little")
+        return ((1 << len(self.choices)) - 1) & ~blocked
+
+    def _store(self, bits: int) -> None:
+        self._bits = bytearray(bits.to_bytes(len(self._bits), "little"))
+
+    def toggle_all(self) -> None:
+        """Check every selectable row, or clear them all if already checked."""
+        every = self._selectable_mask()
+        self._store(0 if int.from_bytes(self._bits, "little") == every else every)
+
+    def invert(self) -> None:
+        self._store(int.from_bytes(self._bits, "little") ^ self._selectable_mask())
+
+    def checked_rows(self) -> Iterator[int]:
+        """Checked rows in ascending order."""
+        for index, byte in enumerate(self._bits):
+            while byte:
+                low = byte & -byte
+                yield (index << 3) + low.bit_length() - 1
+                byte ^= low
+
+    def checked_values(self) -> List[Any]:
+        return [describe(self.choices[row])[1] for row in self.checked_rows()]
+
+    # Rendering
+
+    def _format(self, row: int) -> Tuple[Fragments, bool]:
+        cached = self._rows.get(row)
+        if cached is None:
+            item = self.choices[row]
+            title, _, disabled, _ = describe(item)
+            if is_separator(item):
+                cached = ([("class:separator", title)], False)
+            elif disabled:
+                reason = f" ({disabled})" if isinstance(disabled, str) else ""
+                cached = ([("class:disabled", f"- {title}{reason}")], False)
+            else:
+                cached = ([("class:text", title)], True)
+            self._rows[row] = cached
+        return cached
+
+    def window(self) -> range:
+        """Rows currently on screen."""
+        return range(self.top, min(self.top + self.height, len(self.choices)))
+
+    def render(self) -> Fragments:
+        """Formatted text for the rows on screen."""
+        # Keep the overscan rows formatted so scrolling a row or a few
+        # reuses them, and forget rows that have scrolled out of range.
+        low = max(self.top - self.overscan, 0)
+        high = min(self.top + self.height + self.overscan, len(self.choices))
+        if len(self._rows) > high - low:
+            self._rows = {
+                row: cached for row, cached in self._rows.items() if low <= row < high
+            }
+        for row in range(low, high):
+            self._format(row)
+        fragments: Fragments = []
+        blank = " " * len(self.pointer)
+        for row in self.window():
+            title, selectable = self._format(row)
+            current = row == self.cursor
+            fragments.append(
+                ("class:pointer", f"{self.pointer} " if current else f"{blank} ")
+            )
+            if self.multi and selectable:
+                checked = self.is_checked(row)
+                fragments.append(
+                    ("class:selected" if checked else "", "● " if checked else "○ ")
+                )
+            if current and selectable:
+                fragments.extend(("class:highlighted", text) for _, text in title)
+            elif self.multi and selectable and self.is_checked(row):
+                fragments.extend(("class:selected", text) for _, text in title)
+            else:
+                fragments.extend(title)
+            fragments.append(("", "\n"))
+        if fragments:
+            fragments.pop()
+        return fragments
+
+
+def list_question(
+    message: str,
+    choices: Sequence[Any],
+    multi: bool = False,
+    height: int = 10,
+    overscan: int = DEFAULT_OVERSCAN,
+    default: Any = None,
+    qmark: str = "?",
+    pointer: str = "»",
+    instruction: Optional[str] = None,
+    validate: Any = None,
+    style: Any = None,
+    initial_choice: Any = None,
+    use_arrow_keys: bool = True,
+    use_jk_keys: bool = True,
+    use_emacs_keys: bool = True,
+    show_selected: bool = False,
+    show_description: bool = True,
+    **kwargs: Any,
+) -> Any:
+    """Build a questionary ``Question`` running a :class:`ListView`.
+
+    Keys: up/down (or ctrl-p/ctrl-n, k/j) move, page up/down jump a screen,
+    home/end go to the first/last choice and enter answers. With ``multi``,
+    space toggles the cursor's choice, ``a`` toggles all and ``i`` inverts;
+    the answer is the list of checked values, checked by ``validate`` (True
+    or an error message) when given.
+
+    The other options match questionary's ``select``/``checkbox``
+    (``initial_choice`` is checkbox's name for ``default``).
+
+    Raises:
+        ValueError: If there are no choices, or `kwargs` ask for a
+            questionary-only option (see :func:`unsupported_options`)
+    """
+    from prompt_toolkit.application import Application
+    from prompt_toolkit.filters import IsDone
+    from prompt_toolkit.key_binding import KeyBindings
+    from prompt_toolkit.keys import Keys
+    from prompt_toolkit.layout import ConditionalContainer, HSplit, Layout, Window
+    from prompt_toolkit.layout.controls import FormattedTextControl
+    from questionary import utils
+    from questionary.question import Question
+    from questionary.styles import merge_styles_default
+
+    if not choices:
+        raise ValueError("A list of choices needs to be provided.")
+    unsupported = unsupported_options(kwargs)
+    if unsupported:
+        raise ValueError(
+            f"The virtualized list does not support: {', '.join(unsupported)}"
+        )
+    if default is None:
+        default = initial_choice
+    view = ListView(
+        choices,
+        height=height,
+        multi=multi,
+        overscan=overscan,
+        default=default,
+        pointer=pointer,
+    )
+    answer: List[str] = []
+    error: List[str] = []
+
+    def prompt_tokens() -> Fragments:
+        tokens = [("class:qmark", qmark), ("class:question", f" {message} ")]
+        if answer:
+            tokens.append(("class:answer", answer[0]))
+        elif error:
+            tokens.append(("class:validation-toolbar", error[0]))
+        elif instruction is not None:
+            tokens.append(("class:instruction", instruction))
+        elif multi:
+            tokens.append(
+                (
+                    "class:instruction",
+                    "(Use arrow keys to move, <space> to select, <a> to toggle, <i> to invert)",
+                )
+            )
+        else:
+            tokens.append(("class:instruction", "(Use arrow keys)"))
+        return tokens
+
+    bindings = KeyBindings()
+
+    @bindings.add(Keys.ControlQ, eager=True)
+    @bindings.add(Keys.ControlC, eager=True)
+    def _abort(event: Any) -> None:
+        event.app.exit(exception=KeyboardInterrupt, style="class:aborting")
+
+    moves: Dict[Any, int] = {Keys.PageDown: height, Keys.PageUp: -height}
+    if use_arrow_keys:
+        moves.update({Keys.Down: 1, Keys.Up: -1})
+    if use_emacs_keys:
+        moves.update({Keys.ControlN: 1, Keys.ControlP: -1})
+    if use_jk_keys:
+        moves.update({"j": 1, "k": -1})
+    for key, delta in moves.items():
+        bindings.add(key, eager=True)(lambda event, delta=delta: view.move(delta))
+    bindings.add(Keys.Home, eager=True)(lambda event: view.move_to(0))
+    bindings.add(Keys.End, eager=True)(lambda event: view.move_to_end())
+    if multi:
+        bindings.add(" ", eager=True)(lambda event: view.toggle())
+        bindings.add("a", eager=True)(lambda event: view.toggle_all())
+        bindings.add("i", eager=True)(lambda event: view.invert())
+
+    @bindings.add(Keys.ControlM, eager=True)
+    def _enter(event: Any) -> None:
+        if not view.selectable(view.cursor) and not multi:
+            return
+        if not multi:
+            answer.append(describe(view.selected)[0])
+            event.app.exit(result=view.value)
+            return
+        values = view.checked_values()
+        if validate is not None:
+            verdict = validate(values)
+            if verdict is not True:
+                error[:] = ["Invalid input" if verdict is False else str(verdict)]
+                return
+        rows = list(view.checked_rows())
+        if not rows:
+            answer.append("done")
+        elif len(rows) == 1:
+            answer.append(f"[{describe(view.choices[rows[0]])[0]}]")
+        else:
+            answer.append(f"done ({len(rows)} selections)")
+        event.app.exit(result=values)
+
+    @bindings.add(Keys.Any)
+    def _other(event: Any) -> None:
+        """Disallow inserting other text."""
+
+    def footer_tokens() -> Fragments:
+        tokens: Fragments = []
+        item = view.selected
+        if show_selected and item is not None:
+            tokens.append(("class:text", f"  Answer: {describe(item)[0]}\n"))
+        description = _description(item) if show_description else None
+        if description is not None:
+            tokens.append(("class:text", f"  Description: {description}\n"))
+        if tokens:
+            style_, text = tokens[-1]
+            tokens[-1] = (style_, text[:-1])
+        return tokens
+
+    layout = Layout(
+        HSplit(
+            [
+                Window(
+                    FormattedTextControl(prompt_tokens),
+                    height=1,
+                    dont_extend_height=True,
+                ),
+                ConditionalContainer(
+                    HSplit(
+                        [
+                            Window(FormattedTextControl(view.render), height=height),
+                            Window(
+                                FormattedTextControl(footer_tokens),
+                                dont_extend_height=True,
+                            ),
+                        ]
+                    ),
+                    filter=~IsDone(),
+                ),
+            ]
+        )
+    )
+    return Question(
+        Application(
+            layout=layout,
+            key_bindings=bindings,
+            style=merge_styles_default([style]),
+            **utils.used_kwargs(kwargs, Application.__init__),
+        )
+    )
+
+
+__all__ = [
+    "DEFAULT_OVERSCAN",
+    "VIRTUALIZE_THRESHOLD",
+    "ListView",
+    "is_questionary_factory",
+    "list_question",
+    "should_virtualize",
+    "unsupported_options",
+]
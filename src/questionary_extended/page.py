@@ -1,7 +1,11 @@
-from typing import Any, Dict
+import os
+from typing import Any, Dict, Optional, Union
 
+from .core.journal import StateJournal
 from .core.page import Page as CorePage
+from .integration.headless import AnswerSource, HeadlessBridge
 from .integration.questionary_bridge import QuestionaryBridge
+from .integration.server import PageServer
 
 
 class Page(CorePage):
@@ -12,9 +16,41 @@ class Page(CorePage):
     execute components added to the page.
     """
 
-    def run(self) -> Dict[str, Any]:
+    def run(
+        self,
+        journal: Optional[Union[str, "os.PathLike[str]", StateJournal]] = None,
+        skip_answered: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """Execute the page interactively.
+
+        Args:
+            journal: Optional StateJournal (or journal path). Answers
+                recorded by an earlier, interrupted run are restored first
+                and new answers are journaled.
+            skip_answered: Do not ask components that already have a value
+                in ``self.state`` (e.g. restored from `journal`, or a
+                resumed SQLitePageState session). Defaults to True when a
+                journal is given and False otherwise.
+
+        Returns:
+            Flat dictionary with component results
+        """
+        if skip_answered is None:
+            skip_answered = journal is not None
+        if journal is not None:
+            if not isinstance(journal, StateJournal):
+                journal = StateJournal(journal)
+            journal.attach(self.state)
+            try:
+                QuestionaryBridge(self.state).run(
+                    self.plan(), skip_answered=skip_answered
+                )
+            finally:
+                journal.close()
+            return self.state.get_all_state()
+
         bridge = QuestionaryBridge(self.state)
-        bridge.run(self.components)
+        bridge.run(self.plan(), skip_answered=skip_answered)
         # Return flattened state for convenience
         try:
             return self.state.get_all_state()
@@ -22,3 +58,41 @@ class Page(CorePage):
             # Fallback to a simple dict if PageState doesn't implement
             # get_all_state
             return {}
+
+    async def run_async(self) -> Dict[str, Any]:
+        """Execute the page inside a running event loop.
+
+        Returns:
+            Flat dictionary with component results
+        """
+        await QuestionaryBridge(self.state).run_async(self.plan())
+        return self.state.get_all_state()
+
+    def replay(self, answers: AnswerSource, strict: bool = True) -> Dict[str, Any]:
+        """Execute the page headlessly from recorded answers.
+
+        Args:
+            answers: Mapping of component name to answer, or an iterable
+                consumed positionally for each visible component
+            strict: Raise HeadlessAnswerError on a missing/invalid answer
+
+        Returns:
+            Flat dictionary with component results
+        """
+        HeadlessBridge(self.state, answers, strict=strict).run(self.plan())
+        return self.state.get_all_state()
+
+    async def serve(
+        self, host: str = "127.0.0.1", port: int = 2323, **kwargs: Any
+    ) -> None:
+        """Serve this page to many telnet clients until cancelled.
+
+        The page is compiled once and shared; each connection is answered
+        into its own PageState, so ``self.state`` is not touched.
+
+        Args:
+            host: Interface to listen on
+            port: TCP port to listen on
+            **kwargs: Further PageServer options (``on_complete``, ...)
+        """
+        await PageServer(self, host=host, port=port, **kwargs).serve()
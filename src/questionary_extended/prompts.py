@@ -53,7 +53,7 @@ def _lazy_factory(name: str):
 
     return _f
 
-from .components import Column, ProgressStep
+from .components import Column, ProgressStep, TreeNode
 try:
     # Prefer direct relative import (normal package import)
     from .prompts_core import LazyQuestion, _lazy_factory
@@ -290,42 +290,39 @@ def color(
 
 def tree_select(
     message: str,
-    choices: Dict[str, Any],
+    choices: Union[Dict[str, Any], TreeNode],
     expanded: bool = False,
     show_icons: bool = True,
+    height: int = 10,
     **kwargs: Any,
 ) -> "LazyQuestion | Any":
     """
     Tree-based selection with hierarchical navigation.
 
+    Branches are expanded on demand and only ``height`` rows are rendered,
+    so opening a huge tree costs what is on screen (see :mod:`.tree`).
+
     Args:
         message: The question to ask
-        choices: Nested dictionary representing the tree structure
-        expanded: Whether to expand all nodes by default
+        choices: Nested dictionary representing the tree structure, or a
+            ``TreeNode`` whose children (possibly loaded lazily through
+            ``TreeNode.loader``) form the top level
+        expanded: Whether to expand all nodes by default (dictionary
+            trees; ``TreeNode`` trees use each node's ``expanded`` flag)
         show_icons: Show folder/file icons
+        height: Rows shown at once
         **kwargs: Additional questionary arguments
 
     Returns:
-        Question instance
+        Question instance answering the chosen leaf's path (``"a/b/item"``)
+        for dictionaries, or its ``value`` for ``TreeNode`` trees
     """
-    # Convert nested dict to flat choices for now
-    flat_choices = []
-
-    def flatten_dict(d: Dict[str, Any], prefix: str = "") -> List[str]:
-        items = []
-        for key, value in d.items():
-            if isinstance(value, dict):
-                items.append(f"{prefix}{key}/")
-                items.extend(flatten_dict(value, f"{prefix}{key}/"))
-            else:
-                if isinstance(value, list):
-                    items.extend([f"{prefix}{key}/{item}" for item in value])
-                else:
-                    items.append(f"{prefix}{key}")
-        return items
+    from .tree import tree_from_dict, tree_question
 
-    flat_choices = flatten_dict(choices)
-    return LazyQuestion(_lazy_factory("select"), message, choices=flat_choices, **kwargs)
+    root = choices if isinstance(choices, TreeNode) else tree_from_dict(choices, expanded)
+    return LazyQuestion(
+        tree_question, message, root, height=height, show_icons=show_icons, **kwargs
+    )
 
 
 def multi_level_select(
@@ -368,16 +365,29 @@ def fuzzy_select(
     """
     Fuzzy search selection with ranking.
 
+    Completions come from a prebuilt :class:`~questionary_extended.fuzzy.FuzzyMatcher`
+    index, so each keystroke narrows the previous results instead of
+    rescanning every choice.
+
     Args:
         message: The question to ask
         choices: List of choices to search
         min_score: Minimum fuzzy match score (0.0-1.0)
         case_sensitive: Whether search is case sensitive
-        **kwargs: Additional questionary arguments
+        **kwargs: Additional questionary arguments (a ``completer`` passed
+            here replaces the fuzzy one)
 
     Returns:
         Question instance
     """
+    from prompt_toolkit.completion import ThreadedCompleter
+
+    from .fuzzy import FuzzyChoiceCompleter, FuzzyMatcher
+
+    if "completer" not in kwargs:
+        matcher = FuzzyMatcher(choices, min_score=min_score, case_sensitive=case_sensitive)
+        # Searches run off the input thread, so typing never waits for one.
+        kwargs["completer"] = ThreadedCompleter(FuzzyChoiceCompleter(matcher))
     return LazyQuestion(_lazy_factory("autocomplete"), message, choices=choices, **kwargs)
 
 
@@ -7,6 +7,8 @@ from types import TracebackType
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 import importlib
 
+from .listview import is_questionary_factory, list_question, should_virtualize
+
 
 def _resolve_questionary():
     """Resolve the runtime `questionary` object via the centralized accessor.
@@ -229,11 +231,24 @@ def confirm_enhanced(message: str, default: bool = True, **kwargs: Any) -> "Lazy
 
 
 
+def _choice_question(
+    name: str, message: str, choices: List[Any], kwargs: Dict[str, Any]
+) -> "LazyQuestion":
+    virtualize = kwargs.pop("virtualize", None)
+    if is_questionary_factory(_lazy_factory(name)) and should_virtualize(
+        choices, virtualize, kwargs
+    ):
+        return LazyQuestion(
+            list_question, message, choices, multi=name == "checkbox", **kwargs
+        )
+    return LazyQuestion(name, message, choices=choices, **kwargs)
+
+
 def select_enhanced(message: str, choices: List[Any], **kwargs: Any) -> "LazyQuestion | Any":
-    """Enhanced selection prompt."""
-    return LazyQuestion("select", message, choices=choices, **kwargs)
+    """Enhanced selection prompt; large lists use the virtualized list control."""
+    return _choice_question("select", message, choices, kwargs)
 
 
 def checkbox_enhanced(message: str, choices: List[Any], **kwargs: Any) -> "LazyQuestion | Any":
-    """Enhanced checkbox prompt."""
-    return LazyQuestion("checkbox", message, choices=choices, **kwargs)
+    """Enhanced checkbox prompt; large lists use the virtualized list control."""
+    return _choice_question("checkbox", message, choices, kwargs)
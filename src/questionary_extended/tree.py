@@ -0,0 +1,349 @@
+"""
+Lazy, virtualized tree widget behind ``tree_select``.
+
+:class:`TreeView` keeps the tree's visible rows (expanded nodes' children,
+depth first) without materializing them up front:
+
+- Rows are produced by an explicit depth-first stack only as far as the
+  cursor or the screen needs them, so opening a tree, or expanding a node
+  with a million descendants, costs time proportional to the rows shown
+- Children are loaded on first expansion (``TreeNode.loader``)
+- Expand/collapse state is the nodes' ``expanded`` flag; the visible rows
+  are parallel compact arrays of depth, parent row and child position
+- Toggling a node truncates the rows after it and resumes the traversal
+  from that row, rebuilding the stack in O(depth)
+- Only the window of ``height`` rows around the cursor is rendered
+"""
+
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from .components import TreeNode
+
+# prompt_toolkit style fragments: (style, text)
+Fragments = List[Tuple[str, str]]
+
+
+class TreeView:
+    """Cursor and scroll state over the visible rows of a tree.
+
+    Args:
+        root: Tree whose children form the top level (the root itself is
+            not shown)
+        height: Rows rendered at once
+        show_icons: Prefix rows with folder/file icons (or ``node.icon``)
+    """
+
+    def __init__(
+        self, root: TreeNode, height: int = 10, show_icons: bool = True
+    ) -> None:
+        if height < 1:
+            raise ValueError("height must be at least 1")
+        self.root = root
+        self.height = height
+        self.show_icons = show_icons
+        self.cursor = 0
+        self.top = 0
+        self._nodes: List[TreeNode] = []
+        self._depths = array("l")
+        # Row of the parent (-1 for top-level rows) and index among its children
+        self._parents = array("l")
+        self._slots = array("l")
+        # Pending traversal: [parent row, children, next child index]
+        self._stack: List[List[Any]] = [[-1, root.load_children(), 0]]
+
+    def __len__(self) -> int:
+        """Rows produced so far (all of them once :attr:`complete`)."""
+        return len(self._nodes)
+
+    @property
+    def complete(self) -> bool:
+        """True once every visible row has been produced."""
+        return not self._stack
+
+    @property
+    def selected(self) -> Optional[TreeNode]:
+        """Node under the cursor (None for an empty tree)."""
+        return self._nodes[self.cursor] if self._fill(self.cursor + 1) else None
+
+    def node(self, row: int) -> TreeNode:
+        self._fill(row + 1)
+        return self._nodes[row]
+
+    def depth(self, row: int) -> int:
+        self._fill(row + 1)
+        return self._depths[row]
+
+    def parent_row(self, row: int) -> int:
+        self._fill(row + 1)
+        return self._parents[row]
+
+    def _fill(self, rows: int) -> int:
+        """Produce rows until there are `rows` of them or none are left."""
+        nodes, stack = self._nodes, self._stack
+        while len(nodes) < rows and stack:
+            frame = stack[-1]
+            parent, children, slot = frame
+            if slot >= len(children):
+                stack.pop()
+                continue
+            frame[2] = slot + 1
+            node = children[slot]
+            row = len(nodes)
+            nodes.append(node)
+            self._depths.append(self._depths[parent] + 1 if parent >= 0 else 0)
+            self._parents.append(parent)
+            self._slots.append(slot)
+            if node.expanded and not node.is_leaf():
+                stack.append([row, node.load_children(), 0])
+        return len(nodes)
+
+    def _resume(self, row: int) -> None:
+        """Drop the rows after `row` and continue the traversal from it."""
+        for rows in (self._depths, self._parents, self._slots):
+            del rows[row + 1 :]
+        del self._nodes[row + 1 :]
+        stack: List[List[Any]] = []
+        child = row
+        while child >= 0:
+            parent = self._parents[child]
+            siblings = (
+                self.root.children if parent < 0 else self._nodes[parent].children
+            )
+            stack.append([parent, siblings, self._slots[child] + 1])
+            child = parent
+        stack.reverse()
+        node = self._nodes[row]
+        if node.expanded and not node.is_leaf():
+            stack.append([row, node.load_children(), 0])
+        self._stack = stack
+
+    def expand(self, row: Optional[int] = None) -> bool:
+        """Expand a branch (the cursor's by default); False if not possible."""
+        row = self.cursor if row is None else row
+        node = self.node(row)
+        if node.expanded or node.is_leaf():
+            return False
+        node.expanded = True
+        self._resume(row)
+        return True
+
+    def collapse(self, row: Optional[int] = None) -> bool:
+        """Collapse an expanded branch; False if it was not expanded."""
+        row = self.cursor if row is None else row
+        node = self.node(row)
+        if not node.expanded:
+            return False
+        node.expanded = False
+        self._resume(row)
+        return True
+
+    def toggle(self, row: Optional[int] = None) -> None:
+        if not self.collapse(row):
+            self.expand(row)
+
+    def move(self, delta: int) -> None:
+        """Move the cursor by `delta` rows, clamped to the tree."""
+        target = max(self.cursor + delta, 0)
+        available = self._fill(target + 1)
+        if available:
+            self.cursor = min(target, available - 1)
+            self._scroll()
+
+    def move_to(self, row: int) -> None:
+        self.move(row - self.cursor)
+
+    def move_to_end(self) -> None:
+        """Move to the last row; produces every visible row."""
+        self._fill(1 << 62)
+        self.move_to(len(self._nodes) - 1)
+
+    def left(self) -> None:
+        """Collapse the cursor's branch, or move to its parent."""
+        if self._fill(1) and not self.collapse():
+            parent = self._parents[self.cursor]
+            if parent >= 0:
+                self.move_to(parent)
+
+    def right(self) -> None:
+        """Expand the cursor's branch, or move to its first child."""
+        if self._fill(1) and not self.expand():
+            node = self._nodes[self.cursor]
+            if node.expanded and not node.is_leaf():
+                self.move(1)
+
+    def _scroll(self) -> None:
+        if self.cursor < self.top:
+            self.top = self.cursor
+        elif self.cursor >= self.top + self.height:
+            self.top = self.cursor - self.height + 1
+
+    def window(self) -> List[Tuple[int, TreeNode, int]]:
+        """``(row, node, depth)`` for the rows currently on screen."""
+        end = min(self._fill(self.top + self.height), self.top + self.height)
+        return [
+            (row, self._nodes[row], self._depths[row]) for row in range(self.top, end)
+        ]
+
+    def render(self) -> Fragments:
+        """Formatted text for the rows on screen."""
+        fragments: Fragments = []
+        for row, node, depth in self.window():
+            current = row == self.cursor
+            fragments.append(("class:pointer", "» " if current else "  "))
+            fragments.append(("", "  " * depth))
+            if node.is_leaf():
+                fragments.append(("class:tree_branch", "  "))
+                icon = node.icon or "📄"
+            else:
+                fragments.append(("class:tree_branch", "▾ " if node.expanded else "▸ "))
+                icon = node.icon or "📁"
+            if self.show_icons:
+                fragments.append(("", f"{icon} "))
+            fragments.append(
+                ("class:tree_selected" if current else "class:tree_node", node.name)
+            )
+            fragments.append(("", "\n"))
+        if fragments:
+            fragments.pop()
+        return fragments
+
+
+def tree_from_dict(data: Dict[str, Any], expanded: bool = False) -> TreeNode:
+    """Lazily wrap a nested dict as a tree of path-valued nodes.
+
+    Dict values become branches whose children are built when first
+    expanded; list values become branches of leaves. Values are the
+    ``/``-joined paths ``tree_select`` returns: ``"a/b/"`` for branches,
+    ``"a/b/item"`` for leaves.
+    """
+    root = TreeNode(name="root", value="")
+    root.children = _dict_children(data, "", expanded)
+    return root
+
+
+def _dict_children(data: Dict[str, Any], prefix: str, expanded: bool) -> List[TreeNode]:
+    children = []
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            node = TreeNode(name=str(key), value=f"{path}/", expanded=expanded)
+            node.loader = _loader(value, f"{path}/", expanded)
+        elif isinstance(value, list):
+            node = TreeNode(name=str(key), value=f"{path}/", expanded=expanded)
+            node.children = [
+                TreeNode(name=str(item), value=f"{path}/{item}") for item in value
+            ]
+        else:
+            node = TreeNode(name=str(key), value=path)
+        children.append(node)
+    return children
+
+
+def _loader(data: Dict[str, Any], prefix: str, expanded: bool) -> Any:
+    return lambda node: _dict_children(data, prefix, expanded)
+
+
+def tree_question(
+    message: str,
+    root: TreeNode,
+    height: int = 10,
+    show_icons: bool = True,
+    qmark: str = "?",
+    style: Any = None,
+    **kwargs: Any,
+) -> Any:
+    """Build a questionary ``Question`` running a :class:`TreeView`.
+
+    Keys: up/down (or ctrl-p/ctrl-n) move, page up/down jump a screen,
+    home/end go to the first/last row, right/left expand/collapse (or move
+    to the first child/parent), space toggles, and enter answers a leaf's
+    ``value`` or toggles a branch.
+    """
+    from prompt_toolkit.application import Application
+    from prompt_toolkit.filters import IsDone
+    from prompt_toolkit.key_binding import KeyBindings
+    from prompt_toolkit.keys import Keys
+    from prompt_toolkit.layout import ConditionalContainer, HSplit, Layout, Window
+    from prompt_toolkit.layout.controls import FormattedTextControl
+    from questionary import utils
+    from questionary.question import Question
+    from questionary.styles import merge_styles_default
+
+    view = TreeView(root, height=height, show_icons=show_icons)
+    answer: List[Any] = []
+
+    def prompt_tokens() -> Fragments:
+        tokens = [("class:qmark", qmark), ("class:question", f" {message} ")]
+        if answer:
+            tokens.append(("class:answer", str(answer[0])))
+        else:
+            tokens.append(
+                ("class:instruction", "(Use arrow keys, right/left to open/close)")
+            )
+        return tokens
+
+    bindings = KeyBindings()
+
+    @bindings.add(Keys.ControlQ, eager=True)
+    @bindings.add(Keys.ControlC, eager=True)
+    def _abort(event: Any) -> None:
+        event.app.exit(exception=KeyboardInterrupt, style="class:aborting")
+
+    moves = {
+        Keys.Down: 1,
+        Keys.ControlN: 1,
+        Keys.Up: -1,
+        Keys.ControlP: -1,
+        Keys.PageDown: height,
+        Keys.PageUp: -height,
+    }
+    for key, delta in moves.items():
+        bindings.add(key, eager=True)(lambda event, delta=delta: view.move(delta))
+    bindings.add(Keys.Home, eager=True)(lambda event: view.move_to(0))
+    bindings.add(Keys.End, eager=True)(lambda event: view.move_to_end())
+    bindings.add(Keys.Right, eager=True)(lambda event: view.right())
+    bindings.add(Keys.Left, eager=True)(lambda event: view.left())
+    bindings.add(" ", eager=True)(lambda event: view.toggle())
+
+    @bindings.add(Keys.ControlM, eager=True)
+    def _enter(event: Any) -> None:
+        node = view.selected
+        if node is None:
+            return
+        if not node.is_leaf():
+            view.toggle()
+            return
+        answer.append(node.value)
+        event.app.exit(result=node.value)
+
+    @bindings.add(Keys.Any)
+    def _other(event: Any) -> None:
+        """Disallow inserting other text."""
+
+    layout = Layout(
+        HSplit(
+            [
+                Window(
+                    FormattedTextControl(prompt_tokens),
+                    height=1,
+                    dont_extend_height=True,
+                ),
+                ConditionalContainer(
+                    Window(FormattedTextControl(view.render), height=height),
+                    filter=~IsDone(),
+                ),
+            ]
+        )
+    )
+    return Question(
+        Application(
+            layout=layout,
+            key_bindings=bindings,
+            style=merge_styles_default([style]),
+            **utils.used_kwargs(kwargs, Application.__init__),
+        )
+    )
+
+
+__all__ = ["TreeView", "tree_from_dict", "tree_question"]
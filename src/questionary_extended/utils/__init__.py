@@ -15,6 +15,8 @@ from difflib import SequenceMatcher
 from typing import Any, List, Tuple
 from urllib.parse import urlparse
 
+from ..fuzzy import FuzzyIndex
+
 
 def format_date(d: Any, fmt: str = "%Y-%m-%d") -> str:
     """Format a date-like object to a string."""
@@ -171,6 +173,7 @@ def create_progress_bar(current: float, total: float, width: int = 20) -> str:
 def fuzzy_match(
     q: str, choices: List[str], threshold: float = 0.0
 ) -> List[Tuple[str, float]]:
+    """Score every choice against `q`; see :class:`FuzzyIndex` for batches."""
     results: List[Tuple[str, float]] = []
     for c in choices:
         score = SequenceMatcher(None, q, c).ratio()
@@ -205,6 +208,7 @@ __all__ = [
     "center_text",
     "create_progress_bar",
     "fuzzy_match",
+    "FuzzyIndex",
     "validate_email",
     "validate_url",
 ]
@@ -0,0 +1,181 @@
+"""Integration tests for the asyncio execution path."""
+
+import asyncio
+import io
+
+import pytest
+from prompt_toolkit.application import create_app_session
+from prompt_toolkit.output.plain_text import PlainTextOutput
+
+from questionary_extended.core.choices import ChoiceCache
+from questionary_extended.core.component import select, text
+from questionary_extended.core.state import PageState
+from questionary_extended.integration import HeadlessBridge, QuestionaryBridge
+from questionary_extended.page import Page
+
+
+class _AsyncPrompt:
+    """Prompt stand-in whose ask_async yields to the loop before answering."""
+
+    def __init__(self, script, **kwargs):
+        self.message = kwargs["message"]
+        self.script = script
+        self.choices = kwargs.get("choices")
+
+    async def ask_async(self):
+        await asyncio.sleep(0)
+        answer = self.script[self.message].pop(0)
+        if self.choices is not None:
+            assert answer in self.choices
+        return answer
+
+
+@pytest.fixture
+def script(fake_questionary):
+    """Install a questionary stand-in answering from {message: [answers]}."""
+    answers = {}
+
+    def factory(**kwargs):
+        return _AsyncPrompt(answers, **kwargs)
+
+    fake_questionary(text=factory, select=factory)
+    return answers
+
+
+class TestRunAsync:
+    """Page.run_async / QuestionaryBridge.run_async."""
+
+    def test_async_handlers_are_awaited_before_next_question(self, script):
+        script.update({"Framework:": ["django"], "Secret:": ["s3cret"]})
+        page = Page()
+
+        async def on_framework(value, assembly):
+            await asyncio.sleep(0)
+            page.state.set("web.needs_secret", value == "django")
+
+        (
+            page.assembly("web")
+            .text("framework", message="Framework:")
+            .text("secret", message="Secret:", when="needs_secret")
+            .on_change("framework", on_framework)
+        )
+
+        result = asyncio.run(page.run_async())
+
+        assert result == {
+            "web.framework": "django",
+            "web.needs_secret": True,
+            "web.secret": "s3cret",
+        }
+
+    def test_async_validator_reasks_until_valid(self, script):
+        script["Port:"] = ["abc", "8080"]
+
+        async def numeric(value):
+            await asyncio.sleep(0)
+            return value.isdigit() or "Digits only"
+
+        state = PageState()
+        shown = io.StringIO()
+        with create_app_session(output=PlainTextOutput(shown)):
+            asyncio.run(
+                QuestionaryBridge(state).run_async(
+                    [text("port", message="Port:", validate=numeric)]
+                )
+            )
+
+        assert state.get("port") == "8080"
+        assert "Digits only" in shown.getvalue()
+
+    def test_pages_run_concurrently_on_one_loop(self, script):
+        pages = []
+        for i in range(20):
+            script[f"Name {i}:"] = [f"user{i}"]
+            page = Page()
+            page.card("c").text("name", message=f"Name {i}:")
+            pages.append(page)
+
+        async def run_all():
+            return await asyncio.gather(*(p.run_async() for p in pages))
+
+        results = asyncio.run(run_all())
+        assert results == [{"name": f"user{i}"} for i in range(20)]
+
+    def test_sync_run_rejects_coroutine_handler(self):
+        page = Page()
+
+        async def handler(value, assembly):
+            return None
+
+        page.assembly("a").text("x").on_change("x", handler)
+
+        with pytest.raises(RuntimeError, match="run_async"):
+            HeadlessBridge(page.state, {"a.x": "1"}).run(page.plan())
+
+
+class TestCancellation:
+    """Cancelling a run leaves only fully processed answers in state."""
+
+    def test_cancel_during_handler_rolls_back_answer(self):
+        page = Page()
+        started = asyncio.Event()
+
+        async def slow_handler(value, assembly):
+            page.state.set("a.derived", value * 2)
+            started.set()
+            await asyncio.sleep(10)
+
+        page.assembly("a").text("first").text("second").on_change(
+            "second", slow_handler
+        )
+
+        async def scenario():
+            bridge = HeadlessBridge(page.state, {"a.first": 1, "a.second": 2})
+            task = asyncio.create_task(bridge.run_async(page.plan()))
+            await started.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(scenario())
+
+        assert page.state.get_all_state() == {"a.first": 1}
+        assert page.state._watchers == []
+
+
+class TestAsyncChoiceProviders:
+    def test_coroutine_provider_is_awaited_off_the_loop(self, script):
+        script.update({"Region:": ["eu"]})
+
+        async def regions():
+            await asyncio.sleep(0)
+            return ["eu", "us"]
+
+        state = PageState()
+        component = select(
+            "region", message="Region:", choices=regions, choice_cache=ChoiceCache()
+        )
+        asyncio.run(QuestionaryBridge(state).run_async([component]))
+
+        assert state.get("region") == "eu"
+
+    def test_ask_component_async_resolves_providers_first(self, script):
+        script.update({"Region:": ["us"]})
+        provider_loops = []
+
+        async def regions():
+            provider_loops.append(asyncio.get_running_loop())
+            return ["eu", "us"]
+
+        async def ask():
+            component = select(
+                "region", message="Region:", choices=regions, choice_cache=ChoiceCache()
+            )
+            answer = await QuestionaryBridge(state).ask_component_async(component)
+            return answer, asyncio.get_running_loop()
+
+        state = PageState()
+        answer, loop = asyncio.run(ask())
+        assert answer == "us" and state.get("region") == "us"
+        # The provider ran on its own loop in a worker thread.
+        assert provider_loops and provider_loops[0] is not loop
@@ -0,0 +1,80 @@
+"""Integration tests for process-pool validation of answer sets."""
+
+import json
+
+import pytest
+
+from questionary_extended.integration import FieldError, validate_answer_sets
+from questionary_extended.page import Page
+from questionary_extended.validators import NumberValidator
+
+
+def _page():
+    page = Page()
+    (
+        page.assembly("svc")
+        .select("kind", ["web", "worker"])
+        .text("port", when="kind == 'web'", validate=NumberValidator(1, 65535))
+    )
+    return page
+
+
+def _is_big(qty):
+    # Module level so the page pickles for the process pool
+    return int(qty or 0) > 10
+
+
+def _computed_page():
+    page = Page()
+    (
+        page.assembly("order")
+        .text("qty")
+        .computed("big", _is_big, ["qty"])
+        .text("reason", when="big")
+    )
+    return page
+
+
+def _records(count):
+    for i in range(count):
+        port = "0" if i % 3 == 0 else str(1000 + i)
+        yield {"svc.kind": "web", "svc.port": port}
+
+
+def _expected(count):
+    return [
+        [FieldError("svc.port", "Value must be at least 1")] if i % 3 == 0 else []
+        for i in range(count)
+    ]
+
+
+class TestValidateAnswerSets:
+    """Results stream back per record, in input order."""
+
+    def test_in_process(self):
+        results = list(validate_answer_sets(_page(), _records(10), processes=1))
+        assert results == _expected(10)
+
+    def test_process_pool_preserves_order(self):
+        results = list(
+            validate_answer_sets(_page(), _records(50), processes=2, chunk_size=7)
+        )
+        assert results == _expected(50)
+
+    def test_jsonl_source(self, tmp_path):
+        path = tmp_path / "answers.jsonl"
+        path.write_text("\n".join(json.dumps(r) for r in _records(4)))
+        results = list(validate_answer_sets(_page(), path, processes=2))
+        assert results == _expected(4)
+
+    @pytest.mark.parametrize("processes", [1, 2])
+    def test_computed_fields_drive_when(self, processes):
+        records = [{"order.qty": "50"}, {"order.qty": "5"}]
+        results = list(
+            validate_answer_sets(_computed_page(), records, processes=processes)
+        )
+        assert results == [[FieldError("order.reason", "No recorded answer")], []]
+
+    def test_rejects_invalid_chunk_size(self):
+        with pytest.raises(ValueError):
+            list(validate_answer_sets(_page(), [], chunk_size=0))
@@ -0,0 +1,110 @@
+"""Integration tests for headless replay of recorded answers."""
+
+import json
+
+import pytest
+
+from questionary_extended.core.component import text
+from questionary_extended.core.state import PageState
+from questionary_extended.integration import (
+    FieldError,
+    HeadlessAnswerError,
+    HeadlessBridge,
+    replay_answer_sets,
+)
+from questionary_extended.page import Page
+from questionary_extended.validators import NumberValidator
+
+
+def _page():
+    page = Page()
+    (
+        page.assembly("web")
+        .select("framework", ["flask", "django"])
+        .text("port", when="framework == 'flask'", validate=NumberValidator(1, 65535))
+        .text("secret", when="framework == 'django'", default="changeme")
+    )
+    return page
+
+
+class TestHeadlessBridge:
+    """Answers come from the recording, not from prompts."""
+
+    def test_mapping_answers_respect_when(self):
+        result = _page().replay({"web.framework": "flask", "web.port": "8000"})
+        assert result == {"web.framework": "flask", "web.port": "8000"}
+
+    def test_default_used_when_answer_missing(self):
+        result = _page().replay({"web.framework": "django"})
+        assert result == {"web.framework": "django", "web.secret": "changeme"}
+
+    def test_positional_answers_skip_hidden_components(self):
+        result = _page().replay(iter(["flask", "443"]))
+        assert result == {"web.framework": "flask", "web.port": "443"}
+
+    def test_strict_mode_raises_on_invalid_answer(self):
+        with pytest.raises(HeadlessAnswerError) as excinfo:
+            _page().replay({"web.framework": "flask", "web.port": "99999"})
+        assert excinfo.value.error.name == "web.port"
+
+    def test_collect_mode_records_errors_and_skips_value(self):
+        state = PageState()
+        comp = text("age", validate=lambda v: v.isdigit() or "Digits only")
+        bridge = HeadlessBridge(state, {"age": "ten"}, strict=False)
+
+        bridge.run([comp, text("name")])
+
+        assert bridge.errors == [
+            FieldError("age", "Digits only"),
+            FieldError("name", "No recorded answer"),
+        ]
+        assert state.get_all_state() == {}
+
+    def test_component_validators_are_applied(self):
+        comp = text("code")
+        comp.add_validator(lambda v: len(v) == 3)
+        with pytest.raises(HeadlessAnswerError, match="Invalid input"):
+            HeadlessBridge(PageState(), {"code": "abcd"}).run([comp])
+
+    def test_does_not_touch_prompt_toolkit_factories(self, monkeypatch):
+        comp = text("name")
+        monkeypatch.setattr(
+            comp, "create_questionary_component", lambda: pytest.fail("prompt built")
+        )
+        HeadlessBridge(PageState(), {"name": "x"}).run([comp])
+
+
+class TestReplayAnswerSets:
+    """Many recorded runs against one page definition."""
+
+    def test_jsonl_source(self, tmp_path):
+        path = tmp_path / "answers.jsonl"
+        records = [
+            {"web.framework": "flask", "web.port": "80"},
+            {"web.framework": "flask", "web.port": "0"},
+        ]
+        path.write_text("\n".join(json.dumps(r) for r in records) + "\n\n")
+        page = _page()
+
+        results = list(replay_answer_sets(page, path))
+
+        assert [r.valid for r in results] == [True, False]
+        assert results[0].state == records[0]
+        assert results[1].errors[0].name == "web.port"
+        assert page.state.get_all_state() == {}
+
+    def test_computed_fields_drive_when_on_fresh_state(self):
+        page = Page()
+        (
+            page.assembly("order")
+            .text("qty")
+            .computed("big", lambda qty: int(qty or 0) > 10, ["qty"])
+            .text("reason", when="big")
+        )
+
+        results = list(
+            replay_answer_sets(page, [{"order.qty": "50"}, {"order.qty": "5"}])
+        )
+
+        assert results[0].errors == [FieldError("order.reason", "No recorded answer")]
+        assert results[1].valid
@@ -0,0 +1,107 @@
+"""Integration tests for resuming Page.run from a journal."""
+
+
+import pytest
+
+from questionary_extended.core.component import text
+from questionary_extended.page import Page
+
+
+class _Prompt:
+    def __init__(self, asked, answers, **kwargs):
+        self.message = kwargs["message"]
+        self.asked = asked
+        self.answers = answers
+
+    def ask(self):
+        self.asked.append(self.message)
+        answer = self.answers[self.message]
+        if isinstance(answer, BaseException):
+            raise answer
+        return answer
+
+
+@pytest.fixture
+def prompts(fake_questionary):
+    asked, answers = [], {}
+
+    def factory(**kwargs):
+        return _Prompt(asked, answers, **kwargs)
+
+    fake_questionary(text=factory)
+    return asked, answers
+
+
+def _page():
+    page = Page()
+    page.components.extend(
+        [
+            text("name", message="Name?"),
+            text("host", message="Host?"),
+            text("port", message="Port?"),
+        ]
+    )
+    return page
+
+
+class TestJournalResume:
+    """An interrupted run resumes at the first unanswered component."""
+
+    def test_resumed_run_skips_answered_components(self, prompts, tmp_path):
+        asked, answers = prompts
+        path = tmp_path / "run.journal"
+        answers.update({"Name?": "svc", "Host?": "db", "Port?": ConnectionError()})
+
+        with pytest.raises(RuntimeError):
+            _page().run(journal=path)
+        assert asked == ["Name?", "Host?", "Port?"]
+
+        asked.clear()
+        answers["Port?"] = "5432"
+        result = _page().run(journal=path)
+
+        assert asked == ["Port?"]
+        assert result == {"name": "svc", "host": "db", "port": "5432"}
+
+    def test_skip_answered_false_reasks_journaled_components(self, prompts, tmp_path):
+        asked, answers = prompts
+        path = tmp_path / "run.journal"
+        answers.update({"Name?": "svc", "Host?": "db", "Port?": "5432"})
+        _page().run(journal=path)
+
+        asked.clear()
+        answers["Host?"] = "db2"
+        result = _page().run(journal=path, skip_answered=False)
+
+        assert asked == ["Name?", "Host?", "Port?"]
+        assert result["host"] == "db2"
+        # The new answers were journaled too.
+        asked.clear()
+        assert _page().run(journal=path)["host"] == "db2"
+        assert asked == []
+
+
+class TestSQLiteSessionResume:
+    """A saved SQLite session resumes at its first unanswered component."""
+
+    def test_resumed_session_skips_answered_components(self, prompts, tmp_path):
+        from questionary_extended.core.sqlite_state import SQLiteStateStore
+
+        asked, answers = prompts
+        answers.update({"Name?": "svc", "Host?": "db", "Port?": ConnectionError()})
+
+        with SQLiteStateStore(tmp_path / "sessions.db") as store:
+            page = _page()
+            page.state = store.session("user-1")
+            with pytest.raises(RuntimeError):
+                page.run()
+
+        asked.clear()
+        answers["Port?"] = "5432"
+        with SQLiteStateStore(tmp_path / "sessions.db") as store:
+            page = _page()
+            page.state = store.session("user-1")
+            result = page.run(skip_answered=True)
+
+        assert asked == ["Port?"]
+        assert result == {"name": "svc", "host": "db", "port": "5432"}
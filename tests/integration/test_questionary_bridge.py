@@ -0,0 +1,237 @@
+"""Integration tests for QuestionaryBridge page execution."""
+
+import threading
+
+import pytest
+
+from questionary_extended import _runtime
+from questionary_extended.core.choices import ChoiceCache
+from questionary_extended.core.component import select, text
+from questionary_extended.core.state import PageState
+from questionary_extended.integration import QuestionaryBridge
+from questionary_extended.page import Page
+
+
+class _ScriptedPrompt:
+    """Prompt stand-in answering from a shared script keyed by message."""
+
+    def __init__(self, answers, asked, **kwargs):
+        self.message = kwargs.get("message")
+        self.answers = answers
+        self.asked = asked
+
+    def ask(self):
+        self.asked.append(self.message)
+        return self.answers[self.message]
+
+
+@pytest.fixture
+def scripted(fake_questionary):
+    """Install a questionary stand-in; returns (answers, asked) for the test."""
+    answers = {}
+    asked = []
+
+    def factory(**kwargs):
+        return _ScriptedPrompt(answers, asked, **kwargs)
+
+    fake_questionary(text=factory, select=factory)
+    return answers, asked
+
+
+class TestDependencyDrivenVisibility:
+    """Only components depending on a written key are re-evaluated."""
+
+    def test_when_condition_skips_hidden_components(self, scripted):
+        answers, asked = scripted
+        answers.update({"Type:": "cli", "Port:": "80", "Args:": "-v"})
+        state = PageState()
+
+        QuestionaryBridge(state).run(
+            [
+                text("app_type", message="Type:"),
+                text("port", message="Port:", when="app_type == 'web'"),
+                text("args", message="Args:", when="app_type == 'cli'"),
+            ]
+        )
+
+        assert asked == ["Type:", "Args:"]
+        assert state.get_all_state() == {"app_type": "cli", "args": "-v"}
+
+    def test_only_dependents_are_reevaluated(self, scripted):
+        answers, _ = scripted
+        answers.update({"A:": "yes", "B:": "b", "C:": "c"})
+        calls = {"b": 0, "c": 0}
+
+        b = text("b", message="B:", when="a == 'yes'")
+        c = text("c", message="C:", when="True")
+        for comp in (b, c):
+            original = comp.is_visible
+
+            def counting(state, _name=comp.name, _original=original):
+                calls[_name] += 1
+                return _original(state)
+
+            comp.is_visible = counting
+
+        QuestionaryBridge(PageState()).run([text("a", message="A:"), b, c])
+
+        # Initial pass plus one re-evaluation for `b` after `a` was answered.
+        assert calls == {"b": 2, "c": 1}
+
+    def test_on_change_handlers_fire_and_drive_visibility(self, scripted):
+        answers, asked = scripted
+        answers.update({"Framework:": "django", "Secret:": "s3cret"})
+        seen = []
+
+        page = Page()
+
+        def on_framework(value, assembly):
+            seen.append((value, assembly.name))
+            page.state.set("web.needs_secret", value == "django")
+
+        (
+            page.assembly("web")
+            .text("framework", message="Framework:")
+            .text("secret", message="Secret:", when="needs_secret")
+            .on_change("framework", on_framework)
+        )
+
+        result = page.run()
+
+        assert seen == [("django", "web")]
+        assert asked == ["Framework:", "Secret:"]
+        assert result["web.secret"] == "s3cret"
+
+    def test_run_detaches_from_state(self, scripted):
+        answers, _ = scripted
+        answers["A:"] = "x"
+        state = PageState()
+
+        QuestionaryBridge(state).run([text("a", message="A:")])
+
+        assert state._watchers == []
+
+
+class TestComputedState:
+    def test_computed_field_drives_visibility(self, scripted):
+        answers, asked = scripted
+        answers.update({"Qty:": 3, "Price:": 50, "Approver:": "ann"})
+
+        page = Page()
+        (
+            page.assembly("order")
+            .text("qty", message="Qty:")
+            .text("price", message="Price:")
+            .computed(
+                "total", lambda qty, price: (qty or 0) * (price or 0), ["qty", "price"]
+            )
+            .text("approver", message="Approver:", when="total > 100")
+        )
+
+        result = page.run()
+
+        assert asked == ["Qty:", "Price:", "Approver:"]
+        assert result["order.total"] == 150
+
+
+class TestChoicePrefetch:
+    def test_upcoming_providers_load_while_current_question_is_asked(self, scripted):
+        answers, asked = scripted
+        answers.update({"Name:": "svc", "Region:": "eu", "Zone:": "eu-1", "Tier:": "x"})
+        loads = []
+        cache = ChoiceCache()
+
+        def provider(label):
+            def load():
+                loads.append((label, threading.current_thread().name, list(asked)))
+                return [label]
+
+            return load
+
+        QuestionaryBridge(PageState(), prefetch=1).run(
+            [
+                text("name", message="Name:"),
+                select(
+                    "region",
+                    message="Region:",
+                    choices=provider("region"),
+                    choice_cache=cache,
+                ),
+                select(
+                    "zone",
+                    message="Zone:",
+                    choices=provider("zone"),
+                    choice_cache=cache,
+                ),
+                select(
+                    "tier",
+                    message="Tier:",
+                    choices=provider("tier"),
+                    choice_cache=cache,
+                    when="region == 'us'",
+                ),
+            ]
+        )
+
+        assert asked == ["Name:", "Region:", "Zone:"]
+        # Each provider ran once, on a prefetch thread, before its question;
+        # the hidden component's provider never ran.
+        assert [label for label, _, _ in loads] == ["region", "zone"]
+        assert all(
+            thread.startswith("questionary-extended-choices") for _, thread, _ in loads
+        )
+        assert "Zone:" not in loads[1][2]
+
+
+class TestPromptPrebuild:
+    @pytest.fixture
+    def built(self, scripted):
+        """Record the thread each prompt object was built on."""
+        answers, asked = scripted
+        threads = {}
+        backend = _runtime.get_questionary()
+
+        def factory(**kwargs):
+            threads.setdefault(kwargs["message"], []).append(
+                threading.current_thread().name
+            )
+            return _ScriptedPrompt(answers, asked, **kwargs)
+
+        backend.text = factory
+        return answers, asked, threads
+
+    def test_upcoming_prompts_are_built_in_background(self, built):
+        answers, asked, threads = built
+        answers.update({"A:": "a", "B:": "b", "C:": "c"})
+        bridge = QuestionaryBridge(PageState(), prebuild=2)
+
+        bridge.run(
+            [text("a", message="A:"), text("b", message="B:"), text("c", message="C:")]
+        )
+
+        assert asked == ["A:", "B:", "C:"]
+        assert threads["A:"] == ["MainThread"]
+        assert all(
+            names == [names[0]] and names[0].startswith("questionary-extended-prompts")
+            for message, names in threads.items()
+            if message != "A:"
+        )
+        assert len(bridge.question_gaps) == 2
+
+    def test_prompt_is_rebuilt_when_its_dependency_changes(self, built):
+        answers, asked, threads = built
+        answers.update({"Mode:": "x", "Detail:": "d"})
+        page = Page()
+
+        (
+            page.assembly("cfg")
+            .text("mode", message="Mode:")
+            .text("detail", message="Detail:", when="mode == 'x'")
+        )
+        page.state.set("cfg.mode", "x")
+        QuestionaryBridge(page.state, prebuild=2).run(page.plan())
+
+        # Built ahead while Mode: was asked, discarded when cfg.mode was
+        # answered, and built again.
+        assert asked == ["Mode:", "Detail:"]
+        assert len(threads["Detail:"]) == 2
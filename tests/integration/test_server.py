@@ -0,0 +1,129 @@
+"""Integration tests for the multi-session telnet server."""
+
+import asyncio
+import socket
+
+import pytest
+
+from questionary_extended.core.component import select, text
+from questionary_extended.core.state import PageState
+from questionary_extended.integration import PageServer
+from questionary_extended.page import Page
+
+pytest.importorskip("prompt_toolkit.contrib.telnet.server")
+
+# IAC SB TTYPE IS "vt100" IAC SE: lets the server create the client's output.
+TTYPE_REPLY = b"\xff\xfa\x18\x00vt100\xff\xf0"
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _read_until(reader, marker):
+    data = b""
+    while marker not in data:
+        chunk = await asyncio.wait_for(reader.read(4096), timeout=10)
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+async def _client(port, lines):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(TTYPE_REPLY)
+    for prompt, line in lines:
+        await _read_until(reader, prompt)
+        writer.write(line.encode() + b"\r")
+        await writer.drain()
+    # The server closes the connection once the page is finished.
+    await asyncio.wait_for(reader.read(), timeout=10)
+    writer.close()
+
+
+def _serve(page, clients, **kwargs):
+    port = _free_port()
+    results = []
+
+    async def main():
+        server = PageServer(
+            page,
+            port=port,
+            enable_cpr=False,
+            on_complete=lambda state, connection: results.append(state),
+            **kwargs,
+        )
+        ready = asyncio.Event()
+        task = asyncio.ensure_future(server.serve(ready_cb=ready.set))
+        await ready.wait()
+        try:
+            await asyncio.gather(*(_client(port, lines) for lines in clients))
+            for _ in range(100):
+                if len(results) == len(clients):
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        return server
+
+    return asyncio.run(main()), results
+
+
+def _page():
+    page = Page()
+    page.components.extend(
+        [
+            text("name", message="Name?"),
+            select("role", message="Role?", choices=["dev", "ops"]),
+            text("oncall", message="Pager?", when="role == 'ops'"),
+        ]
+    )
+    return page
+
+
+class TestPageServer:
+    """PageServer over a local telnet connection."""
+
+    def test_plan_is_compiled_once_and_shared(self):
+        page = _page()
+        server = PageServer(page)
+        assert server.plan is page.plan()
+
+    def test_each_client_gets_its_own_state(self):
+        page = _page()
+        clients = [
+            [(b"Name?", "alice"), (b"Role?", "")],
+            [(b"Name?", "bob"), (b"Role?", "\x1b[B"), (b"Pager?", "555")],
+        ]
+
+        server, results = _serve(page, clients)
+
+        assert sorted(results, key=lambda r: r["name"]) == [
+            {"name": "alice", "role": "dev"},
+            {"name": "bob", "role": "ops", "oncall": "555"},
+        ]
+        assert page.state.get_all_state() == {}
+        assert server.active_sessions == 0
+
+    def test_run_session_defaults_to_fresh_state(self, monkeypatch):
+        page = Page()
+        page.components.append(text("name", message="Name?"))
+        server = PageServer(page)
+
+        async def fake_run_async(self, plan):
+            self.state.set("name", "carol")
+
+        monkeypatch.setattr(
+            "questionary_extended.integration.server._SessionBridge.run_async",
+            fake_run_async,
+        )
+        state = PageState()
+        assert asyncio.run(server.run_session(state)) == {"name": "carol"}
+        assert asyncio.run(server.run_session()) == {"name": "carol"}
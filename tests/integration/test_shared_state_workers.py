@@ -0,0 +1,72 @@
+"""Worker processes reading a SharedPageState while the page is answered."""
+
+import multiprocessing
+
+import pytest
+
+from questionary_extended.core.shared_state import (
+    SharedPageState,
+    SharedStateReader,
+    StaleSnapshotError,
+)
+
+try:
+    _CONTEXT = multiprocessing.get_context("fork")
+except ValueError:  # pragma: no cover - platforms without fork
+    _CONTEXT = None
+
+pytestmark = pytest.mark.skipif(_CONTEXT is None, reason="needs the fork start method")
+
+
+def _read_artifact(name, results):
+    with SharedStateReader(name) as reader:
+        snapshot = reader.snapshot()
+        results.put((snapshot["build.target"], bytes(snapshot["build.assets"][:4])))
+
+
+def _check_consistency(name, reads, results):
+    torn = 0
+    with SharedStateReader(name) as reader:
+        for _ in range(reads):
+            snapshot = reader.snapshot()
+            try:
+                if snapshot["a"] != snapshot["b"]:
+                    torn += 1
+            except StaleSnapshotError:
+                pass
+    results.put(torn)
+
+
+def test_worker_reads_committed_state():
+    with SharedPageState(capacity=1 << 20) as state:
+        state.set_many(
+            {"build.target": "wheel", "build.assets": b"\x89PNG" + bytes(4096)}
+        )
+        state.commit()
+
+        results = _CONTEXT.Queue()
+        worker = _CONTEXT.Process(target=_read_artifact, args=(state.name, results))
+        worker.start()
+        assert results.get(timeout=30) == ("wheel", b"\x89PNG")
+        worker.join(timeout=30)
+        assert worker.exitcode == 0
+
+
+def test_readers_never_see_torn_images():
+    with SharedPageState(capacity=1 << 16) as state:
+        state.set_many({"a": 0, "b": 0})
+        state.commit()
+
+        results = _CONTEXT.Queue()
+        worker = _CONTEXT.Process(
+            target=_check_consistency, args=(state.name, 2000, results)
+        )
+        worker.start()
+        i = 0
+        while worker.is_alive() and i < 200_000:
+            i += 1
+            state.set_many({"a": i, "b": i})
+            state.commit()
+        assert results.get(timeout=60) == 0
+        worker.join(timeout=30)
+        assert worker.exitcode == 0
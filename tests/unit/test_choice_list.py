@@ -0,0 +1,140 @@
+"""Tests for the columnar ChoiceList."""
+
+from collections.abc import Sequence
+
+import pytest
+import questionary
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+
+from questionary_extended import ChoiceList
+from questionary_extended.components import Choice, Separator
+from questionary_extended.core.choices import ChoiceCache
+from questionary_extended.listview import ListView, list_question, should_virtualize
+
+DOWN, ENTER = "\x1b[B", "\r"
+
+
+def _mixed():
+    return ChoiceList(
+        [
+            "alpha",
+            {"name": "beta", "value": 2, "checked": True},
+            Choice("gamma", disabled=True, description="retired"),
+            {"name": "delta", "description": "fourth"},
+        ]
+    )
+
+
+class TestChoiceList:
+    def test_rows_are_choice_views(self):
+        choices = _mixed()
+        assert isinstance(choices, Sequence)
+        assert len(choices) == 4
+        assert choices[1] == Choice("beta", value=2, checked=True)
+        assert choices[-2] == Choice("gamma", disabled=True, description="retired")
+        assert [c.value for c in choices] == ["alpha", 2, "gamma", "delta"]
+        assert choices.index(Choice("delta", description="fourth")) == 3
+        with pytest.raises(IndexError):
+            choices[4]
+
+    def test_views_are_not_written_back(self):
+        choices = _mixed()
+        choices[0].checked = True
+        assert not choices.is_checked(0)
+        choices.set_checked(0)
+        choices.set_checked(1, False)
+        choices.set_disabled(3)
+        assert [c.checked for c in choices] == [True, False, False, False]
+        assert choices.is_disabled(3)
+
+    def test_slices(self):
+        part = _mixed()[1:]
+        assert isinstance(part, ChoiceList)
+        assert [c.title for c in part] == ["beta", "gamma", "delta"]
+        assert part[0].checked and part[1].description == "retired"
+        assert part.value(0) == 2
+
+    def test_values_column_is_created_on_demand(self):
+        choices = ChoiceList(["a", "b"])
+        assert choices._values is None
+        choices.append("c", value=3)
+        assert [c.value for c in choices] == ["a", "b", 3]
+
+    def test_from_titles(self):
+        choices = ChoiceList.from_titles(["x", "y"], values=[1, 2])
+        assert [(c.title, c.value) for c in choices] == [("x", 1), ("y", 2)]
+        with pytest.raises(ValueError):
+            ChoiceList.from_titles(["x"], values=[])
+
+    def test_bitmaps(self):
+        choices = ChoiceList.from_titles(str(i) for i in range(20))
+        for index in (0, 9, 19):
+            choices.set_checked(index)
+        assert int.from_bytes(choices.bitmap(ChoiceList.CHECKED), "little") == (
+            1 | 1 << 9 | 1 << 19
+        )
+        assert choices.bitmap(ChoiceList.DISABLED) == bytearray(3)
+        assert ChoiceList().bitmap(ChoiceList.CHECKED) == bytearray()
+
+    def test_separators_and_disabled_reasons_are_kept(self):
+        line = Separator("-- staging --")
+        choices = ChoiceList(
+            [
+                "prod",
+                line,
+                {"name": "stage-1", "disabled": "maintenance"},
+                Choice("stage-2", disabled="retired"),
+                questionary.Separator(),
+            ]
+        )
+        assert choices[1] is line
+        assert choices.is_separator(1) and choices.is_disabled(1)
+        assert choices.value(1) is None
+        assert choices[2].disabled == "maintenance"
+        assert choices.disabled_reason(3) == "retired"
+        assert isinstance(choices[4], questionary.Separator)
+        part = choices[1:3]
+        assert part[0] is line and part[1].disabled == "maintenance"
+        choices.set_disabled(2, False)
+        assert choices[2].disabled is False and choices.disabled_reason(2) is None
+        choices.set_disabled(0, "frozen")
+        assert choices[0].disabled == "frozen"
+        with pytest.raises(ValueError):
+            choices.set_disabled(1, False)
+
+
+class TestChoiceListPrompts:
+    def test_list_view_reads_flags_in_bulk(self):
+        view = ListView(_mixed(), multi=True)
+        assert view.checked_values() == [2]
+        view.toggle(2)
+        view.invert()
+        assert view.checked_values() == ["alpha", "delta"]
+
+    def test_always_virtualized(self):
+        assert should_virtualize(_mixed())
+        assert not should_virtualize(_mixed(), virtualize=False)
+
+    def test_checkbox_over_a_choice_list(self):
+        with create_pipe_input() as pipe:
+            pipe.send_text(" " + DOWN + DOWN + " " + ENTER)
+            answer = list_question(
+                "Pick:", _mixed(), multi=True, input=pipe, output=DummyOutput()
+            ).ask()
+        # The cursor skips the disabled "gamma" row.
+        assert answer == ["alpha", 2, "delta"]
+
+    def test_separators_and_reasons_render(self):
+        choices = ChoiceList(
+            ["a", Separator("-- more --"), {"name": "b", "disabled": "sold out"}, "c"]
+        )
+        view = ListView(choices, height=10)
+        text = "".join(t for _, t in view.render())
+        assert "-- more --" in text and "b (sold out)" in text
+        view.move(1)
+        assert view.value == "c"
+
+    def test_providers_keep_choice_lists(self):
+        choices = _mixed()
+        assert ChoiceCache().get(lambda: choices) is choices
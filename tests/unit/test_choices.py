@@ -0,0 +1,122 @@
+"""Tests for choice providers and their TTL/LRU cache."""
+
+import asyncio
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from questionary_extended.core.choices import ChoiceCache, default_choice_cache
+from questionary_extended.core.component import select
+
+
+class TestChoiceCache:
+    def test_results_are_cached_until_ttl_expires(self):
+        calls = []
+
+        def provider():
+            calls.append(1)
+            return ["a", "b"]
+
+        cache = ChoiceCache(ttl=0.05)
+        assert cache.get(provider) == ["a", "b"]
+        assert cache.get(provider) == ["a", "b"]
+        assert len(calls) == 1
+        time.sleep(0.06)
+        cache.get(provider)
+        assert len(calls) == 2
+
+    def test_least_recently_used_provider_is_evicted(self):
+        cache = ChoiceCache(maxsize=2, ttl=None)
+        providers = [lambda i=i: [i] for i in range(3)]
+        cache.get(providers[0])
+        cache.get(providers[1])
+        cache.get(providers[0])
+        cache.get(providers[2])
+        assert len(cache) == 2
+        assert providers[1] not in cache._entries
+        assert providers[0] in cache._entries
+
+    def test_failures_are_not_cached(self):
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise OSError("database unavailable")
+            return ["row"]
+
+        cache = ChoiceCache()
+        with pytest.raises(OSError):
+            cache.get(flaky)
+        assert cache.get(flaky) == ["row"]
+
+    def test_prefetch_is_shared_with_get(self):
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(threading.current_thread().name)
+            release.wait(5)
+            return ["x"]
+
+        cache = ChoiceCache()
+        with ThreadPoolExecutor(1) as executor:
+            assert cache.prefetch(slow, executor)
+            assert not cache.prefetch(slow, executor)
+            threading.Timer(0.05, release.set).start()
+            assert cache.get(slow) == ["x"]
+        assert len(calls) == 1
+
+    def test_waiters_load_a_prefetch_that_was_not_submitted(self):
+        cache = ChoiceCache()
+        provider = lambda: ["x"]  # noqa: E731
+        results = []
+
+        class ClosedExecutor:
+            def submit(self, *args):
+                waiter = threading.Thread(
+                    target=lambda: results.append(cache.get(provider))
+                )
+                waiter.start()
+                time.sleep(0.05)  # let the waiter block on the published load
+                raise RuntimeError("cannot schedule new futures after shutdown")
+
+        assert not cache.prefetch(provider, ClosedExecutor())
+        time.sleep(0.05)
+        assert results == [["x"]]
+        assert not cache._loading
+
+    def test_get_async(self):
+        cache = ChoiceCache()
+        assert asyncio.run(cache.get_async(lambda: ["a"])) == ["a"]
+        assert asyncio.run(cache.get_async(lambda: ["b"])) == ["b"]
+
+    def test_pickles_without_cached_results(self):
+        cache = ChoiceCache(maxsize=4, ttl=1.0)
+        cache.get(lambda: ["a"])
+        copy = pickle.loads(pickle.dumps(cache))
+        assert (copy.maxsize, copy.ttl, len(copy)) == (4, 1.0, 0)
+        assert pickle.loads(pickle.dumps(default_choice_cache)) is default_choice_cache
+
+    def test_async_providers(self):
+        async def rows():
+            return ("a", "b")
+
+        assert ChoiceCache().get(rows) == ["a", "b"]
+
+
+class TestComponentChoiceProvider:
+    def test_static_choices_are_untouched(self):
+        component = select("env", choices=["dev", "prod"])
+        assert component.choice_provider is None
+        assert component.resolve_choices() == ["dev", "prod"]
+
+    def test_provider_is_resolved_through_the_components_cache(self):
+        cache = ChoiceCache()
+        component = select("env", choices=lambda: ["dev"], choice_cache=cache)
+        assert "choice_cache" not in component.questionary_config
+        assert component.resolve_choices() == ["dev"]
+        assert len(cache) == 1
@@ -0,0 +1,134 @@
+"""Tests for the resolved-factory cache behind Component prompt creation."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from questionary_extended import _runtime
+from questionary_extended._questionary_proxy import questionary_proxy
+from questionary_extended.core import component as component_module
+from questionary_extended.core.component import text
+
+
+def _factory(tag):
+    def build(**kwargs):
+        return (tag, kwargs["message"])
+
+    return build
+
+
+@pytest.fixture(autouse=True)
+def restore_runtime():
+    yield
+    _runtime.clear_questionary_for_tests()
+
+
+class TestFactoryCache:
+    """Cached factories stay correct when the backend changes."""
+
+    def test_repeat_builds_skip_probing(self, monkeypatch):
+        _runtime.set_questionary_for_tests(SimpleNamespace(text=_factory("a")))
+        comp = text("name", message="Name:")
+        assert comp.create_questionary_component() == ("a", "Name:")
+
+        def fail(component_type):
+            raise AssertionError("factory was re-probed")
+
+        monkeypatch.setattr(component_module, "_probe_factory", fail)
+        assert comp.create_questionary_component() == ("a", "Name:")
+
+    def test_swapping_backend_invalidates(self):
+        comp = text("name", message="Name:")
+        _runtime.set_questionary_for_tests(SimpleNamespace(text=_factory("a")))
+        assert comp.create_questionary_component()[0] == "a"
+
+        _runtime.set_questionary_for_tests(SimpleNamespace(text=_factory("b")))
+        assert comp.create_questionary_component()[0] == "b"
+
+    def test_patching_attribute_in_place_invalidates(self):
+        backend = SimpleNamespace(text=_factory("a"))
+        _runtime.set_questionary_for_tests(backend)
+        comp = text("name", message="Name:")
+        assert comp.create_questionary_component()[0] == "a"
+
+        backend.text = _factory("b")
+        assert comp.create_questionary_component()[0] == "b"
+
+    def test_proxy_override_bumps_generation(self):
+        before = _runtime.get_generation()
+        questionary_proxy.custom_factory = _factory("p")
+        del questionary_proxy.custom_factory
+        assert _runtime.get_generation() == before + 2
+
+    def test_unsupported_type_still_rejected(self):
+        _runtime.set_questionary_for_tests(SimpleNamespace(text=_factory("a")))
+        comp = component_module.Component("x", "slider")
+        with pytest.raises(ValueError):
+            comp.create_questionary_component()
+
+
+class TestScopedBackend:
+    """`use_backend` overrides the backend for the current context only."""
+
+    def test_scope_overrides_and_restores(self):
+        _runtime.set_questionary_for_tests(SimpleNamespace(text=_factory("global")))
+        comp = text("name", message="Name:")
+
+        with _runtime.use_backend(SimpleNamespace(text=_factory("scoped"))):
+            assert comp.create_questionary_component()[0] == "scoped"
+            assert questionary_proxy.text(message="x")[0] == "scoped"
+        assert comp.create_questionary_component()[0] == "global"
+
+    def test_scope_does_not_bump_generation(self):
+        generation = _runtime.get_generation()
+        with _runtime.use_backend(SimpleNamespace(text=_factory("scoped"))):
+            pass
+        assert _runtime.get_generation() == generation
+
+    def test_scoped_backend_without_factory_is_rejected(self):
+        comp = text("name", message="Name:")
+        with _runtime.use_backend(SimpleNamespace()):
+            with pytest.raises(ValueError):
+                comp.create_questionary_component()
+
+    def test_concurrent_tasks_see_their_own_backend(self):
+        import asyncio
+
+        comp = text("name", message="Name:")
+
+        async def session(tag):
+            with _runtime.use_backend(SimpleNamespace(text=_factory(tag))):
+                await asyncio.sleep(0)
+                first = comp.create_questionary_component()[0]
+                await asyncio.sleep(0)
+                return first, comp.create_questionary_component()[0]
+
+        async def main():
+            return await asyncio.gather(session("a"), session("b"))
+
+        assert asyncio.run(main()) == [("a", "a"), ("b", "b")]
+
+    def test_threads_see_their_own_backend(self):
+        import threading
+
+        _runtime.set_questionary_for_tests(SimpleNamespace(text=_factory("global")))
+        comp = text("name", message="Name:")
+        seen = []
+        entered = threading.Event()
+        release = threading.Event()
+
+        def worker():
+            with _runtime.use_backend(SimpleNamespace(text=_factory("thread"))):
+                entered.set()
+                release.wait(5)
+                seen.append(comp.create_questionary_component()[0])
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        entered.wait(5)
+        try:
+            assert comp.create_questionary_component()[0] == "global"
+        finally:
+            release.set()
+            thread.join()
+        assert seen == ["thread"]
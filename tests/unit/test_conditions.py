@@ -0,0 +1,146 @@
+"""Tests for compiled `when` condition expressions."""
+
+import pickle
+
+import pytest
+
+from questionary_extended.core import conditions
+from questionary_extended.core.component import Component, text
+from questionary_extended.core.conditions import (
+    ConditionError,
+    compile_condition,
+)
+from questionary_extended.core.state import PageState
+
+
+class TestCompileCondition:
+    """Parsing, evaluation and dependency tracking."""
+
+    @pytest.mark.parametrize(
+        "expression, state, expected",
+        [
+            ("app_type == 'web'", {"app_type": "web"}, True),
+            ("app_type != 'web'", {"app_type": "web"}, False),
+            ("port > 1024", {"port": 8080}, True),
+            ("1 < port <= 10", {"port": 11}, False),
+            ("db in ['pg', 'mysql']", {"db": "pg"}, True),
+            ("db not in ('pg',)", {"db": "sqlite"}, True),
+            ("debug", {}, False),
+            ("not debug", {}, True),
+            ("a and b or c", {"a": 1, "b": 0, "c": 1}, True),
+            ("total * 2 + 1 == 7", {"total": 3}, True),
+            ("web.framework == 'django'", {"web.framework": "django"}, True),
+            ("name is None", {}, True),
+            ("'x' if flag else ''", {"flag": False}, False),
+            ("port > 1024", {}, False),
+            ("10 / count > 1", {"count": 0}, False),
+        ],
+    )
+    def test_evaluate(self, expression, state, expected):
+        assert compile_condition(expression).evaluate(state) is expected
+
+    def test_dependencies(self):
+        condition = compile_condition("a == 1 and web.framework in {'x', b}")
+        assert condition.dependencies == frozenset({"a", "b", "web.framework"})
+
+    def test_namespaced_name_prefers_assembly_key(self):
+        condition = compile_condition("mode == 'local'", namespace="db")
+
+        assert condition.dependencies == frozenset({"db.mode", "mode"})
+        assert condition.evaluate({"db.mode": "local", "mode": "remote"})
+        assert not condition.evaluate({"mode": "remote"})
+
+    def test_compiled_condition_is_cached(self):
+        assert compile_condition("x == 1") is compile_condition("x == 1")
+        assert compile_condition("x == 1") is not compile_condition("x == 1", "a")
+
+    def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(conditions, "CACHE_MAXSIZE", 2)
+        first = compile_condition("n == 1")
+        compile_condition("n == 2")
+        assert compile_condition("n == 1") is first
+        compile_condition("n == 3")
+        assert len(conditions._CACHE) == 2
+        assert compile_condition("n == 1") is first
+        assert ("n == 2", None) not in conditions._CACHE
+
+    def test_sequence_repetition_is_bounded(self):
+        with pytest.raises(ConditionError, match="too large"):
+            compile_condition("'a' * 1000000000000 == ''")
+        with pytest.raises(ConditionError, match="too large"):
+            compile_condition("1000000000000 * b'ab'")
+        assert compile_condition("'ab' * 3 == 'ababab'").evaluate({})
+        assert compile_condition("2 * 1000000000000 > 0").evaluate({})
+        # Values from state are checked when evaluated.
+        condition = compile_condition("name * count")
+        assert condition.evaluate({"name": "a", "count": 3})
+        assert not condition.evaluate({"name": "a", "count": 10**12})
+        assert not compile_condition("('a' * 1000) * 1000").evaluate({})
+        assert not compile_condition("('a',) * 100000").evaluate({})
+
+    def test_string_formatting_is_rejected(self):
+        with pytest.raises(ConditionError, match="String formatting"):
+            compile_condition("'%0999999999d' % 1")
+        with pytest.raises(ConditionError, match="String formatting"):
+            compile_condition("b'%s' % x")
+        assert compile_condition("count % 2 == 1").evaluate({"count": 7})
+        # A format string read from state is not expanded either.
+        assert not compile_condition("fmt % 1").evaluate({"fmt": "%0999999999d"})
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "__import__('os').system('true')",
+            "x[0]",
+            "(lambda: 1)()",
+            "len(x) > 0",
+            "[i for i in x]",
+            "x ==",
+            "x ** 2",
+        ],
+    )
+    def test_rejects_unsafe_or_invalid_syntax(self, expression):
+        with pytest.raises(ConditionError):
+            compile_condition(expression)
+
+
+class TestComponentVisibility:
+    """Component.is_visible evaluates its `when` condition."""
+
+    def test_when_condition_controls_visibility(self):
+        state = PageState()
+        comp = text("port", when="app_type == 'web'")
+
+        assert not comp.is_visible(state.view())
+        state.set("app_type", "web")
+        assert comp.is_visible(state.view())
+
+    def test_assembly_component_uses_its_namespace(self):
+        comp = Component("web.port", "text", when="framework == 'flask'")
+
+        assert comp.namespace == "web"
+        assert comp.dependencies == frozenset({"web.framework", "framework"})
+        assert comp.is_visible({"web.framework": "flask"})
+
+    def test_explicit_visible_overrides_condition(self):
+        comp = text("port", when="False")
+        comp.visible = True
+        assert comp.is_visible({})
+
+    def test_component_keeps_its_compiled_condition(self, monkeypatch):
+        monkeypatch.setattr(conditions, "CACHE_MAXSIZE", 1)
+        first = Component("web.port", "text", when="framework == 'flask'")
+        second = text("other", when="flag")
+        condition = first.condition
+        assert second.condition is not None
+        assert first.condition is condition
+        first.when_condition = "framework == 'django'"
+        assert first.condition.source == "framework == 'django'"
+        first.name = "api.port"
+        assert first.condition.namespace == "api"
+
+    def test_compiled_condition_is_not_pickled(self):
+        comp = text("port", when="app_type == 'web'")
+        assert comp.condition is not None
+        copy = pickle.loads(pickle.dumps(comp))
+        assert copy.is_visible({"app_type": "web"})
@@ -0,0 +1,251 @@
+"""Tests for the indexed fuzzy matcher behind fuzzy_select."""
+
+import importlib.util
+import pickle
+import random
+from types import SimpleNamespace
+
+import pytest
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+
+from questionary_extended import _runtime
+from questionary_extended.fuzzy import FuzzyChoiceCompleter, FuzzyIndex, FuzzyMatcher
+from questionary_extended.prompts import fuzzy_select
+
+FRUITS = ["Apple", "apple pie", "pineapple", "grape", "Application", "papaya"]
+
+
+def _substring_matches(choices, query):
+    """Reference ranking for the exact, prefix and substring tiers."""
+    q = query.lower()
+    keyed = [(c.lower(), i, c) for i, c in enumerate(choices)]
+    exact = [c for key, _, c in sorted(keyed) if key == q]
+    prefix = [c for key, _, c in sorted(keyed) if key != q and key.startswith(q)]
+    rest = [c for key, _, c in keyed if q in key and not key.startswith(q)]
+    return exact + prefix + rest
+
+
+def _is_subsequence(query, text):
+    remaining = iter(text)
+    return all(c in remaining for c in query)
+
+
+class TestFuzzyMatcher:
+    def test_tiers_rank_exact_prefix_then_substring(self):
+        matcher = FuzzyMatcher(FRUITS)
+        assert matcher.search("apple") == [
+            ("Apple", 1.0),
+            ("apple pie", 0.9),
+            ("pineapple", 0.8),
+        ]
+
+    def test_case_sensitivity(self):
+        assert [c for c, _ in FuzzyMatcher(FRUITS).search("APP")] == [
+            "Apple",
+            "apple pie",
+            "Application",
+            "pineapple",
+        ]
+        matcher = FuzzyMatcher(FRUITS, case_sensitive=True)
+        assert matcher.search("App") == [("Apple", 0.9), ("Application", 0.9)]
+
+    def test_min_score_drops_lower_tiers(self):
+        assert FuzzyMatcher(FRUITS, min_score=0.85).search("apple") == [
+            ("Apple", 1.0),
+            ("apple pie", 0.9),
+        ]
+        assert FuzzyMatcher(FRUITS, min_score=0.95).search("apple") == [("Apple", 1.0)]
+
+    def test_subsequence_matches_score_by_span(self):
+        matcher = FuzzyMatcher(["configuration", "conflagration"], min_score=0.0)
+        results = dict(matcher.search("cnfg"))
+        assert results["configuration"] == pytest.approx(0.7 * 4 / 6)
+        assert results["conflagration"] == pytest.approx(0.7 * 4 / 7)
+        # The default min_score only admits nearly contiguous matches.
+        assert FuzzyMatcher(["configuration"]).search("cnfg") == []
+        assert FuzzyMatcher(["abcdefgh"]).search("abcdfgh") == [
+            ("abcdefgh", 0.7 * 7 / 8)
+        ]
+
+    def test_subsequence_uses_the_shortest_span(self):
+        # The leftmost match "a_ab_c" spans 6; the shortest, "ab_c", spans 4.
+        assert FuzzyMatcher(["a_ab_c"], min_score=0.5).search("abc") == [
+            ("a_ab_c", pytest.approx(0.7 * 3 / 4))
+        ]
+        assert FuzzyMatcher(["a_ab_c"], min_score=0.0).search("abc") == [
+            ("a_ab_c", pytest.approx(0.7 * 3 / 4))
+        ]
+
+    def test_subsequence_scores_match_a_brute_force_span(self):
+        rng = random.Random(3)
+        choices = [
+            "".join(rng.choice("abc_") for _ in range(rng.randint(3, 10)))
+            for _ in range(500)
+        ]
+
+        def shortest(choice, q):
+            spans = [
+                end - start + 1
+                for start in range(len(choice))
+                for end in range(start, len(choice))
+                if _is_subsequence(q, choice[start : end + 1])
+            ]
+            return min(spans, default=None)
+
+        typed = FuzzyMatcher(choices, min_score=0.0)
+        for query in ["ab", "abc", "abca"]:
+            results = dict(typed.search(query, limit=len(choices)))
+            for choice, score in results.items():
+                if query not in choice:
+                    assert score == pytest.approx(
+                        0.7 * len(query) / shortest(choice, query)
+                    )
+
+    def test_limit_and_empty_query(self):
+        matcher = FuzzyMatcher(FRUITS)
+        assert len(matcher.search("p", limit=2)) == 2
+        assert matcher.search("") == []
+
+    def test_matches_do_not_cross_choices(self):
+        matcher = FuzzyMatcher(["ab", "cd"])
+        assert matcher.search("b\nc") == []
+        assert matcher.search("bc") == []
+
+    def test_incremental_typing_matches_a_fresh_search(self):
+        rng = random.Random(7)
+        choices = [
+            "".join(rng.choice("abcde-") for _ in range(rng.randint(3, 12)))
+            for _ in range(3000)
+        ]
+        typed = FuzzyMatcher(choices, min_score=0.8)
+        for word in ["abc", "cab-d", "e-e-a", "dddd", "ab-"]:
+            for length in range(1, len(word) + 1):
+                query = word[:length]
+                fresh = FuzzyMatcher(choices, min_score=0.8).search(query, limit=25)
+                assert typed.search(query, limit=25) == fresh
+                assert [c for c, _ in fresh] == _substring_matches(choices, query)[:25]
+            # Backspacing reuses the cached scans.
+            assert typed.search(word[:1], limit=25) == FuzzyMatcher(
+                choices, min_score=0.8
+            ).search(word[:1], limit=25)
+
+    def test_larger_limit_resumes_a_partial_scan(self):
+        choices = [f"host-{i:03d}" for i in range(200)]
+        matcher = FuzzyMatcher(choices)
+        assert len(matcher.search("5", limit=3)) == 3
+        assert [c for c, _ in matcher.search("5", limit=100)] == _substring_matches(
+            choices, "5"
+        )[:100]
+
+
+COMPANIES = [
+    "Acme Corporation",
+    "ACME Corp.",
+    "Globex",
+    "Initech LLC",
+    "Umbrella Corp",
+    "",
+]
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("numpy") is None, reason="FuzzyIndex needs NumPy"
+)
+class TestFuzzyIndex:
+    def test_scores_are_bigram_dice_coefficients(self):
+        index = FuzzyIndex(COMPANIES)
+        # " acme corp " against " acme corp ": identical bigram sets
+        assert index.match("acme-corp", limit=1) == [("ACME Corp.", 1.0)]
+        # " globex " has 7 bigrams; " globex inc " adds " i", "in", "nc", "c "
+        assert index.match("Globex Inc", limit=1) == [
+            ("Globex", pytest.approx(2 * 7 / 18))
+        ]
+
+    def test_newlines_inside_choices_do_not_shift_owners(self):
+        index = FuzzyIndex(["acme\ncorp", "globex", "initech"])
+        assert index.match("acme corp", limit=1) == [("acme\ncorp", 1.0)]
+        assert index.match("globex", limit=1) == [("globex", 1.0)]
+        assert index.match("initech", limit=1) == [("initech", 1.0)]
+        assert list(index.match_many(["acme\ncorp"])) == [index.match("acme corp")]
+
+    def test_limit_threshold_and_order(self):
+        index = FuzzyIndex(COMPANIES)
+        results = index.match("acme corporation", limit=3)
+        assert [c for c, _ in results] == [
+            "Acme Corporation",
+            "ACME Corp.",
+            "Umbrella Corp",
+        ]
+        assert results[0][1] == 1.0
+        assert all(a[1] >= b[1] for a, b in zip(results, results[1:]))
+        assert [c for c, _ in index.match("acme corporation", threshold=0.5)] == [
+            "Acme Corporation",
+            "ACME Corp.",
+        ]
+
+    def test_unrelated_and_empty_queries_match_nothing(self):
+        index = FuzzyIndex(COMPANIES)
+        assert index.match("zzz") == []
+        assert index.match("") == []
+        assert FuzzyIndex([]).match("acme") == []
+
+    def test_batches_match_single_queries(self, monkeypatch):
+        from questionary_extended import fuzzy
+
+        rng = random.Random(11)
+        words = [
+            "".join(rng.choice("abcdefgh") for _ in range(rng.randint(2, 6)))
+            for _ in range(400)
+        ]
+        choices = [" ".join(rng.sample(words, rng.randint(1, 3))) for _ in range(500)]
+        queries = [" ".join(rng.sample(words, 2)) for _ in range(40)]
+        index = FuzzyIndex(choices)
+        singles = [index.match(q, limit=5) for q in queries]
+        # Force several batches per chunk.
+        monkeypatch.setattr(fuzzy, "_BATCH_CELLS", 3 * len(choices))
+        assert list(index.match_many(queries, limit=5, chunk_size=16)) == singles
+
+    def test_process_pool_fan_out(self):
+        index = FuzzyIndex(COMPANIES)
+        queries = ["acme", "globex", "initech", "umbrella"] * 3
+        expected = [index.match(q) for q in queries]
+        assert list(index.match_many(queries, processes=2, chunk_size=2)) == expected
+
+    def test_index_pickles(self):
+        index = pickle.loads(pickle.dumps(FuzzyIndex(COMPANIES)))
+        assert index.match("initech", limit=1)[0][0] == "Initech LLC"
+
+    def test_rejects_empty_chunks(self):
+        with pytest.raises(ValueError):
+            list(FuzzyIndex(COMPANIES).match_many(["acme"], chunk_size=0))
+
+
+class TestFuzzySelect:
+    @pytest.fixture(autouse=True)
+    def restore_runtime(self):
+        yield
+        _runtime.clear_questionary_for_tests()
+
+    def test_completer_offers_ranked_choices(self):
+        completer = FuzzyChoiceCompleter(FuzzyMatcher(FRUITS), limit=2)
+        completions = list(completer.get_completions(Document("pl"), CompleteEvent()))
+        assert [c.text for c in completions] == ["Apple", "apple pie"]
+        assert completions[0].start_position == -2
+        empty = completer.get_completions(Document(""), CompleteEvent())
+        assert [c.text for c in empty] == ["Apple", "apple pie"]
+
+    def test_fuzzy_select_passes_an_indexed_completer(self):
+        captured = {}
+
+        def autocomplete(message, **kwargs):
+            captured.update(kwargs)
+            return SimpleNamespace(ask=lambda: kwargs["choices"][0])
+
+        _runtime.set_questionary_for_tests(SimpleNamespace(autocomplete=autocomplete))
+        question = fuzzy_select("Fruit:", FRUITS, min_score=0.95, case_sensitive=True)
+        assert question.ask() == "Apple"
+        matcher = captured["completer"].completer.matcher
+        assert matcher.min_score == 0.95
+        assert matcher.case_sensitive is True
+        assert captured["choices"] == FRUITS
@@ -0,0 +1,112 @@
+"""Tests for the PageState write-ahead journal."""
+
+import pytest
+
+from questionary_extended.core.journal import StateJournal
+from questionary_extended.core.state import PageState
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "wizard.journal"
+
+
+class TestStateJournal:
+    """Journaled changes survive the process and replay in order."""
+
+    def test_changes_replay_into_new_state(self, path):
+        state = PageState()
+        with StateJournal(path) as journal:
+            journal.attach(state)
+            state.set("name", "web")
+            state.set("db.host", "localhost")
+            state.set("db.port", 5432)
+            state.delete("db.port")
+
+        restored = PageState()
+        with StateJournal(path) as journal:
+            journal.attach(restored)
+        assert restored.get_all_state() == {"name": "web", "db.host": "localhost"}
+
+    def test_replay_does_not_notify_watchers(self, path):
+        state = PageState()
+        with StateJournal(path, fsync_interval=0) as journal:
+            journal.attach(state)
+            state.set("a", 1)
+
+        restored = PageState()
+        seen = []
+        restored.watch(seen.append)
+        with StateJournal(path) as journal:
+            journal.attach(restored)
+        assert seen == []
+
+    def test_computed_entries_are_not_journaled(self, path):
+        state = PageState()
+        state.add_computed("double", lambda n: n * 2, ["n"])
+        with StateJournal(path, fsync_interval=0) as journal:
+            journal.attach(state)
+            state.set("n", 2)
+            assert state.get("double") == 4
+            assert journal.load() == {"n": 2}
+
+    def test_synchronous_mode_writes_each_change(self, path):
+        state = PageState()
+        journal = StateJournal(path, fsync_interval=0)
+        journal.attach(state)
+        try:
+            state.set("a", 1)
+            assert StateJournal(path).load() == {"a": 1}
+        finally:
+            journal.close()
+
+    def test_background_commit_is_deferred_until_flush(self, path):
+        state = PageState()
+        journal = StateJournal(path, fsync_interval=60)
+        journal.attach(state)
+        try:
+            state.set("a", 1)
+            assert StateJournal(path).load() == {}
+            journal.flush()
+            assert StateJournal(path).load() == {"a": 1}
+        finally:
+            journal.close()
+
+    def test_compaction_bounds_the_journal(self, path):
+        state = PageState()
+        with StateJournal(path, fsync_interval=0, compact_every=10) as journal:
+            journal.attach(state)
+            for i in range(25):
+                state.set("counter", i)
+
+        assert len(path.read_text().splitlines()) == 5
+        assert StateJournal(path).load() == {"counter": 24}
+
+    def test_torn_trailing_record_is_dropped(self, path):
+        path.write_text('{"k":"a","v":1}\n{"k":"b","v"')
+        state = PageState()
+        with StateJournal(path) as journal:
+            journal.attach(state)
+            state.set("c", 3)
+
+        assert state.get_all_state() == {"a": 1, "c": 3}
+        assert StateJournal(path).load() == {"a": 1, "c": 3}
+
+    def test_unserializable_value_is_reported_on_close(self, path):
+        state = PageState()
+        journal = StateJournal(path, fsync_interval=0)
+        journal.attach(state)
+        state.set("bad", object())
+        state.set("good", 1)
+        with pytest.raises(TypeError):
+            journal.close()
+        assert StateJournal(path).load() == {"good": 1}
+
+    def test_discard_removes_files(self, path):
+        state = PageState()
+        journal = StateJournal(path, fsync_interval=0, compact_every=1)
+        journal.attach(state)
+        state.set("a", 1)
+        journal.discard()
+        assert not path.exists()
+        assert not path.with_name(path.name + ".snapshot").exists()
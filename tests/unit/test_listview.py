@@ -0,0 +1,266 @@
+"""Tests for the virtualized list control behind large select/checkbox prompts."""
+
+from types import SimpleNamespace
+
+import pytest
+import questionary
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+
+from questionary_extended import _runtime
+from questionary_extended.components import Choice, Separator
+from questionary_extended.core.component import checkbox, select
+from questionary_extended.listview import (
+    VIRTUALIZE_THRESHOLD,
+    ListView,
+    describe,
+    list_question,
+    should_virtualize,
+    unsupported_options,
+)
+from questionary_extended.prompts_core import (
+    LazyQuestion,
+    checkbox_enhanced,
+    select_enhanced,
+)
+
+DOWN, UP, ENTER = "\x1b[B", "\x1b[A", "\r"
+
+
+class CountingChoices(list):
+    """List that records which rows were read."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.reads = set()
+
+    def __getitem__(self, index):
+        self.reads.add(index)
+        return super().__getitem__(index)
+
+
+def _text(view):
+    return "".join(text for _, text in view.render())
+
+
+class TestDescribe:
+    def test_choice_forms(self):
+        assert describe("a") == ("a", "a", None, False)
+        assert describe({"name": "B", "value": 2, "checked": True}) == (
+            "B",
+            2,
+            None,
+            True,
+        )
+        assert describe(Choice("C", disabled=True)) == ("C", "C", True, False)
+        assert describe(questionary.Choice([("bold", "D")], value=4)) == (
+            "D",
+            4,
+            None,
+            False,
+        )
+        assert describe(questionary.Separator())[2]
+        assert describe(Separator("--"))[2]
+
+
+class TestListView:
+    def test_renders_only_the_viewport(self):
+        choices = CountingChoices(f"item {i}" for i in range(100_000))
+        view = ListView(choices, height=5, overscan=2)
+        view.move(50_000)
+        choices.reads.clear()
+        text = _text(view)
+        assert text.splitlines() == [
+            "  item 49996",
+            "  item 49997",
+            "  item 49998",
+            "  item 49999",
+            "» item 50000",
+        ]
+        assert choices.reads <= set(range(49_996 - 2, 50_001 + 2))
+
+    def test_row_cache_is_bounded_by_the_overscan(self):
+        view = ListView([str(i) for i in range(1000)], height=4, overscan=3)
+        for _ in range(300):
+            view.move(1)
+            view.render()
+        assert len(view._rows) == 4 + 2 * 3
+        assert all(view.top - 3 <= row < view.top + 4 + 3 for row in view._rows)
+
+    def test_cursor_skips_disabled_rows_and_separators(self):
+        choices = [
+            questionary.Separator(),
+            "a",
+            Choice("b", disabled=True),
+            {"name": "c", "disabled": "sold out"},
+            "d",
+        ]
+        view = ListView(choices, height=10)
+        assert view.cursor == 1
+        view.move(1)
+        assert view.value == "d"
+        view.move(-1)
+        assert view.value == "a"
+        view.move(-1)
+        assert view.value == "a"
+        assert "- c (sold out)" in _text(view)
+
+    def test_default_and_scrolling(self):
+        view = ListView([str(i) for i in range(50)], height=3, default="10")
+        assert (view.cursor, view.top) == (10, 8)
+        view.move(-9)
+        assert (view.cursor, view.top) == (1, 1)
+        view.move_to_end()
+        assert (view.cursor, view.top) == (49, 47)
+
+    def test_selection_bitmap(self):
+        choices = ["a", {"name": "b", "checked": True}, Choice("c", disabled=True), "d"]
+        view = ListView(choices, multi=True)
+        assert view.checked_values() == ["b"]
+        view.toggle(0)
+        view.toggle(2)
+        assert list(view.checked_rows()) == [0, 1]
+        view.invert()
+        assert view.checked_values() == ["d"]
+        view.toggle_all()
+        assert view.checked_values() == ["a", "b", "d"]
+        view.toggle_all()
+        assert view.checked_values() == []
+        assert "○ a" in _text(view)
+
+    def test_large_selections(self):
+        view = ListView(range(10_001), multi=True)
+        view.invert()
+        view.toggle(10_000)
+        rows = list(view.checked_rows())
+        assert len(rows) == 10_000 and rows[-1] == 9_999
+
+    def test_rejects_bad_sizes(self):
+        with pytest.raises(ValueError):
+            ListView(["a"], height=0)
+        with pytest.raises(ValueError):
+            ListView(["a"], overscan=-1)
+
+
+class TestListQuestion:
+    def _ask(self, keys, choices, **kwargs):
+        with create_pipe_input() as pipe:
+            pipe.send_text(keys)
+            return list_question(
+                "Pick:", choices, input=pipe, output=DummyOutput(), **kwargs
+            ).ask()
+
+    def test_select_answers_the_value(self):
+        choices = [{"name": f"host {i}", "value": i} for i in range(5000)]
+        assert self._ask(DOWN * 3 + UP + ENTER, choices) == 2
+
+    def test_checkbox_answers_checked_values(self):
+        choices = [str(i) for i in range(5000)]
+        assert self._ask(" " + DOWN + DOWN + " " + ENTER, choices, multi=True) == [
+            "0",
+            "2",
+        ]
+        # Moving past either end clamps; the cursor stays on the first row.
+        assert self._ask("a" + UP + " " + ENTER, choices[:3], multi=True) == ["1", "2"]
+
+    def test_checkbox_validation_keeps_the_prompt_open(self):
+        validate = lambda values: bool(values) or "Pick one"  # noqa: E731
+        answer = self._ask(
+            ENTER + DOWN + " " + ENTER, ["a", "b"], multi=True, validate=validate
+        )
+        assert answer == ["b"]
+
+    def test_key_options(self):
+        choices = ["a", "b", "c"]
+        assert self._ask("jj" + ENTER, choices) == "c"
+        assert self._ask("j" + DOWN + ENTER, choices, use_jk_keys=False) == "b"
+        assert self._ask(DOWN + "j" + ENTER, choices, use_arrow_keys=False) == "b"
+
+    def test_initial_choice_and_footer(self):
+        with create_pipe_input() as pipe:
+            question = list_question(
+                "Pick:",
+                ["a", {"name": "b", "description": "second"}],
+                multi=True,
+                initial_choice="b",
+                show_selected=True,
+                input=pipe,
+                output=DummyOutput(),
+            )
+            footer = question.application.layout.container.children[1].content
+            text = footer.children[1].content.text()
+        assert "".join(t for _, t in text) == "  Answer: b\n  Description: second"
+
+    def test_rejects_empty_choices(self):
+        with pytest.raises(ValueError):
+            list_question("Pick:", [])
+
+
+class TestVirtualizedPrompts:
+    @pytest.fixture(autouse=True)
+    def restore_runtime(self):
+        yield
+        _runtime.clear_questionary_for_tests()
+
+    def test_threshold(self):
+        assert not should_virtualize(["a"] * VIRTUALIZE_THRESHOLD)
+        assert should_virtualize(["a"] * (VIRTUALIZE_THRESHOLD + 1))
+        assert should_virtualize(["a"], virtualize=True)
+        assert not should_virtualize(lambda: ["a"])
+
+    def test_enhanced_prompts_pick_the_control_by_size(self):
+        large = [str(i) for i in range(VIRTUALIZE_THRESHOLD + 1)]
+        question = select_enhanced("Pick:", large)
+        assert isinstance(question, LazyQuestion) and question._factory is list_question
+        assert checkbox_enhanced("Pick:", large)._kwargs["multi"] is True
+        assert select_enhanced("Pick:", ["a"])._factory_name == "select"
+        assert (
+            select_enhanced("Pick:", ["a"], virtualize=True)._factory is list_question
+        )
+
+    def test_questionary_only_options_keep_questionary(self):
+        large = [str(i) for i in range(VIRTUALIZE_THRESHOLD + 1)]
+        question = select_enhanced("Pick:", large, use_search_filter=True)
+        assert question._factory_name == "select"
+        assert (
+            select_enhanced("Pick:", large, use_shortcuts=False)._factory
+            is list_question
+        )
+        assert unsupported_options({"use_indicator": True, "qmark": "!"}) == [
+            "use_indicator"
+        ]
+        with pytest.raises(ValueError, match="use_search_filter"):
+            select_enhanced("Pick:", ["a"], virtualize=True, use_search_filter=True)
+        with pytest.raises(ValueError, match="use_shortcuts"):
+            list_question("Pick:", ["a"], use_shortcuts=True)
+
+    def test_components_virtualize_large_lists_on_questionary_only(self):
+        large = [str(i) for i in range(VIRTUALIZE_THRESHOLD + 1)]
+        question = checkbox(
+            "hosts", choices=lambda: large
+        ).create_questionary_component()
+        assert isinstance(question, questionary.Question)
+        small = select("host", choices=["a", "b"]).create_questionary_component()
+        assert isinstance(small, questionary.Question)
+
+    def test_fake_and_scoped_backends_always_get_the_prompt(self):
+        calls = []
+        fake = SimpleNamespace(
+            select=lambda *args, **kw: calls.append(("select", len(kw["choices"]))),
+            checkbox=lambda *args, **kw: calls.append(("checkbox", len(kw["choices"]))),
+        )
+        large = [str(i) for i in range(2000)]
+        with _runtime.use_backend(fake):
+            select("host", choices=large).create_questionary_component()
+            checkbox(
+                "hosts", choices=large, virtualize=True
+            ).create_questionary_component()
+            select_enhanced("Pick:", large).build()
+        _runtime.set_questionary_for_tests(fake)
+        select("host", choices=large).create_questionary_component()
+        assert calls == [
+            ("select", 2000),
+            ("checkbox", 2000),
+            ("select", 2000),
+            ("select", 2000),
+        ]
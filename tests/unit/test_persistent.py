@@ -0,0 +1,74 @@
+"""Tests for the structure-sharing PersistentMap."""
+
+import pickle
+import random
+
+from questionary_extended.core.persistent import PersistentMap
+
+
+class _Colliding:
+    """Key type whose instances share a handful of hash values."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return self.value % 3
+
+    def __eq__(self, other):
+        return isinstance(other, _Colliding) and other.value == self.value
+
+
+class TestPersistentMap:
+    """PersistentMap behaves like an immutable dict."""
+
+    def test_updates_leave_older_versions_untouched(self):
+        first = PersistentMap([("a", 1)])
+        second = first.set("b", 2)
+        third = second.delete("a")
+
+        assert dict(first) == {"a": 1}
+        assert dict(second) == {"a": 1, "b": 2}
+        assert dict(third) == {"b": 2}
+        assert len(third) == 1
+
+    def test_noop_updates_return_same_map(self):
+        value = object()
+        m = PersistentMap([("a", value)])
+        assert m.set("a", value) is m
+        assert m.delete("missing") is m
+
+    def test_matches_dict_under_random_operations(self):
+        rng = random.Random(7)
+        keys = [f"k{i}" for i in range(200)] + [_Colliding(i) for i in range(12)]
+        m, expected = PersistentMap(), {}
+        history = [(m, dict(expected))]
+        for _ in range(3000):
+            key = rng.choice(keys)
+            if rng.random() < 0.3:
+                m = m.delete(key)
+                expected.pop(key, None)
+            else:
+                value = object()
+                m = m.set(key, value)
+                expected[key] = value
+            history.append((m, dict(expected)))
+
+        assert len(m) == len(expected)
+        assert all(m[k] is v for k, v in expected.items())
+        assert set(m) == set(expected)
+
+        missing = object()
+        for _ in range(100):
+            (a, da), (b, db) = rng.sample(history, 2)
+            changed = {
+                k
+                for k in set(da) | set(db)
+                if da.get(k, missing) is not db.get(k, missing)
+            }
+            found = list(a.diff(b))
+            assert len(found) == len(changed) and set(found) == changed
+
+    def test_pickle_round_trip(self):
+        m = PersistentMap((f"k{i}", i) for i in range(100))
+        assert dict(pickle.loads(pickle.dumps(m))) == dict(m)
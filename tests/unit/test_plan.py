@@ -0,0 +1,71 @@
+"""Tests for compiled page plans and their invalidation."""
+
+from questionary_extended.core.component import text
+from questionary_extended.core.page import Page
+from questionary_extended.core.plan import compile_plan, plan_for
+
+
+class TestCompilePlan:
+    """Flattening the Page -> Card/Assembly -> Component tree."""
+
+    def test_entries_are_ordered_with_precomputed_fields(self):
+        page = Page()
+        page.card("Intro").text("name")
+        page.assembly("web").text("port", when="framework == 'flask'")
+
+        plan = page.plan()
+
+        assert [e.name for e in plan] == ["name", "web.port"]
+        assert [e.namespace for e in plan] == [None, "web"]
+        assert plan.entries[1].component_type == "text"
+        assert plan.entries[1].dependencies == frozenset({"web.framework", "framework"})
+        assert plan.dependents["framework"] == (1,)
+
+    def test_change_handlers_indexed_by_namespaced_key(self):
+        page = Page()
+
+        def handler(value, assembly):
+            return None
+
+        page.assembly("web").text("framework").on_change("framework", handler)
+
+        handlers = page.plan().change_handlers["web.framework"]
+        assert handlers[0][0] is handler
+
+    def test_plan_from_plain_component_list(self):
+        plan = compile_plan([text("a"), text("b", when="a")])
+        assert len(plan) == 2
+        assert plan.entries[0].dependencies == frozenset()
+
+    def test_plan_for(self):
+        page = Page()
+        page.card("Intro").text("name")
+        assert plan_for(page) is page.plan()
+        assert plan_for(page.plan()) is page.plan()
+        assert [e.name for e in plan_for([text("a"), text("b")]).entries] == ["a", "b"]
+
+
+class TestPlanCache:
+    """Plans are reused until a container in the tree changes."""
+
+    def test_plan_is_cached(self):
+        page = Page()
+        page.card("Intro").text("name")
+        assert page.plan() is page.plan()
+
+    def test_mutations_invalidate(self):
+        page = Page()
+        card = page.card("Intro")
+        asm = page.assembly("web")
+        first = page.plan()
+
+        card.text("name")
+        second = page.plan()
+        asm.components.append(text("web.port"))
+        third = page.plan()
+        asm.on_change("port", lambda value, assembly: None)
+        fourth = page.plan()
+
+        assert first is not second is not third is not fourth
+        assert [e.name for e in fourth] == ["name", "web.port"]
+        assert "web.port" in fourth.change_handlers
@@ -0,0 +1,85 @@
+"""Tests for the shared-memory PageState and its readers."""
+
+import pickle
+from datetime import date
+
+import numpy as np
+import pytest
+
+from questionary_extended.core.shared_state import (
+    SharedPageState,
+    SharedStateReader,
+    StaleSnapshotError,
+)
+
+
+@pytest.fixture
+def state():
+    with SharedPageState(capacity=1 << 20) as state:
+        yield state
+
+
+class TestSharedPageState:
+    """Committed state is readable through a reader without pickling."""
+
+    def test_reader_sees_committed_values(self, state):
+        with SharedStateReader(state.name) as reader:
+            assert dict(reader.snapshot()) == {}
+            state.set_many({"name": "svc", "db.port": 5432, "db.tags": ["a", "b"]})
+            assert "name" not in reader.snapshot()
+
+            state.commit()
+            snapshot = reader.snapshot()
+            assert snapshot["name"] == "svc"
+            assert snapshot["db.port"] == 5432
+            assert snapshot["db.tags"] == ["a", "b"]
+            assert snapshot.version == reader.version == state.published_version
+
+    def test_bytes_and_arrays_are_zero_copy_views(self, state):
+        payload = bytes(range(256)) * 64
+        array = np.arange(12, dtype=np.float32).reshape(3, 4)
+        state.set_many({"blob": payload, "grid": array})
+        state.commit()
+
+        with SharedStateReader(state.name) as reader:
+            snapshot = reader.snapshot()
+            blob, grid = snapshot["blob"], snapshot["grid"]
+            assert isinstance(blob, memoryview) and blob.readonly
+            assert blob == payload
+            assert np.array_equal(grid, array) and not grid.flags.writeable
+            del blob, grid
+
+    def test_other_values_fall_back_to_pickle(self, state):
+        state.set("deadline", date(2026, 1, 31))
+        state.commit()
+        with SharedStateReader(state.name) as reader:
+            assert reader.get("deadline") == date(2026, 1, 31)
+            assert reader.get("missing", "x") == "x"
+
+    def test_snapshot_goes_stale_when_its_slot_is_reused(self, state):
+        state.set("a", 1)
+        state.commit()
+        with SharedStateReader(state.name) as reader:
+            snapshot = reader.snapshot()
+            state.set("a", 2)
+            state.commit()
+            assert snapshot.valid and snapshot["a"] == 1
+            state.commit()
+            assert not snapshot.valid
+            with pytest.raises(StaleSnapshotError):
+                snapshot["a"]
+            assert reader.snapshot()["a"] == 2
+
+    def test_oversized_state_keeps_previous_image(self):
+        with SharedPageState(capacity=256) as state:
+            state.set("a", 1)
+            state.commit()
+            state.set("big", b"x" * 1024)
+            with pytest.raises(ValueError):
+                state.commit()
+            with SharedStateReader(state.name) as reader:
+                assert dict(reader.snapshot()) == {"a": 1}
+
+    def test_state_is_not_picklable(self, state):
+        with pytest.raises(TypeError):
+            pickle.dumps(state)
@@ -0,0 +1,111 @@
+"""Tests for the SQLite-backed PageState store."""
+
+import pytest
+
+from questionary_extended.core.sqlite_state import SQLiteStateStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    with SQLiteStateStore(tmp_path / "sessions.db") as store:
+        yield store
+
+
+class TestSQLiteStateStore:
+    """Sessions persist independently and load lazily."""
+
+    def test_committed_changes_survive_reopen(self, tmp_path):
+        path = tmp_path / "sessions.db"
+        with SQLiteStateStore(path) as store:
+            state = store.session("alice")
+            state.set("name", "alice")
+            state.set("db.host", "localhost")
+            state.set("db.port", 5432)
+            state.delete("db.port")
+            state.commit()
+            state.set("uncommitted", True)
+
+        with SQLiteStateStore(path) as store:
+            state = store.session("alice")
+            assert state.get_all_state() == {"name": "alice", "db.host": "localhost"}
+
+    def test_sessions_are_isolated(self, store):
+        a, b = store.session("a"), store.session("b")
+        a.set("x", 1)
+        b.set("x", 2)
+        a.commit()
+        b.commit()
+
+        assert store.session("a").get("x") == 1
+        assert store.session("b").get("x") == 2
+        assert list(store.sessions()) == ["a", "b"]
+
+        store.delete_session("a")
+        assert store.session("a").get_all_state() == {}
+
+    def test_namespaces_load_on_first_access(self, store, monkeypatch):
+        state = store.session("s")
+        for ns in ("web", "db"):
+            state.set(f"{ns}.field", ns)
+        state.commit()
+
+        loads = []
+        original = store._load
+
+        def counting_load(session_id, namespace):
+            loads.append(namespace)
+            return original(session_id, namespace)
+
+        monkeypatch.setattr(store, "_load", counting_load)
+        resumed = store.session("s")
+        assert loads == []
+        assert resumed.get_assembly_state("web") == {"field": "web"}
+        assert resumed.get("web.field") == "web"
+        assert loads == ["web"]
+
+    def test_writes_before_load_win_over_stored_values(self, store):
+        state = store.session("s")
+        state.set("db.host", "old")
+        state.set("db.port", 1)
+        state.commit()
+
+        resumed = store.session("s")
+        resumed.set("db.host", "new")
+        assert resumed.get_assembly_state("db") == {"host": "new", "port": 1}
+
+    def test_clear_assembly_is_persisted(self, store):
+        state = store.session("s")
+        state.set("db.host", "x")
+        state.set("keep", 1)
+        state.commit()
+
+        resumed = store.session("s")
+        resumed.clear_assembly("db")
+        resumed.commit()
+        assert store.session("s").get_all_state() == {"keep": 1}
+
+    def test_batch_size_forces_commit(self, tmp_path):
+        with SQLiteStateStore(tmp_path / "s.db", batch_size=2) as store:
+            state = store.session("s")
+            state.set("a", 1)
+            state.set("b", 2)
+            assert store.session("s").get_all_state() == {"a": 1, "b": 2}
+
+    def test_set_many_and_export(self, store):
+        state = store.session("s")
+        state.set_many({"db.host": "x", "name": "svc"})
+        state.commit()
+
+        resumed = store.session("s")
+        assert resumed.get_many(["db.host", "name"]) == ["x", "svc"]
+        assert dict(zip(*resumed.export())) == {"db.host": "x", "name": "svc"}
+
+    def test_full_delta_loads_every_namespace(self, store):
+        state = store.session("s")
+        state.set_many({"db.host": "x", "name": "svc"})
+        state.commit()
+
+        resumed = store.session("s")
+        delta = resumed.diff(0)
+        assert delta.full
+        assert delta.changed == {"db.host": "x", "name": "svc"}
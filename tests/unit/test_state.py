@@ -0,0 +1,418 @@
+"""Tests for PageState namespacing and the flat state view."""
+
+import pickle
+
+import pytest
+
+from questionary_extended.core.state import PageState
+
+
+class TestPageStateView:
+    """The flat view tracks every mutation without rebuilding."""
+
+    def test_view_reflects_global_and_namespaced_keys(self):
+        state = PageState()
+        view = state.view()
+        state.set("name", "web")
+        state.set("db.host", "localhost")
+
+        assert dict(view) == {"name": "web", "db.host": "localhost"}
+        assert state.get_all_state() == dict(view)
+
+    def test_view_is_read_only(self):
+        state = PageState()
+        with pytest.raises(TypeError):
+            state.view()["x"] = 1  # type: ignore[index]
+
+    def test_clear_assembly_removes_only_that_namespace(self):
+        state = PageState()
+        state.set("a.x", 1)
+        state.set("a.y", 2)
+        state.set("b.x", 3)
+        state.set("top", 4)
+
+        state.clear_assembly("a")
+        state.clear_assembly("missing")
+
+        assert dict(state.view()) == {"b.x": 3, "top": 4}
+        assert state.get_assembly_state("a") == {}
+
+    def test_clear_all_empties_view(self):
+        state = PageState()
+        view = state.view()
+        state.set("a.x", 1)
+        state.set("top", 2)
+
+        state.clear_all()
+
+        assert len(view) == 0
+        assert state.get_all_state() == {}
+
+    def test_delete_removes_key_and_notifies(self):
+        state = PageState()
+        changed = []
+        state.set("a.x", 1)
+        state.set("top", 2)
+        state.watch(changed.append)
+
+        state.delete("a.x")
+        state.delete("top")
+        state.delete("missing")
+
+        assert state.get_all_state() == {}
+        assert state.get_assembly_state("a") == {}
+        assert changed == ["a.x", "top"]
+
+    def test_get_all_state_returns_independent_copy(self):
+        state = PageState()
+        state.set("a.x", 1)
+        snapshot = state.get_all_state()
+        state.set("a.x", 2)
+
+        assert snapshot == {"a.x": 1}
+
+
+class TestPageStatePickle:
+    """PageState survives pickling (e.g. when shipped to worker processes)."""
+
+    def test_round_trip_rebuilds_view(self):
+        state = PageState()
+        state.set("a.x", 1)
+        state.set("top", 2)
+        state.watch(lambda key: None)
+
+        restored = pickle.loads(pickle.dumps(state))
+
+        assert dict(restored.view()) == {"a.x": 1, "top": 2}
+        assert restored.get_assembly_state("a") == {"x": 1}
+        assert restored._watchers == []
+
+
+class TestPageStateHistory:
+    """Snapshots, undo/redo and restore over persistent versions."""
+
+    def test_history_starts_at_first_snapshot(self):
+        state = PageState()
+        state.set("a", 1)
+        assert state.undo() is False
+
+        snap = state.snapshot()
+        state.set("a", 2)
+        assert dict(snap) == {"a": 1}
+        assert dict(state.snapshot()) == {"a": 2}
+
+    def test_undo_redo_walks_versions(self):
+        state = PageState()
+        state.snapshot()
+        state.set("db.host", "x")
+        state.set("db.host", "y")
+        state.delete("db.host")
+
+        assert state.undo() and state.get("db.host") == "y"
+        assert state.undo() and state.get("db.host") == "x"
+        assert state.undo() and not state.has_key("db.host")
+        assert state.get_assembly_state("db") == {}
+        assert state.undo() is False
+
+        assert state.redo() and state.get("db.host") == "x"
+        assert state.view() == {"db.host": "x"}
+
+    def test_new_change_discards_redo_branch(self):
+        state = PageState()
+        state.snapshot()
+        state.set("a", 1)
+        state.undo()
+        state.set("b", 2)
+        assert state.redo() is False
+        assert state.get_all_state() == {"b": 2}
+
+    def test_restore_is_undoable_and_notifies_changed_keys(self):
+        state = PageState()
+        state.set("keep", 0)
+        step = state.snapshot()
+        state.set("a.x", 1)
+        state.set("a.y", 2)
+        changed = []
+        state.watch(changed.append)
+
+        state.restore(step)
+        assert state.get_all_state() == {"keep": 0}
+        assert sorted(changed) == ["a.x", "a.y"]
+
+        assert state.undo()
+        assert state.get_all_state() == {"keep": 0, "a.x": 1, "a.y": 2}
+
+    def test_clear_all_is_one_version(self):
+        state = PageState()
+        state.set("a", 1)
+        state.set("b.c", 2)
+        state.snapshot()
+        state.clear_all()
+        assert state.undo()
+        assert state.get_all_state() == {"a": 1, "b.c": 2}
+
+    def test_snapshots_share_structure(self):
+        state = PageState()
+        for i in range(1000):
+            state.set(f"k{i}", i)
+        before = state.snapshot()
+        state.set("k0", "changed")
+        after = state.snapshot()
+        assert list(before.diff(after)) == ["k0"]
+
+    def test_history_is_not_pickled(self):
+        state = PageState()
+        state.snapshot()
+        state.set("a", 1)
+        restored = pickle.loads(pickle.dumps(state))
+        assert restored.get_all_state() == {"a": 1}
+        assert restored.undo() is False
+
+
+class TestPageStateSubscriptions:
+    """Key, namespace and wildcard subscriptions with batched delivery."""
+
+    def test_subscriptions_receive_only_their_keys(self):
+        state = PageState()
+        by_key, by_namespace, everything = [], [], []
+        state.subscribe(by_key.append, key="db.host")
+        state.subscribe(by_namespace.append, namespace="db")
+        state.subscribe(everything.append)
+
+        state.set("db.host", "x")
+        state.set("db.port", 1)
+        state.set("name", "svc")
+
+        assert by_key == [("db.host",)]
+        assert by_namespace == [("db.host",), ("db.port",)]
+        assert everything == [("db.host",), ("db.port",), ("name",)]
+
+    def test_global_namespace_is_empty_string(self):
+        state = PageState()
+        seen = []
+        state.subscribe(seen.append, namespace="")
+        state.set("db.host", "x")
+        state.set("name", "svc")
+        assert seen == [("name",)]
+
+    def test_batch_coalesces_notifications(self):
+        state = PageState()
+        calls, watched = [], []
+        state.subscribe(calls.append, namespace="form")
+        state.watch(watched.append)
+
+        with state.batch():
+            for i in range(500):
+                state.set(f"form.field{i}", i)
+            state.set("form.field0", "again")
+            with state.batch():
+                state.delete("form.field1")
+            assert calls == []
+
+        assert len(calls) == 1
+        assert len(calls[0]) == 500
+        assert watched == [f"form.field{i}" for i in range(500)]
+
+    def test_batch_delivers_on_error(self):
+        state = PageState()
+        seen = []
+        state.subscribe(seen.append)
+        with pytest.raises(KeyError):
+            with state.batch():
+                state.set("a", 1)
+                raise KeyError("boom")
+        assert seen == [("a",)]
+
+    def test_unsubscribe(self):
+        state = PageState()
+        seen = []
+        unsubscribe = state.subscribe(seen.append, key="a")
+        unsubscribe()
+        unsubscribe()
+        state.set("a", 1)
+        assert seen == []
+        assert state._listeners == 0
+
+    def test_key_and_namespace_together_is_rejected(self):
+        with pytest.raises(ValueError):
+            PageState().subscribe(print, key="a.b", namespace="a")
+
+
+class TestPageStateBulk:
+    """set_many/get_many and columnar export/import."""
+
+    def test_set_many_groups_by_assembly(self):
+        state = PageState()
+        state.set("db.user", "root")
+        state.set_many({"name": "svc", "db.host": "x", "db.port": 1, "web.port": 80})
+
+        assert state.get_assembly_state("db") == {
+            "user": "root",
+            "host": "x",
+            "port": 1,
+        }
+        assert state.get_assembly_state("web") == {"port": 80}
+        assert state.get("name") == "svc"
+        assert state.get_many(["db.host", "missing", "name"], "-") == ["x", "-", "svc"]
+
+    def test_set_many_notifies_once(self):
+        state = PageState()
+        calls = []
+        state.subscribe(calls.append)
+        state.set_many((f"f.k{i}", i) for i in range(100))
+        assert len(calls) == 1 and len(calls[0]) == 100
+
+    def test_set_many_is_one_history_version(self):
+        state = PageState()
+        state.snapshot()
+        state.set_many({"a": 1, "b.c": 2})
+        assert state.undo()
+        assert state.get_all_state() == {}
+
+    def test_export_import_round_trip(self):
+        state = PageState()
+        state.set_many({"name": "svc", "db.host": "x"})
+        columns = state.export()
+        assert columns.keys == ["name", "db.host"]
+
+        copy = PageState()
+        copy.set("stale", True)
+        copy.import_(pickle.loads(pickle.dumps(columns)), replace=True)
+        assert copy.get_all_state() == {"name": "svc", "db.host": "x"}
+        assert copy.get_assembly_state("db") == {"host": "x"}
+
+    def test_import_rejects_mismatched_columns(self):
+        with pytest.raises(ValueError):
+            PageState().import_((["a", "b"], [1]))
+
+
+class TestPageStateComputed:
+    """Lazy, memoized computed entries with key-level invalidation."""
+
+    def _order(self, calls):
+        state = PageState()
+        state.set_many({"order.qty": 2, "order.price": 5, "order.note": ""})
+
+        def total(qty, price):
+            calls.append("total")
+            return qty * price
+
+        state.add_computed("order.total", total, ["order.qty", "order.price"])
+        return state
+
+    def test_evaluated_lazily_and_memoized(self):
+        calls = []
+        state = self._order(calls)
+        assert calls == []
+        assert state.get("order.total") == 10
+        assert state.view()["order.total"] == 10
+        assert calls == ["total"]
+
+    def test_only_dependency_changes_invalidate(self):
+        calls = []
+        state = self._order(calls)
+        state.get("order.total")
+        state.set("order.note", "gift")
+        assert state.get("order.total") == 10
+        state.set("order.qty", 3)
+        assert state.get("order.total") == 15
+        assert calls == ["total", "total"]
+
+    def test_chained_entries_and_notifications(self):
+        state = self._order([])
+        state.add_computed("order.big", lambda total: total > 20, ["order.total"])
+        seen = []
+        state.subscribe(seen.append, key="order.big")
+
+        assert state.get("order.big") is False
+        state.set("order.qty", 10)
+        assert seen == [("order.big",)]
+        assert state.get("order.big") is True
+
+    def test_visible_as_ordinary_keys(self):
+        state = self._order([])
+        assert state.has_key("order.total")
+        assert "order.total" in state.view()
+        assert state.get_all_state()["order.total"] == 10
+        assert state.export().keys == ["order.qty", "order.price", "order.note"]
+
+    def test_condition_reads_computed_key(self):
+        from questionary_extended.core.conditions import compile_condition
+
+        state = self._order([])
+        condition = compile_condition("total > 12", "order")
+        assert not condition.evaluate(state.view())
+        state.set("order.qty", 3)
+        assert condition.evaluate(state.view())
+
+    def test_cycles_are_rejected(self):
+        state = PageState()
+        state.add_computed("a", lambda b: b, ["b"])
+        with pytest.raises(ValueError):
+            state.add_computed("b", lambda a: a, ["a"])
+
+    def test_remove_computed(self):
+        state = self._order([])
+        state.remove_computed("order.total")
+        assert not state.has_key("order.total")
+        assert state.view().get("order.total") is None
+        state.set("order.qty", 1)
+        assert "order.total" not in state.get_all_state()
+
+
+class TestPageStateDelta:
+    """Version-stamped diffs and their application to a mirror."""
+
+    def test_first_sync_is_full(self):
+        state = PageState()
+        state.set_many({"name": "svc", "db.host": "x"})
+        delta = state.diff(0)
+        assert delta.full
+        assert delta.changed == {"name": "svc", "db.host": "x"}
+
+        mirror = PageState()
+        mirror.set("stale", 1)
+        mirror.apply_delta(delta)
+        assert mirror.get_all_state() == state.get_all_state()
+
+    def test_diff_holds_only_changes_since_version(self):
+        state = PageState()
+        state.set_many({f"f.k{i}": i for i in range(1000)})
+        base = state.version
+
+        state.set("f.k1", "new")
+        state.set("f.added", True)
+        state.delete("f.k2")
+        delta = state.diff(base)
+
+        assert not delta.full
+        assert delta.version == state.version == base + 3
+        assert delta.changed == {"f.added": True, "f.k1": "new"}
+        assert delta.removed == ("f.k2",)
+        assert state.diff(state.version) == (state.version, {}, (), False)
+
+    def test_mirror_stays_in_sync(self):
+        state, mirror = PageState(), PageState()
+        synced = 0
+        for step in range(5):
+            state.set_many({"a": step, f"b.k{step}": step})
+            state.delete(f"b.k{step - 2}")
+            delta = state.diff(synced)
+            mirror.apply_delta(delta)
+            synced = delta.version
+            assert mirror.get_all_state() == state.get_all_state()
+
+    def test_undo_and_clear_are_stamped(self):
+        state = PageState()
+        state.snapshot()
+        state.set("a.x", 1)
+        base = state.version
+        state.undo()
+        assert state.diff(base).removed == ("a.x",)
+        state.redo()
+        state.clear_assembly("a")
+        assert state.diff(base).removed == ("a.x",)
+
+    def test_future_version_is_rejected(self):
+        with pytest.raises(ValueError):
+            PageState().diff(5)
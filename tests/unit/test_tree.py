@@ -0,0 +1,185 @@
+"""Tests for the lazy, virtualized tree behind tree_select."""
+
+import pytest
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+
+from questionary_extended.components import TreeNode
+from questionary_extended.prompts import tree_select
+from questionary_extended.tree import TreeView, tree_from_dict
+
+DOWN, UP, RIGHT, LEFT, ENTER = "\x1b[B", "\x1b[A", "\x1b[C", "\x1b[D", "\r"
+
+LANGUAGES = {
+    "Web": {"Frontend": ["React", "Vue"], "Backend": ["Django"]},
+    "Data": ["Python", "R"],
+    "README": "text",
+}
+
+
+def _names(view):
+    return [node.name for _, node, _ in view.window()]
+
+
+def _wide_tree(fanout, levels, calls=None):
+    """Tree of fanout ** levels leaves, built only as it is expanded."""
+
+    def load(node):
+        if calls is not None:
+            calls.append(node.name)
+        depth = node.metadata["depth"] + 1
+        for i in range(fanout):
+            child = TreeNode(name=f"{node.name}.{i}", metadata={"depth": depth})
+            if depth < levels:
+                child.loader = load
+            yield child
+
+    return TreeNode(name="n", metadata={"depth": 0}, loader=load)
+
+
+class TestTreeNode:
+    def test_loader_runs_once_on_first_access(self):
+        calls = []
+        node = TreeNode(name="dir", loader=lambda n: calls.append(n) or [TreeNode("a")])
+        assert not node.is_leaf()
+        assert [c.name for c in node.load_children()] == ["a"]
+        assert [c.name for c in node.load_children()] == ["a"]
+        assert calls == [node]
+
+    def test_from_dict_handles_deep_nesting(self):
+        data = leaf = {}
+        for _ in range(5000):
+            leaf["d"] = {}
+            leaf = leaf["d"]
+        node = TreeNode.from_dict(data)
+        depth = 0
+        while node.children:
+            node = node.children[0]
+            depth += 1
+        assert depth == 5000
+
+
+class TestTreeView:
+    def test_opening_loads_and_renders_only_the_top(self):
+        calls = []
+        view = TreeView(_wide_tree(1000, 2, calls), height=5)
+        assert _names(view) == ["n.0", "n.1", "n.2", "n.3", "n.4"]
+        assert calls == ["n"]
+        assert len(view) == 5
+
+    def test_expand_and_collapse(self):
+        calls = []
+        view = TreeView(_wide_tree(3, 3, calls), height=4)
+        view.right()
+        assert _names(view) == ["n.0", "n.0.0", "n.0.1", "n.0.2"]
+        assert calls == ["n", "n.0"]
+        view.right()
+        assert view.selected.name == "n.0.0"
+        view.left()
+        view.left()
+        assert view.selected.name == "n.0"
+        assert _names(view) == ["n.0", "n.1", "n.2"]
+        assert not view.selected.expanded
+
+    def test_expansion_state_survives_collapsing_a_parent(self):
+        view = TreeView(_wide_tree(2, 3), height=10)
+        view.expand(0)
+        view.expand(1)
+        assert _names(view)[:4] == ["n.0", "n.0.0", "n.0.0.0", "n.0.0.1"]
+        view.collapse(0)
+        view.expand(0)
+        assert _names(view)[:4] == ["n.0", "n.0.0", "n.0.0.0", "n.0.0.1"]
+        assert view.depth(2) == 2
+        assert view.parent_row(2) == 1
+
+    def test_scrolling_keeps_the_cursor_on_screen(self):
+        view = TreeView(_wide_tree(50, 1), height=3)
+        view.move(10)
+        assert (view.cursor, view.top) == (10, 8)
+        view.move(-9)
+        assert (view.cursor, view.top) == (1, 1)
+        view.move(-5)
+        assert view.cursor == 0
+        view.move_to_end()
+        assert view.cursor == 49
+        assert view.complete
+
+    def test_deep_trees_do_not_recurse(self):
+        root = TreeNode("root")
+        node = root
+        for i in range(5000):
+            child = TreeNode(f"d{i}", expanded=True)
+            node.add_child(child)
+            node = child
+        node.add_child(TreeNode("leaf"))
+        view = TreeView(root)
+        view.move_to_end()
+        assert view.selected.name == "leaf"
+        assert view.depth(view.cursor) == 5000
+        view.collapse(0)
+        assert len(view) == 1
+
+    def test_render_marks_the_cursor(self):
+        view = TreeView(tree_from_dict(LANGUAGES), show_icons=False)
+        text = "".join(fragment for _, fragment in view.render())
+        assert text.splitlines() == ["» ▸ Web", "  ▸ Data", "    README"]
+
+    def test_empty_tree(self):
+        view = TreeView(TreeNode("root"))
+        view.move(1)
+        view.right()
+        view.left()
+        assert view.selected is None
+        assert view.render() == []
+
+    def test_rejects_zero_height(self):
+        with pytest.raises(ValueError):
+            TreeView(TreeNode("root"), height=0)
+
+
+class TestTreeFromDict:
+    def test_values_are_paths(self):
+        root = tree_from_dict(LANGUAGES, expanded=True)
+        view = TreeView(root, height=20)
+        view.move_to_end()
+        values = [node.value for _, node, _ in view.window()]
+        assert values == [
+            "Web/",
+            "Web/Frontend/",
+            "Web/Frontend/React",
+            "Web/Frontend/Vue",
+            "Web/Backend/",
+            "Web/Backend/Django",
+            "Data/",
+            "Data/Python",
+            "Data/R",
+            "README",
+        ]
+
+    def test_nested_dicts_are_built_on_expansion(self):
+        root = tree_from_dict(LANGUAGES)
+        web = root.children[0]
+        assert web.children == [] and web.loader is not None
+
+
+class TestTreeSelect:
+    def _ask(self, keys, choices=LANGUAGES, **kwargs):
+        with create_pipe_input() as pipe:
+            pipe.send_text(keys)
+            return tree_select(
+                "Pick:", choices, input=pipe, output=DummyOutput(), **kwargs
+            ).ask()
+
+    def test_navigate_and_answer_a_leaf(self):
+        assert (
+            self._ask(RIGHT + RIGHT + RIGHT + DOWN + DOWN + ENTER) == "Web/Frontend/Vue"
+        )
+
+    def test_enter_on_a_branch_toggles_it(self):
+        assert self._ask(DOWN + ENTER + DOWN + DOWN + ENTER) == "Data/R"
+
+    def test_tree_node_choices_answer_values(self):
+        root = TreeNode(
+            "root", children=[TreeNode("First", value=1), TreeNode("Second", value=2)]
+        )
+        assert self._ask(DOWN + ENTER, choices=root) == 2